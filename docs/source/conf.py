@@ -4,11 +4,30 @@
 
 # -- Path setup --------------------------------------------------------------
 
+import os
 from pathlib import Path
 import sys
 
 sys.path.insert(0, str(Path("../..").resolve()))
 
+
+def _env_flag(name: str, default: bool = True) -> bool:
+    """Read a boolean build switch from the environment."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() not in {"0", "false", "no", "off", ""}
+
+
+# Build switches: every docs build shares this single config, with the theme
+# and optional third-party extensions selected through the environment.
+#   THOTH_SPHINX_THEME   HTML theme (default: shibuya)
+#   THOTH_DOCS_MERMAID   enable sphinxcontrib.mermaid (default: on)
+#   THOTH_DOCS_REDOC     enable sphinxcontrib.redoc (default: on)
+docs_theme = os.environ.get("THOTH_SPHINX_THEME", "shibuya")
+enable_mermaid = _env_flag("THOTH_DOCS_MERMAID")
+enable_redoc = _env_flag("THOTH_DOCS_REDOC")
+
 # -- Project information -----------------------------------------------------
 
 project = "Thoth"
@@ -30,9 +49,11 @@ extensions = [
     "sphinx.ext.coverage",  # Check documentation coverage
     # Markdown support
     "myst_parser",  # Parse Markdown files
-    "sphinxcontrib.mermaid",  # Mermaid diagram support
-    "sphinxcontrib.redoc",  # OpenAPI/Swagger rendering
 ]
+if enable_mermaid:
+    extensions.append("sphinxcontrib.mermaid")  # Mermaid diagram support
+if enable_redoc:
+    extensions.append("sphinxcontrib.redoc")  # OpenAPI/Swagger rendering
 
 # ReDoc settings for OpenAPI rendering
 redoc = [
@@ -48,12 +69,11 @@ redoc = [
     },
 ]
 
-# AutoDoc settings
+# AutoDoc settings. Only documented members are pulled in; __init__ docstrings
+# are merged into the class docs by napoleon_include_init_with_doc.
 autodoc_default_options = {
     "members": True,
     "member-order": "bysource",
-    "special-members": "__init__",
-    "undoc-members": True,
     "exclude-members": "__weakref__",
     "show-inheritance": True,
 }
@@ -82,17 +102,29 @@ myst_enable_extensions = [
     "substitution",  # Variable substitutions
     "tasklist",  # Task lists with checkboxes
 ]
-myst_fence_as_directive = ["mermaid"]  # Render ```mermaid blocks as directives
+if enable_mermaid:
+    myst_fence_as_directive = ["mermaid"]  # Render ```mermaid blocks as directives
 myst_heading_anchors = 3  # Auto-generate anchors for headings up to level 3
 
 # AutoSummary settings
 autosummary_generate = True  # Turn on autosummary
-autosummary_imported_members = True
+autosummary_imported_members = False  # Document symbols where they are defined
+
+# Intersphinx mapping (link to other projects' docs). A local copy of each
+# inventory (refresh with `hatch run docs:update-inventories`) is tried before
+# the network, and fetched inventories are reused for intersphinx_cache_limit days.
+intersphinx_dir = Path(__file__).parent / "_intersphinx"
+
+
+def _inventory(name: str) -> tuple[str | None, ...]:
+    local = intersphinx_dir / f"{name}.inv"
+    return (str(local), None) if local.is_file() else (None,)
+
 
-# Intersphinx mapping (link to other projects' docs)
 intersphinx_mapping = {
-    "python": ("https://docs.python.org/3", None),
+    "python": ("https://docs.python.org/3", _inventory("python")),
 }
+intersphinx_cache_limit = 30
 
 # Todo extension settings
 todo_include_todos = True
@@ -108,24 +140,26 @@ source_suffix = {
 
 # -- Options for HTML output -------------------------------------------------
 
-html_theme = "shibuya"
+html_theme = docs_theme
 html_static_path = ["_static"]
 
 # Shibuya theme options
-html_theme_options = {
-    # GitHub integration
-    "github_url": "https://github.com/TheWinterShadow/Thoth",
-    # Accent color https://github.com/lepture/shibuya/blob/main/docs/customisation/colors.rst
-    "accent_color": "indigo",
-    # Light/dark mode
-    "dark_code": True,
-    # Navigation
-    "nav_links": [
-        {"title": "Getting Started", "url": "getting_started"},
-        {"title": "Architecture", "url": "architecture/index"},
-        {"title": "API", "url": "api/index"},
-    ],
-}
+html_theme_options: dict[str, object] = {}
+if html_theme == "shibuya":
+    html_theme_options = {
+        # GitHub integration
+        "github_url": "https://github.com/TheWinterShadow/Thoth",
+        # Accent color https://github.com/lepture/shibuya/blob/main/docs/customisation/colors.rst
+        "accent_color": "indigo",
+        # Light/dark mode
+        "dark_code": True,
+        # Navigation
+        "nav_links": [
+            {"title": "Getting Started", "url": "getting_started"},
+            {"title": "Architecture", "url": "architecture/index"},
+            {"title": "API", "url": "api/index"},
+        ],
+    }
 
 # Page context for source links
 html_context = {
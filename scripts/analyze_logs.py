@@ -9,19 +9,74 @@ Usage:
     python scripts/analyze_logs.py --minutes 10
     python scripts/analyze_logs.py --minutes 30 --severity ERROR
     python scripts/analyze_logs.py --job-id <uuid>
+    python scripts/analyze_logs.py --minutes 10 --include-info
+    python scripts/analyze_logs.py --minutes 10 --since-cursor ~/.cache/thoth-analyze-logs.pkl
 """
 
 import argparse
-from collections import Counter, defaultdict
-from dataclasses import dataclass, field
-from datetime import UTC, datetime
+from collections import defaultdict, deque
+from collections.abc import Iterable, Iterator
+from dataclasses import astuple, dataclass, field
+from datetime import UTC, datetime, timedelta
+import heapq
+import io
+from itertools import islice
 import json
+import os
+from pathlib import Path
 import re
-import subprocess
 import sys
-
-
-@dataclass
+from typing import IO, TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+# Only the fields parse_log_entry reads; keeps gcloud from serializing large
+# unused payloads such as protoPayload. insertId identifies entries across runs.
+GCLOUD_LOG_FIELDS = "insertId,timestamp,severity,jsonPayload,textPayload,httpRequest,trace"
+STREAM_READ_SIZE = 64 * 1024
+
+# --since-cursor re-reads this much before the cursor, so entries Cloud Logging
+# ingests late (timestamped before the previous run's newest entry) are still seen
+LATE_LOG_GRACE = timedelta(minutes=2)
+
+# Fetches at least this large are parsed in a process pool, in batches
+PARALLEL_PARSE_MIN_LIMIT = 2000
+PARSE_BATCH_SIZE = 500
+
+# Only this many application errors / timeline events are ever reported, so
+# analysis keeps no more than that in memory.
+APPLICATION_ERROR_LIMIT = 20
+TIMELINE_LIMIT = 20
+
+CATEGORIZED_SEVERITIES = frozenset({"ERROR", "CRITICAL", "WARNING"})
+# Nothing below this severity is ever categorized, so it is filtered server-side
+DEFAULT_MIN_SEVERITY = "WARNING"
+TIMELINE_SEVERITIES = frozenset({"ERROR", "CRITICAL"})
+
+# Percentage bars for the severity breakdown (one "#" per 2%, capped at 30)
+SEVERITY_BARS = tuple("#" * n for n in range(31))
+
+LATENCY_RE = re.compile(r"([\d.]+)s")
+
+# Known error signatures, matched in one scan; group names are the categories
+ERROR_CATEGORY_RE = re.compile(
+    "|".join(
+        f"(?P<{category}>{pattern})"
+        for category, pattern in (
+            ("liveness_probe_failure", re.escape("LIVENESS HTTP probe failed")),
+            ("connection_error", re.escape("connection to the instance had an error")),
+            ("firestore_missing_index", re.escape("The query requires an index")),
+            ("lancedb_table_exists", r"Table.*?already exists|already exists.*?Table"),
+            ("batch_processing_failed", re.escape("Failed to process batch")),
+            ("job_status_failed", re.escape("Failed to get job status")),
+        )
+    ),
+    re.DOTALL,
+)
+
+
+@dataclass(slots=True)
 class LogEntry:
     """Parsed log entry."""
 
@@ -34,17 +89,19 @@ class LogEntry:
     http_latency: float | None = None
     trace_id: str | None = None
     job_id: str | None = None
+    insert_id: str | None = None
+    raw_timestamp: str = ""  # As returned by gcloud, with full nanosecond precision
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Log analysis results."""
 
     total_entries: int = 0
-    severity_counts: Counter = field(default_factory=Counter)
-    error_categories: Counter = field(default_factory=Counter)
-    http_status_counts: Counter = field(default_factory=Counter)
-    failed_endpoints: Counter = field(default_factory=Counter)
+    severity_counts: defaultdict[str, int] = field(default_factory=lambda: defaultdict(int))
+    error_categories: defaultdict[str, int] = field(default_factory=lambda: defaultdict(int))
+    http_status_counts: defaultdict[int, int] = field(default_factory=lambda: defaultdict(int))
+    failed_endpoints: defaultdict[str, int] = field(default_factory=lambda: defaultdict(int))
     liveness_failures: int = 0
     connection_errors: int = 0
     firestore_errors: int = 0
@@ -53,6 +110,63 @@ class AnalysisResult:
     timeline: list = field(default_factory=list)
 
 
+def iter_json_array(stream: IO[str]) -> Iterator[dict]:
+    """Incrementally decode the items of a top-level JSON array.
+
+    Reads the stream in fixed-size chunks and yields each element as soon as
+    it is complete, so peak memory is bounded by a single record rather than
+    the whole document.
+    """
+    decoder = json.JSONDecoder()
+    buf = ""
+    pos = 0
+    started = False
+    eof = False
+
+    while True:
+        # Skip whitespace and array punctuation between items
+        while pos < len(buf) and buf[pos] in " \t\r\n,":
+            pos += 1
+        if not started and pos < len(buf):
+            if buf[pos] != "[":
+                msg = "Expected '['"
+                raise json.JSONDecodeError(msg, buf, pos)
+            started = True
+            pos += 1
+            continue
+        if started and pos < len(buf) and buf[pos] == "]":
+            return
+        if pos < len(buf):
+            try:
+                item, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                yield item
+                pos = end
+                continue
+        if eof:
+            if started:
+                msg = "Unterminated array"
+                raise json.JSONDecodeError(msg, buf, pos)
+            return
+        chunk = stream.read(STREAM_READ_SIZE)
+        if not chunk:
+            eof = True
+        buf = buf[pos:] + chunk
+        pos = 0
+
+
+def dumps_json(obj: Any) -> str:
+    """Serialize the analysis output, preferring orjson when it is installed."""
+    try:
+        import orjson  # noqa: PLC0415 - optional, only needed for --json
+    except ImportError:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+
 def run_gcloud_logging(
     project: str,
     service: str,
@@ -60,10 +174,20 @@ def run_gcloud_logging(
     severity: str | None = None,
     job_id: str | None = None,
     limit: int = 500,
-) -> list[dict]:
-    """Fetch logs using gcloud CLI."""
-    # Build filter
-    filters = [
+    since: str | None = None,
+) -> Iterator[dict]:
+    """Fetch logs using gcloud CLI, yielding raw entries as they stream in."""
+    # Deferred so --help and argument errors don't pay for them
+    import subprocess  # noqa: PLC0415
+    import tempfile  # noqa: PLC0415
+
+    # Build filter, most selective clause first
+    filters = []
+
+    if job_id:
+        filters.append(f'jsonPayload.job_id="{job_id}"')
+
+    filters += [
         'resource.type="cloud_run_revision"',
         f'resource.labels.service_name="{service}"',
     ]
@@ -71,8 +195,8 @@ def run_gcloud_logging(
     if severity:
         filters.append(f"severity>={severity}")
 
-    if job_id:
-        filters.append(f'jsonPayload.job_id="{job_id}"')
+    if since:
+        filters.append(f'timestamp>="{since}"')
 
     filter_str = " AND ".join(filters)
 
@@ -84,27 +208,86 @@ def run_gcloud_logging(
         f"--project={project}",
         f"--limit={limit}",
         f"--freshness={minutes}m",
-        "--format=json",
+        f"--format=json({GCLOUD_LOG_FIELDS})",
     ]
 
+    with (
+        tempfile.TemporaryFile(mode="w+") as stderr,
+        subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr, text=True) as proc,
+    ):
+        assert proc.stdout is not None
+        try:
+            yield from iter_json_array(proc.stdout)
+        except json.JSONDecodeError as e:
+            proc.kill()
+            print(f"Error parsing JSON: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        if proc.wait() != 0:
+            stderr.seek(0)
+            print(f"Error running gcloud: {stderr.read()}", file=sys.stderr)
+            sys.exit(1)
+
+
+def load_cursor_cache(path: Path, key: str) -> tuple[str | None, list[LogEntry]]:
+    """Load the fetch cursor and previously parsed entries for a query key.
+
+    Returns (None, []) when the cache file is missing or unreadable, or when
+    its entries no longer match the LogEntry fields.
+    """
+    cursor, rows = _read_cursor_cache(path).get(key, (None, []))
+    try:
+        return cursor, [LogEntry(*row) for row in rows]
+    except TypeError:
+        return None, []
+
+
+def save_cursor_cache(path: Path, key: str, cursor: str | None, entries: list[LogEntry]) -> None:
+    """Persist the fetch cursor and parsed entries for a query key.
+
+    Entries are stored as plain field tuples rather than pickled LogEntry
+    objects, so the cache does not depend on how this script was imported.
+    """
+    import pickle  # noqa: PLC0415
+
+    cache = _read_cursor_cache(path)
+    cache[key] = (cursor, [astuple(entry) for entry in entries])
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(pickle.dumps(cache))
+    tmp_path.replace(path)
+
+
+def _read_cursor_cache(path: Path) -> dict[str, tuple[str | None, list[tuple[Any, ...]]]]:
+    import pickle  # noqa: PLC0415
+
     try:
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        return json.loads(result.stdout) if result.stdout.strip() else []
-    except subprocess.CalledProcessError as e:
-        print(f"Error running gcloud: {e.stderr}", file=sys.stderr)
-        sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(f"Error parsing JSON: {e}", file=sys.stderr)
-        sys.exit(1)
+        return pickle.loads(path.read_bytes())  # nosec B301 - local cache written by this script
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        # AttributeError/ImportError: an older cache pickled classes this process cannot resolve
+        return {}
+
+
+def entry_key(entry: LogEntry) -> tuple:
+    """Identify a log entry across fetches, by insertId when gcloud returned one."""
+    if entry.insert_id:
+        return (entry.insert_id,)
+    return (entry.timestamp, entry.trace_id, entry.message)
+
+
+def merge_entries(cached: list[LogEntry], fetched: list[LogEntry]) -> list[LogEntry]:
+    """Combine cached and freshly fetched entries, dropping re-fetched duplicates."""
+    return list({entry_key(entry): entry for entry in cached + fetched}.values())
 
 
 def parse_log_entry(raw: dict) -> LogEntry:
     """Parse a raw log entry into a LogEntry object."""
     timestamp_str = raw.get("timestamp", "")
     try:
-        # Parse ISO format timestamp
-        timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-    except (ValueError, AttributeError):
+        # Parse ISO format timestamp (Python 3.11+ accepts the "Z" suffix)
+        timestamp = datetime.fromisoformat(timestamp_str)
+    except (ValueError, TypeError):
         timestamp = datetime.now(UTC)
 
     severity = raw.get("severity", "DEFAULT")
@@ -120,15 +303,15 @@ def parse_log_entry(raw: dict) -> LogEntry:
     http_path = http_request.get("requestUrl", "")
     if http_path:
         # Extract just the path
-        match = re.search(r"run\.app(/[^?]*)", http_path)
-        if match:
-            http_path = match.group(1)
+        _, sep, rest = http_path.partition("run.app")
+        if sep and rest.startswith("/"):
+            http_path = rest.split("?", 1)[0]
 
-    # Parse latency
+    # Parse latency (always formatted as "<seconds>s")
     latency_str = http_request.get("latency", "")
     http_latency = None
     if latency_str:
-        match = re.match(r"([\d.]+)s", latency_str)
+        match = LATENCY_RE.match(latency_str)
         if match:
             http_latency = float(match.group(1))
 
@@ -149,25 +332,47 @@ def parse_log_entry(raw: dict) -> LogEntry:
         http_latency=http_latency,
         trace_id=trace_id,
         job_id=job_id,
+        insert_id=raw.get("insertId"),
+        raw_timestamp=timestamp_str if isinstance(timestamp_str, str) else "",
     )
 
 
+def parse_log_batch(raws: list[dict]) -> list[LogEntry]:
+    """Parse a batch of raw log entries (process pool work unit)."""
+    return [parse_log_entry(raw) for raw in raws]
+
+
+def parse_log_entries_parallel(raw_logs: Iterable[dict], max_workers: int | None = None) -> Iterator[LogEntry]:
+    """Parse raw log entries across worker processes, preserving input order.
+
+    Only a bounded number of batches is in flight at once so the input stream
+    is not drained into memory ahead of the analyzer.
+    """
+    from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+    max_workers = max_workers or os.cpu_count() or 1
+    raw_iter = iter(raw_logs)
+    pending: deque[Future[list[LogEntry]]] = deque()
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        while True:
+            while len(pending) < max_workers * 2:
+                batch = list(islice(raw_iter, PARSE_BATCH_SIZE))
+                if not batch:
+                    break
+                pending.append(pool.submit(parse_log_batch, batch))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+
 def categorize_error(entry: LogEntry) -> str | None:
     """Categorize an error log entry."""
     text = entry.text_payload or entry.message
 
-    if "LIVENESS HTTP probe failed" in text:
-        return "liveness_probe_failure"
-    if "connection to the instance had an error" in text:
-        return "connection_error"
-    if "The query requires an index" in text:
-        return "firestore_missing_index"
-    if "Table" in text and "already exists" in text:
-        return "lancedb_table_exists"
-    if "Failed to process batch" in text:
-        return "batch_processing_failed"
-    if "Failed to get job status" in text:
-        return "job_status_failed"
+    match = ERROR_CATEGORY_RE.search(text)
+    if match:
+        return match.lastgroup
     if entry.http_status and entry.http_status >= 500:
         return f"http_{entry.http_status}"
     if entry.severity in ("ERROR", "CRITICAL"):
@@ -176,26 +381,41 @@ def categorize_error(entry: LogEntry) -> str | None:
     return None
 
 
-def analyze_logs(entries: list[LogEntry]) -> AnalysisResult:
-    """Analyze parsed log entries."""
+def analyze_logs(entries: Iterable[LogEntry]) -> AnalysisResult:
+    """Analyze parsed log entries in a single pass."""
     result = AnalysisResult()
-    result.total_entries = len(entries)
+    # Min-heap of the most recent significant events; entries do not arrive in
+    # timestamp order (gcloud returns newest first)
+    timeline_heap: list[tuple[str, int, dict]] = []
+
+    severity_counts = result.severity_counts
+    http_status_counts = result.http_status_counts
+    failed_endpoints = result.failed_endpoints
+    error_categories = result.error_categories
+    application_errors = result.application_errors
+    job_errors = result.job_errors
 
     for entry in entries:
+        result.total_entries += 1
+        severity = entry.severity
+        http_status = entry.http_status
+        text = entry.message or entry.text_payload
+        timestamp = None
+
         # Count by severity
-        result.severity_counts[entry.severity] += 1
+        severity_counts[severity] += 1
 
         # Count HTTP status codes
-        if entry.http_status:
-            result.http_status_counts[entry.http_status] += 1
-            if entry.http_status >= 400 and entry.http_path:
-                result.failed_endpoints[entry.http_path] += 1
+        if http_status:
+            http_status_counts[http_status] += 1
+            if http_status >= 400 and entry.http_path:
+                failed_endpoints[entry.http_path] += 1
 
         # Categorize errors
-        if entry.severity in ("ERROR", "CRITICAL", "WARNING"):
+        if severity in CATEGORIZED_SEVERITIES:
             category = categorize_error(entry)
             if category:
-                result.error_categories[category] += 1
+                error_categories[category] += 1
 
                 if category == "liveness_probe_failure":
                     result.liveness_failures += 1
@@ -204,162 +424,179 @@ def analyze_logs(entries: list[LogEntry]) -> AnalysisResult:
                 elif category == "firestore_missing_index":
                     result.firestore_errors += 1
 
-                # Track application errors with details
-                if category == "application_error":
-                    result.application_errors.append(
+                # Track the first application errors with details
+                if category == "application_error" and len(application_errors) < APPLICATION_ERROR_LIMIT:
+                    timestamp = entry.timestamp.isoformat()
+                    application_errors.append(
                         {
-                            "timestamp": entry.timestamp.isoformat(),
-                            "message": entry.message or entry.text_payload,
+                            "timestamp": timestamp,
+                            "message": text,
                             "job_id": entry.job_id,
                         }
                     )
 
                 # Group errors by job_id
                 if entry.job_id:
-                    result.job_errors[entry.job_id].append(
+                    timestamp = timestamp or entry.timestamp.isoformat()
+                    job_errors[entry.job_id].append(
                         {
-                            "timestamp": entry.timestamp.isoformat(),
+                            "timestamp": timestamp,
                             "category": category,
                             "message": entry.message or entry.text_payload[:100],
                         }
                     )
 
         # Build timeline of significant events
-        if entry.severity in ("ERROR", "CRITICAL"):
-            result.timeline.append(
-                {
-                    "timestamp": entry.timestamp.isoformat(),
-                    "severity": entry.severity,
-                    "summary": (entry.message or entry.text_payload)[:80],
-                }
-            )
+        if severity in TIMELINE_SEVERITIES:
+            timestamp = timestamp or entry.timestamp.isoformat()
+            event = {
+                "timestamp": timestamp,
+                "severity": severity,
+                "summary": text[:80],
+            }
+            item = (timestamp, result.total_entries, event)
+            if len(timeline_heap) < TIMELINE_LIMIT:
+                heapq.heappush(timeline_heap, item)
+            else:
+                heapq.heappushpop(timeline_heap, item)
 
     # Sort timeline by timestamp
-    result.timeline.sort(key=lambda x: x["timestamp"])
+    result.timeline = [event for _, _, event in sorted(timeline_heap)]
 
     return result
 
 
+def most_common(counts: dict, n: int | None = None) -> list[tuple]:
+    """Return (key, count) pairs ordered from most to least common."""
+    ordered = sorted(counts.items(), key=lambda kv: kv[1], reverse=True)
+    return ordered if n is None else ordered[:n]
+
+
 def print_report(result: AnalysisResult, verbose: bool = False) -> None:
     """Print analysis report."""
-    print("=" * 70)
-    print("THOTH INGESTION WORKER - LOG ANALYSIS REPORT")
-    print("=" * 70)
-    print()
+    # Build the whole report in memory and write it to stdout once
+    out = io.StringIO()
+
+    print("=" * 70, file=out)
+    print("THOTH INGESTION WORKER - LOG ANALYSIS REPORT", file=out)
+    print("=" * 70, file=out)
+    print(file=out)
 
     # Summary
-    print(f"Total log entries analyzed: {result.total_entries}")
-    print()
+    print(f"Total log entries analyzed: {result.total_entries}", file=out)
+    print(file=out)
 
     # Severity breakdown
-    print("SEVERITY BREAKDOWN:")
-    print("-" * 40)
-    for severity, count in result.severity_counts.most_common():
+    print("SEVERITY BREAKDOWN:", file=out)
+    print("-" * 40, file=out)
+    for severity, count in most_common(result.severity_counts):
         pct = (count / result.total_entries * 100) if result.total_entries else 0
-        bar = "#" * min(int(pct / 2), 30)
-        print(f"  {severity:12} {count:5}  ({pct:5.1f}%)  {bar}")
-    print()
+        bar = SEVERITY_BARS[min(int(pct / 2), 30)]
+        print(f"  {severity:12} {count:5}  ({pct:5.1f}%)  {bar}", file=out)
+    print(file=out)
 
     # Error categories
     if result.error_categories:
-        print("ERROR CATEGORIES:")
-        print("-" * 40)
-        for category, count in result.error_categories.most_common():
-            print(f"  {category:30} {count:5}")
-        print()
+        print("ERROR CATEGORIES:", file=out)
+        print("-" * 40, file=out)
+        for category, count in most_common(result.error_categories):
+            print(f"  {category:30} {count:5}", file=out)
+        print(file=out)
 
     # Key metrics
-    print("KEY ISSUES DETECTED:")
-    print("-" * 40)
+    print("KEY ISSUES DETECTED:", file=out)
+    print("-" * 40, file=out)
 
     issues_found = False
 
     if result.liveness_failures > 0:
         issues_found = True
-        print(f"  [CRITICAL] Liveness probe failures: {result.liveness_failures}")
-        print("             -> Instances being killed due to unresponsive health checks")
-        print("             -> Consider: increase timeout, disable CPU throttling")
-        print()
+        print(f"  [CRITICAL] Liveness probe failures: {result.liveness_failures}", file=out)
+        print("             -> Instances being killed due to unresponsive health checks", file=out)
+        print("             -> Consider: increase timeout, disable CPU throttling", file=out)
+        print(file=out)
 
     if result.connection_errors > 0:
         issues_found = True
-        print(f"  [ERROR] Connection errors: {result.connection_errors}")
-        print("          -> Requests failing due to instance termination")
-        print()
+        print(f"  [ERROR] Connection errors: {result.connection_errors}", file=out)
+        print("          -> Requests failing due to instance termination", file=out)
+        print(file=out)
 
     if result.firestore_errors > 0:
         issues_found = True
-        print(f"  [ERROR] Firestore index errors: {result.firestore_errors}")
-        print("          -> Missing composite index for query")
-        print("          -> Run: terraform apply (firestore.tf updated)")
-        print()
+        print(f"  [ERROR] Firestore index errors: {result.firestore_errors}", file=out)
+        print("          -> Missing composite index for query", file=out)
+        print("          -> Run: terraform apply (firestore.tf updated)", file=out)
+        print(file=out)
 
     if result.http_status_counts.get(503, 0) > 0:
         issues_found = True
-        print(f"  [ERROR] HTTP 503 errors: {result.http_status_counts[503]}")
-        print("          -> Service unavailable, likely from instance crashes")
-        print()
+        print(f"  [ERROR] HTTP 503 errors: {result.http_status_counts[503]}", file=out)
+        print("          -> Service unavailable, likely from instance crashes", file=out)
+        print(file=out)
 
     if not issues_found:
-        print("  No critical issues detected.")
-    print()
+        print("  No critical issues detected.", file=out)
+    print(file=out)
 
     # Failed endpoints
     if result.failed_endpoints:
-        print("FAILED ENDPOINTS:")
-        print("-" * 40)
-        for endpoint, count in result.failed_endpoints.most_common(10):
-            print(f"  {endpoint:40} {count:5} failures")
-        print()
+        print("FAILED ENDPOINTS:", file=out)
+        print("-" * 40, file=out)
+        for endpoint, count in most_common(result.failed_endpoints, 10):
+            print(f"  {endpoint:40} {count:5} failures", file=out)
+        print(file=out)
 
     # HTTP status codes
     if result.http_status_counts:
-        print("HTTP STATUS CODES:")
-        print("-" * 40)
+        print("HTTP STATUS CODES:", file=out)
+        print("-" * 40, file=out)
         for status, count in sorted(result.http_status_counts.items()):
             status_type = "OK" if status < 400 else "ERROR"
-            print(f"  {status} ({status_type}): {count}")
-        print()
+            print(f"  {status} ({status_type}): {count}", file=out)
+        print(file=out)
 
     # Job-specific errors
     if result.job_errors and verbose:
-        print("ERRORS BY JOB ID:")
-        print("-" * 40)
+        print("ERRORS BY JOB ID:", file=out)
+        print("-" * 40, file=out)
         for job_id, errors in list(result.job_errors.items())[:5]:
-            print(f"  Job: {job_id}")
+            print(f"  Job: {job_id}", file=out)
             for err in errors[:3]:
-                print(f"    - [{err['category']}] {err['message'][:60]}...")
+                print(f"    - [{err['category']}] {err['message'][:60]}...", file=out)
             if len(errors) > 3:
-                print(f"    ... and {len(errors) - 3} more errors")
-            print()
+                print(f"    ... and {len(errors) - 3} more errors", file=out)
+            print(file=out)
 
     # Recent error timeline
     if result.timeline and verbose:
-        print("ERROR TIMELINE (last 10):")
-        print("-" * 40)
+        print("ERROR TIMELINE (last 10):", file=out)
+        print("-" * 40, file=out)
         for event in result.timeline[-10:]:
             ts = event["timestamp"].split("T")[1][:8]
-            print(f"  {ts} [{event['severity']}] {event['summary']}")
-        print()
+            print(f"  {ts} [{event['severity']}] {event['summary']}", file=out)
+        print(file=out)
 
     # Recommendations
-    print("RECOMMENDATIONS:")
-    print("-" * 40)
+    print("RECOMMENDATIONS:", file=out)
+    print("-" * 40, file=out)
     if result.liveness_failures > 0 or result.connection_errors > 0:
-        print("  1. Apply Terraform changes to fix probe timeouts:")
-        print("     cd terraform && terraform apply")
-        print()
-        print("  2. Changes include:")
-        print("     - Disable CPU throttling (cpu_idle = false)")
-        print("     - Increase liveness timeout (3s -> 10s)")
-        print("     - Increase memory (2GB -> 4GB)")
-        print("     - Increase CPU (1 -> 2 cores)")
+        print("  1. Apply Terraform changes to fix probe timeouts:", file=out)
+        print("     cd terraform && terraform apply", file=out)
+        print(file=out)
+        print("  2. Changes include:", file=out)
+        print("     - Disable CPU throttling (cpu_idle = false)", file=out)
+        print("     - Increase liveness timeout (3s -> 10s)", file=out)
+        print("     - Increase memory (2GB -> 4GB)", file=out)
+        print("     - Increase CPU (1 -> 2 cores)", file=out)
     elif result.firestore_errors > 0:
-        print("  1. Create the missing Firestore index:")
-        print("     cd terraform && terraform apply")
+        print("  1. Create the missing Firestore index:", file=out)
+        print("     cd terraform && terraform apply", file=out)
     else:
-        print("  No immediate action required.")
-    print()
+        print("  No immediate action required.", file=out)
+    print(file=out)
+
+    sys.stdout.write(out.getvalue())
 
 
 def main():
@@ -368,7 +605,8 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
-  %(prog)s --minutes 10                    # Last 10 minutes, all severities
+  %(prog)s --minutes 10                    # Last 10 minutes, WARNING and above
+  %(prog)s --minutes 10 --include-info     # Last 10 minutes, all severities
   %(prog)s --minutes 30 --severity ERROR   # Last 30 minutes, errors only
   %(prog)s --job-id <uuid>                 # Logs for specific job
   %(prog)s --minutes 60 --verbose          # Detailed output
@@ -393,7 +631,12 @@ Examples:
     parser.add_argument(
         "--severity",
         choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-        help="Minimum severity level to fetch",
+        help=f"Minimum severity level to fetch (default: {DEFAULT_MIN_SEVERITY})",
+    )
+    parser.add_argument(
+        "--include-info",
+        action="store_true",
+        help="Fetch all severities; by default only entries that can be categorized are fetched",
     )
     parser.add_argument(
         "--job-id",
@@ -416,32 +659,72 @@ Examples:
         action="store_true",
         help="Output raw analysis as JSON",
     )
+    parser.add_argument(
+        "--since-cursor",
+        metavar="PATH",
+        help="Cache parsed entries in PATH and only fetch logs newer than the last run "
+        f"(re-reading the {int(LATE_LOG_GRACE.total_seconds() // 60)} minutes before it for late arrivals)",
+    )
 
     args = parser.parse_args()
 
     print(f"Fetching logs from last {args.minutes} minutes...", file=sys.stderr)
 
-    # Fetch logs
+    severity = args.severity or (None if args.include_info else DEFAULT_MIN_SEVERITY)
+
+    # Resume from the newest entry seen by the previous run for this query.
+    # The window is part of the key: a wider --minutes must fetch the older range.
+    cursor = None
+    since = None
+    cached: list[LogEntry] = []
+    if args.since_cursor:
+        cache_key = "|".join([args.project, args.service, severity or "", args.job_id or "", str(args.minutes)])
+        cache_path = Path(args.since_cursor).expanduser()
+        cursor, cached = load_cursor_cache(cache_path, cache_key)
+        window_start = datetime.now(UTC) - timedelta(minutes=args.minutes)
+        cached = [entry for entry in cached if entry.timestamp >= window_start]
+        if cursor:
+            since = (datetime.fromisoformat(cursor) - LATE_LOG_GRACE).isoformat()
+
+    # Fetch, parse and analyze as entries stream in
     raw_logs = run_gcloud_logging(
         project=args.project,
         service=args.service,
         minutes=args.minutes,
-        severity=args.severity,
+        severity=severity,
         job_id=args.job_id,
         limit=args.limit,
+        since=since,
     )
+    if args.limit >= PARALLEL_PARSE_MIN_LIMIT:
+        entries: Iterable[LogEntry] = parse_log_entries_parallel(raw_logs)
+    else:
+        entries = (parse_log_entry(raw) for raw in raw_logs)
+
+    if args.since_cursor:
+        fetched = list(entries)
+        entries = merge_entries(cached, fetched)
+        if len(fetched) >= args.limit:
+            # gcloud returns the newest entries first, so older ones in range were
+            # not read; keep the old cursor so the next run fetches them again
+            print(
+                f"Fetched --limit={args.limit} entries; older entries may be missing, cursor not advanced.",
+                file=sys.stderr,
+            )
+        elif entries:
+            newest = max(entries, key=lambda entry: entry.timestamp)
+            cursor = newest.raw_timestamp or newest.timestamp.isoformat()
+        save_cursor_cache(cache_path, cache_key, cursor, entries)
+
+    result = analyze_logs(entries)
 
-    if not raw_logs:
+    if not result.total_entries:
         print("No logs found for the specified criteria.", file=sys.stderr)
         sys.exit(0)
 
-    print(f"Fetched {len(raw_logs)} log entries, analyzing...", file=sys.stderr)
+    print(f"Analyzed {result.total_entries} log entries.", file=sys.stderr)
     print(file=sys.stderr)
 
-    # Parse and analyze
-    entries = [parse_log_entry(raw) for raw in raw_logs]
-    result = analyze_logs(entries)
-
     if args.json:
         # JSON output
         output = {
@@ -453,10 +736,10 @@ Examples:
             "liveness_failures": result.liveness_failures,
             "connection_errors": result.connection_errors,
             "firestore_errors": result.firestore_errors,
-            "application_errors": result.application_errors[:20],
-            "timeline": result.timeline[-20:],
+            "application_errors": result.application_errors,
+            "timeline": result.timeline,
         }
-        print(json.dumps(output, indent=2))
+        print(dumps_json(output))
     else:
         # Human-readable report
         print_report(result, verbose=args.verbose)
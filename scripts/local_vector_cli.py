@@ -3,20 +3,219 @@
 
 Usage:
     python local_vector_cli.py
+    python local_vector_cli.py --build-index  # one-off: add the ANN index to the shared table
+
+Searching is read-only. The IVF_PQ index is written to the shared table only
+when --build-index is given.
 
 Requirements:
     pip install lancedb sentence-transformers
+    pip install "sentence-transformers[onnx]"  # optional, faster CPU encoding
+
+The encoder and LanceDB are imported inside the functions that use them, so
+importing this module does not pull in torch and transformers.
+
+Environment:
+    THOTH_CLI_BACKEND    Encoder backend: "onnx" (default) or "torch". Falls back
+                         to torch when ONNX Runtime/Optimum are not installed.
+    THOTH_CLI_ONNX_FILE  ONNX weights inside the model repo, e.g.
+                         "onnx/model_qint8_avx2.onnx" for the int8 variant.
 """
 
+import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
+from itertools import takewhile
+import math
 import os
 import sys
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+SNIPPET_LENGTH = 300
+# Truncate text inside the query engine; one extra char tells us whether to add "..."
+RESULT_COLUMNS = {
+    "_distance": "_distance",
+    "file_path": "file_path",
+    "chunk_index": "chunk_index",
+    "snippet": f"left(text, {SNIPPET_LENGTH + 1})",
+}
+QUIT_COMMANDS = ("quit", "exit", "q")
+ENCODE_BATCH_SIZE = 32
+SEARCH_CONCURRENCY = 8
+QUERY_CACHE_SIZE = 1024
+SEMANTIC_CACHE_SIZE = 64
+SEMANTIC_CACHE_THRESHOLD = 0.98
+# ANN index settings; below ANN_INDEX_MIN_ROWS a flat scan is already fast and
+# there are too few vectors to train the PQ codebooks well
+ANN_INDEX_MIN_ROWS = 10_000
+ANN_SUB_VECTORS = 96  # 384-dim MiniLM vectors -> 4 dims per sub-vector
+ANN_NPROBES = 20
+ANN_REFINE_FACTOR = 5
+
+
+class SemanticCache:
+    """Reuse search results for queries whose embeddings nearly match a recent one.
+
+    Embeddings are unit-normalized, so a single matrix-vector product against
+    the cached vectors gives the cosine similarity to each of them.
+    """
+
+    def __init__(self, size: int = SEMANTIC_CACHE_SIZE, threshold: float = SEMANTIC_CACHE_THRESHOLD):
+        """Initialize an empty cache holding up to ``size`` recent searches."""
+        self.threshold = threshold
+        self._entries: deque = deque(maxlen=size)
+        self._matrix: np.ndarray | None = None
+
+    def get(self, vector: np.ndarray):
+        """Return cached results for a query vector, or None on a miss."""
+        if not self._entries:
+            return None
+        if self._matrix is None:
+            self._matrix = np.stack([v for v, _ in self._entries])
+        similarities = self._matrix @ vector
+        best = int(np.argmax(similarities))
+        if similarities[best] >= self.threshold:
+            return self._entries[best][1]
+        return None
+
+    def put(self, vector: np.ndarray, results) -> None:
+        """Remember the results for a query vector."""
+        self._entries.append((vector, results))
+        self._matrix = None
+
+
+def search(table, query_vector: np.ndarray):
+    """Return the top matches for a query vector as an Arrow table."""
+    return (
+        table.search(query_vector)
+        .distance_type("cosine")
+        .nprobes(ANN_NPROBES)
+        .refine_factor(ANN_REFINE_FACTOR)
+        .limit(5)
+        .select(RESULT_COLUMNS)
+        .to_arrow()
+    )
+
+
+def ensure_vector_index(table, row_count: int) -> None:
+    """Build an IVF_PQ index on the vector column unless one already exists.
+
+    Without an index every search is an exhaustive scan over the table. This
+    writes to the shared table, so main() only calls it for --build-index.
+    """
+    if row_count < ANN_INDEX_MIN_ROWS:
+        return
+    if any(index.columns == ["vector"] for index in table.list_indices()):
+        return
+    print("Building IVF_PQ vector index (one-off)...")
+    try:
+        table.create_index(
+            metric="cosine",
+            vector_column_name="vector",
+            index_type="IVF_PQ",
+            num_partitions=max(1, int(math.sqrt(row_count))),
+            num_sub_vectors=ANN_SUB_VECTORS,
+            replace=False,
+        )
+        print("✓ Vector index built")
+    except Exception as e:
+        # Another client may have built it first; flat search still works
+        print(f"  Skipping vector index: {e}")
+
+
+def print_results(results) -> None:
+    """Print search results with a truncated text snippet per hit."""
+    print(f"\n🔍 Found {results.num_rows} results:\n")
+
+    for idx, row in enumerate(results.to_pylist()):
+        print(f"📄 Result {idx + 1}:")
+        print(f"   Score: {row['_distance']:.4f}")
+
+        # Show metadata
+        print(f"   File: {row['file_path']}")
+        print(f"   Chunk: {row['chunk_index']}")
 
-import lancedb
-from sentence_transformers import SentenceTransformer
+        # Show text snippet
+        text = row["snippet"] or ""
+        if len(text) > SNIPPET_LENGTH:
+            text = text[: SNIPPET_LENGTH - 3] + "..."
+        print(f"   Text: {text}")
+        print()
+
+
+def run_batch(model: "SentenceTransformer", table, queries: list[str]) -> None:
+    """Answer a list of questions, encoding them in batches.
+
+    encode() already groups inputs by length before padding, so a single call
+    over the whole list keeps padding overhead low. Searches then run on a
+    small thread pool so their storage round trips overlap; LanceDB releases
+    the GIL while a query executes.
+    """
+    if not queries:
+        return
+    vectors = model.encode(
+        queries,
+        batch_size=ENCODE_BATCH_SIZE,
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        show_progress_bar=False,
+    )
+
+    def safe_search(vector: np.ndarray):
+        try:
+            return search(table, vector)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=SEARCH_CONCURRENCY) as pool:
+        for query, results in zip(queries, pool.map(safe_search, vectors), strict=True):
+            print()
+            print(f"❓ Question: {query}")
+            if isinstance(results, Exception):
+                print(f"\n✗ Error: {results}")
+            else:
+                print_results(results)
+
+
+def load_model(model_name: str) -> "SentenceTransformer":
+    """Load the query encoder, preferring the ONNX Runtime backend."""
+    from sentence_transformers import SentenceTransformer  # noqa: PLC0415
+    import torch  # noqa: PLC0415
+
+    backend = os.getenv("THOTH_CLI_BACKEND", "onnx")
+    if backend == "onnx" and not (find_spec("onnxruntime") and find_spec("optimum")):
+        print("  ONNX Runtime/Optimum not installed, using the PyTorch backend")
+        backend = "torch"
+
+    if backend == "onnx":
+        onnx_file = os.getenv("THOTH_CLI_ONNX_FILE")
+        model_kwargs = {"file_name": onnx_file} if onnx_file else None
+        return SentenceTransformer(model_name, backend="onnx", model_kwargs=model_kwargs)
+
+    torch.set_num_threads(os.cpu_count() or 1)
+    model = SentenceTransformer(model_name)
+    if model.device.type == "cuda":
+        model.half()
+    return model
 
 
 def main():
     """Simple CLI to query handbook vector store."""
+    parser = argparse.ArgumentParser(description="Query the handbook vector store.")
+    parser.add_argument(
+        "--build-index",
+        action="store_true",
+        help="build the IVF_PQ vector index on the shared table if missing (writes to GCS)",
+    )
+    args = parser.parse_args()
+
     # Configuration
     GCS_BUCKET = os.getenv("GCS_BUCKET_NAME", "thoth-dev-485501-thoth-storage")
     GCS_PROJECT = os.getenv("GCP_PROJECT_ID", "thoth-dev-485501")
@@ -32,13 +231,29 @@ def main():
     print(f"Model: {MODEL_NAME}")
     print("-" * 80)
 
-    # Load embedding model
+    # Load embedding model once; every query reuses it
     print("Loading embedding model...")
-    model = SentenceTransformer(MODEL_NAME)
-    print("✓ Model loaded")
+    model = load_model(MODEL_NAME)
+    print(f"✓ Model loaded ({model.get_backend()}, {model.device})")
+
+    @lru_cache(maxsize=QUERY_CACHE_SIZE)
+    def encode_query(query: str) -> np.ndarray:
+        # Normalized float32 embedding; LanceDB takes the array as-is
+        vector = model.encode(
+            query,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
+        vector.setflags(write=False)  # Shared between cache hits
+        return vector
+
+    result_cache = SemanticCache()
 
     # Connect to LanceDB
     print(f"Connecting to LanceDB at {LANCEDB_URI}...")
+    import lancedb  # noqa: PLC0415
+
     try:
         db = lancedb.connect(LANCEDB_URI)
         print("✓ Connected to LanceDB")
@@ -57,6 +272,18 @@ def main():
         print(f"\nAvailable tables: {db.table_names()}")
         sys.exit(1)
 
+    if args.build_index:
+        ensure_vector_index(table, count)
+
+    # Piped input (e.g. a file of eval questions): encode everything in one go
+    if not sys.stdin.isatty():
+        queries = [line.strip() for line in sys.stdin]
+        queries = list(takewhile(lambda q: q.lower() not in QUIT_COMMANDS, filter(None, queries)))
+        print(f"Read {len(queries)} questions from stdin")
+        print("=" * 80)
+        run_batch(model, table, queries)
+        return
+
     print("=" * 80)
     print("Ready! Type your questions (or 'quit' to exit)")
     print("=" * 80)
@@ -71,35 +298,20 @@ def main():
             if not query:
                 continue
 
-            if query.lower() in ("quit", "exit", "q"):
+            if query.lower() in QUIT_COMMANDS:
                 print("Goodbye!")
                 break
 
-            # Generate embedding
-            query_vector = model.encode(query).tolist()
-
-            # Search
-            results = table.search(query_vector).limit(5).to_pandas()
-
-            # Display results
-            print(f"\n🔍 Found {len(results)} results:\n")
-
-            for idx, row in results.iterrows():
-                print(f"📄 Result {idx + 1}:")
-                print(f"   Score: {row.get('_distance', 'N/A'):.4f}")
+            # Generate (or reuse) the query embedding
+            query_vector = encode_query(query)
 
-                # Show metadata
-                if "source_file" in row:
-                    print(f"   File: {row['source_file']}")
-                if "chunk_index" in row:
-                    print(f"   Chunk: {row['chunk_index']}")
+            # Search, unless a near-identical question was just answered
+            results = result_cache.get(query_vector)
+            if results is None:
+                results = search(table, query_vector)
+                result_cache.put(query_vector, results)
 
-                # Show text snippet
-                text = row.get("text", "")
-                if len(text) > 300:
-                    text = text[:297] + "..."
-                print(f"   Text: {text}")
-                print()
+            print_results(results)
 
         except KeyboardInterrupt:
             print("\n\nGoodbye!")
@@ -1,3 +1,28 @@
 #!/bin/bash
 export PATH=/home/linuxbrew/.linuxbrew/bin:/usr/local/bin:/usr/bin:/bin
-exec npx mcp-remote https://thoth-mcp-server-kp5w37kooa-uc.a.run.app/mcp/sse --header "Authorization: Bearer $(gcloud auth print-identity-token)"
+
+# Identity tokens are valid for an hour; reuse a cached one for 50 minutes
+# instead of shelling out to gcloud on every client launch. The cache lives in
+# a per-user directory (not a shared /tmp) and is only trusted if we own it.
+umask 077
+TOKEN_DIR="${XDG_RUNTIME_DIR:-$HOME/.cache}/thoth"
+TOKEN_FILE="${THOTH_TOKEN_CACHE:-$TOKEN_DIR/mcp-identity-token}"
+TOKEN_MAX_AGE=3000
+mkdir -p "$(dirname "$TOKEN_FILE")"
+
+token=""
+if [ -s "$TOKEN_FILE" ] && [ -O "$TOKEN_FILE" ] && [ ! -L "$TOKEN_FILE" ]; then
+  age=$(( $(date +%s) - $(stat -c %Y "$TOKEN_FILE" 2>/dev/null || stat -f %m "$TOKEN_FILE") ))
+  if [ "$age" -lt "$TOKEN_MAX_AGE" ]; then
+    token=$(cat "$TOKEN_FILE")
+  fi
+fi
+
+if [ -z "$token" ]; then
+  token=$(gcloud auth print-identity-token) || exit 1
+  tmp_file=$(mktemp "${TOKEN_FILE}.XXXXXX") || exit 1
+  printf '%s' "$token" > "$tmp_file"
+  mv -f "$tmp_file" "$TOKEN_FILE"
+fi
+
+exec npx mcp-remote https://thoth-mcp-server-kp5w37kooa-uc.a.run.app/mcp/sse --header "Authorization: Bearer ${token}"
@@ -2,7 +2,8 @@
 
 from pathlib import Path
 import sys
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -15,10 +16,35 @@ def parser():
     return DocxParser()
 
 
+@pytest.fixture(scope="module")
+def fake_docx():
+    """Install a fake docx module once for every test in this module."""
+    mock_docx = MagicMock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "docx", mock_docx)
+        yield mock_docx
+
+
 @pytest.fixture
-def mock_document_class():
-    """Create a mock Document class."""
-    return MagicMock()
+def mock_document_class(fake_docx):
+    """Attach a fresh mock Document class to the fake docx module."""
+    fake_docx.Document = MagicMock()
+    return fake_docx.Document
+
+
+def make_doc(paragraphs, title=None, author=None, subject=None, keywords=None):
+    """Build a lightweight stand-in for a python-docx Document."""
+    return SimpleNamespace(
+        paragraphs=[SimpleNamespace(text=text) for text in paragraphs],
+        tables=[],
+        core_properties=SimpleNamespace(title=title, author=author, subject=subject, keywords=keywords),
+    )
+
+
+def parse_doc(parser, document_class, paragraphs, **core_properties):
+    """Parse a fake document built from paragraphs and core properties."""
+    document_class.return_value = make_doc(paragraphs, **core_properties)
+    return parser.parse_content(b"fake docx content", "/test/file.docx")
 
 
 class TestDocxParser:
@@ -31,6 +57,8 @@ class TestDocxParser:
         assert ".docx" in extensions
         assert len(extensions) == 1
 
+    @pytest.mark.io
+    @pytest.mark.xdist_group("io")
     def test_parse_file_not_found(self, parser):
         """Test parsing a non-existent file."""
         with pytest.raises(FileNotFoundError):
@@ -38,58 +66,45 @@ class TestDocxParser:
 
     def test_parse_content_basic(self, parser, mock_document_class):
         """Test parsing DOCX content."""
-        # Mock the Document
-        mock_doc = MagicMock()
-        mock_doc.paragraphs = [
-            MagicMock(text="First paragraph"),
-            MagicMock(text="Second paragraph"),
-            MagicMock(text=""),  # Empty paragraph
-            MagicMock(text="Third paragraph"),
-        ]
-        mock_doc.tables = []
-        mock_doc.core_properties = MagicMock(
+        result = parse_doc(
+            parser,
+            mock_document_class,
+            ["First paragraph"],
             title="Test Document",
             author="Test Author",
             subject="Test Subject",
             keywords="test, keywords",
         )
 
-        mock_document_class.return_value = mock_doc
-
-        # Mock the docx module
-        mock_docx = MagicMock()
-        mock_docx.Document = mock_document_class
-
-        with patch.dict(sys.modules, {"docx": mock_docx}):
-            result = parser.parse_content(b"fake docx content", "/test/file.docx")
-
-        assert "First paragraph" in result.content
-        assert "Second paragraph" in result.content
-        assert "Third paragraph" in result.content
         assert result.format == "docx"
         assert result.source_path == "/test/file.docx"
         assert result.metadata["title"] == "Test Document"
         assert result.metadata["author"] == "Test Author"
 
+    @pytest.mark.parametrize(
+        ("paragraphs", "expected_content", "expected_count"),
+        [
+            (
+                ["First paragraph", "Second paragraph", "", "Third paragraph"],
+                "First paragraph\n\nSecond paragraph\n\nThird paragraph",
+                3,
+            ),
+            (["Real content", "   ", "\n\t", "More content"], "Real content\n\nMore content", 2),
+            (["Para 1", "Para 2", "Para 3"], "Para 1\n\nPara 2\n\nPara 3", 3),
+            (["  Test content here  "], "Test content here", 1),
+        ],
+        ids=["empty-skipped", "whitespace-skipped", "all-kept", "stripped"],
+    )
+    def test_paragraph_filtering(self, parser, mock_document_class, paragraphs, expected_content, expected_count):
+        """Test that paragraphs are stripped, empty ones dropped, and the rest counted."""
+        result = parse_doc(parser, mock_document_class, paragraphs)
+
+        assert result.content == expected_content
+        assert result.metadata["paragraph_count"] == expected_count
+
     def test_parse_content_empty_document(self, parser, mock_document_class):
         """Test parsing empty DOCX."""
-        mock_doc = MagicMock()
-        mock_doc.paragraphs = []
-        mock_doc.tables = []
-        mock_doc.core_properties = MagicMock(
-            title=None,
-            author=None,
-            subject=None,
-            keywords=None,
-        )
-
-        mock_document_class.return_value = mock_doc
-
-        mock_docx = MagicMock()
-        mock_docx.Document = mock_document_class
-
-        with patch.dict(sys.modules, {"docx": mock_docx}):
-            result = parser.parse_content(b"fake docx content", "/test/empty.docx")
+        result = parse_doc(parser, mock_document_class, [])
 
         assert result.content == ""
         # paragraph_count is 0 but gets filtered out as empty value
@@ -97,125 +112,44 @@ class TestDocxParser:
 
     def test_parse_content_metadata_cleanup(self, parser, mock_document_class):
         """Test that empty metadata values are removed."""
-        mock_doc = MagicMock()
-        mock_doc.paragraphs = [MagicMock(text="Content")]
-        mock_doc.tables = []
-        mock_doc.core_properties = MagicMock(
+        result = parse_doc(
+            parser,
+            mock_document_class,
+            ["Content"],
             title="Valid Title",
             author="",  # Empty
             subject=None,  # None
             keywords="valid, keywords",
         )
 
-        mock_document_class.return_value = mock_doc
-
-        mock_docx = MagicMock()
-        mock_docx.Document = mock_document_class
-
-        with patch.dict(sys.modules, {"docx": mock_docx}):
-            result = parser.parse_content(b"fake docx content", "/test/file.docx")
-
         assert result.metadata["title"] == "Valid Title"
         assert result.metadata["keywords"] == "valid, keywords"
         assert "author" not in result.metadata  # Empty removed
 
-    def test_parse_content_whitespace_paragraphs(self, parser, mock_document_class):
-        """Test that whitespace-only paragraphs are handled."""
-        mock_doc = MagicMock()
-        mock_doc.paragraphs = [
-            MagicMock(text="Real content"),
-            MagicMock(text="   "),  # Whitespace only
-            MagicMock(text="\n\t"),  # Only newlines/tabs
-            MagicMock(text="More content"),
-        ]
-        mock_doc.tables = []
-        mock_doc.core_properties = MagicMock(
-            title=None,
-            author=None,
-            subject=None,
-            keywords=None,
-        )
-
-        mock_document_class.return_value = mock_doc
-
-        mock_docx = MagicMock()
-        mock_docx.Document = mock_document_class
-
-        with patch.dict(sys.modules, {"docx": mock_docx}):
-            result = parser.parse_content(b"fake docx content", "/test/file.docx")
-
-        assert "Real content" in result.content
-        assert "More content" in result.content
-
-    def test_paragraph_count_metadata(self, parser, mock_document_class):
-        """Test that paragraph count is in metadata."""
-        mock_doc = MagicMock()
-        mock_doc.paragraphs = [
-            MagicMock(text="Para 1"),
-            MagicMock(text="Para 2"),
-            MagicMock(text="Para 3"),
+    def test_table_rows_extracted(self, parser, mock_document_class):
+        """Test that table rows are joined cell by cell after the paragraphs."""
+        doc = make_doc(["Intro"])
+        doc.tables = [
+            SimpleNamespace(
+                rows=[
+                    SimpleNamespace(cells=[SimpleNamespace(text=" Name "), SimpleNamespace(text="Value")]),
+                    SimpleNamespace(cells=[SimpleNamespace(text=""), SimpleNamespace(text="  ")]),
+                    SimpleNamespace(
+                        cells=[SimpleNamespace(text="a"), SimpleNamespace(text=""), SimpleNamespace(text="1")]
+                    ),
+                ]
+            )
         ]
-        mock_doc.tables = []
-        mock_doc.core_properties = MagicMock(
-            title=None,
-            author=None,
-            subject=None,
-            keywords=None,
-        )
-
-        mock_document_class.return_value = mock_doc
+        mock_document_class.return_value = doc
 
-        mock_docx = MagicMock()
-        mock_docx.Document = mock_document_class
-
-        with patch.dict(sys.modules, {"docx": mock_docx}):
-            result = parser.parse_content(b"fake docx content", "/test/file.docx")
+        result = parser.parse_content(b"fake docx content", "/test/file.docx")
 
+        assert result.content == "Intro\n\nName | Value\n\na | 1"
         assert result.metadata["paragraph_count"] == 3
 
-    def test_content_extraction(self, parser, mock_document_class):
-        """Test that content is properly extracted."""
-        mock_doc = MagicMock()
-        mock_doc.paragraphs = [MagicMock(text="  Test content here  ")]  # With whitespace to strip
-        mock_doc.tables = []
-        mock_doc.core_properties = MagicMock(
-            title=None,
-            author=None,
-            subject=None,
-            keywords=None,
-        )
-
-        mock_document_class.return_value = mock_doc
-
-        mock_docx = MagicMock()
-        mock_docx.Document = mock_document_class
-
-        with patch.dict(sys.modules, {"docx": mock_docx}):
-            result = parser.parse_content(b"fake docx content", "/test/file.docx")
-
-        assert result.content == "Test content here"  # Stripped
-        assert result.metadata["paragraph_count"] == 1
-
     def test_document_receives_bytesio(self, parser, mock_document_class):
         """Test that Document receives BytesIO from content."""
-        mock_doc = MagicMock()
-        mock_doc.paragraphs = [MagicMock(text="Content")]
-        mock_doc.tables = []
-        mock_doc.core_properties = MagicMock(
-            title=None,
-            author=None,
-            subject=None,
-            keywords=None,
-        )
-
-        mock_document_class.return_value = mock_doc
-
-        mock_docx = MagicMock()
-        mock_docx.Document = mock_document_class
-
-        content = b"fake docx content"
-        with patch.dict(sys.modules, {"docx": mock_docx}):
-            parser.parse_content(content, "/test/file.docx")
+        parse_doc(parser, mock_document_class, ["Content"])
 
         # Verify Document was called with a BytesIO-like object
         mock_document_class.assert_called_once()
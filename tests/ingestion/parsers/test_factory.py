@@ -83,6 +83,26 @@ class TestParserFactory:
 
         assert len(extensions) == len(set(extensions))
 
+    def test_register_parser_refreshes_supported_extensions(self):
+        """Test that registering a parser invalidates the cached extensions."""
+
+        class RstParser(TextParser):
+            @property
+            def supported_extensions(self) -> list[str]:
+                return [".rst"]
+
+        assert ".rst" not in ParserFactory.supported_extensions()
+
+        ParserFactory.register_parser(RstParser)
+        try:
+            assert ".rst" in ParserFactory.supported_extensions()
+        finally:
+            ParserFactory._parser_classes.remove(RstParser)
+            ParserFactory._parser_instances.clear()
+            ParserFactory._supported_extensions = ()
+
+        assert ".rst" not in ParserFactory.supported_extensions()
+
     def test_can_parse(self):
         """Test checking if file can be parsed."""
         assert ParserFactory.can_parse(Path("test.md"))
@@ -111,6 +131,30 @@ class TestParserFactory:
         # Should be same cached instance
         assert parser1 is parser2
 
+    def test_parser_map_built_on_first_lookup(self):
+        """Test that the first lookup maps every extension to a shared instance."""
+        ParserFactory._parser_instances.clear()
+
+        assert ParserFactory.get_parser(Path("test.xyz")) is None
+
+        assert set(ParserFactory._parser_instances) == set(ParserFactory.supported_extensions())
+        assert ParserFactory._parser_instances[".txt"] is ParserFactory._parser_instances[".text"]
+
+    def test_parser_map_published_only_when_complete(self, monkeypatch):
+        """Test that no partial map is visible while the parsers are being built."""
+        seen_during_build = []
+        original_init = DocxParser.__init__
+
+        def recording_init(self, *args, **kwargs):
+            seen_during_build.append(dict(ParserFactory._parser_instances))
+            original_init(self, *args, **kwargs)
+
+        monkeypatch.setattr(DocxParser, "__init__", recording_init)
+        ParserFactory._parser_instances.clear()
+
+        assert ParserFactory.can_parse(Path("test.docx"))
+        assert seen_during_build == [{}]
+
     def test_parse_content(self):
         """Test parsing content bytes."""
         content = b"# Test\n\nSome content"
@@ -1,7 +1,6 @@
 """Tests for markdown parser."""
 
 from pathlib import Path
-import tempfile
 
 import pytest
 
@@ -66,24 +65,21 @@ class TestMarkdownParser:
         assert ".md" in extensions
         assert ".markdown" in extensions
 
-    def test_parse_file(self, parser, sample_markdown):
-        """Test parsing a markdown file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as tmp:
-            tmp.write(sample_markdown)
-            tmp_path = Path(tmp.name)
+    @pytest.mark.io
+    @pytest.mark.xdist_group("io")
+    def test_parse_file(self, parser, tmp_path):
+        """Test that parse() reads the file and delegates to parse_content()."""
+        md_file = tmp_path / "doc.md"
+        md_file.write_text("# Title\n\nBody\n")
 
-        try:
-            result = parser.parse(tmp_path)
+        result = parser.parse(md_file)
 
-            assert result.content
-            assert result.format == "markdown"
-            assert result.source_path == str(tmp_path)
-            assert "title" in result.metadata
-            assert result.metadata["title"] == "Test Document"
-            assert result.metadata["author"] == "Test Author"
-        finally:
-            tmp_path.unlink()
+        assert result.content == "# Title\n\nBody\n"
+        assert result.format == "markdown"
+        assert result.source_path == str(md_file)
 
+    @pytest.mark.io
+    @pytest.mark.xdist_group("io")
     def test_parse_file_not_found(self, parser):
         """Test parsing a non-existent file."""
         with pytest.raises(FileNotFoundError):
@@ -98,6 +94,7 @@ class TestMarkdownParser:
         assert result.format == "markdown"
         assert result.source_path == "/test/file.md"
         assert result.metadata["title"] == "Test Document"
+        assert result.metadata["author"] == "Test Author"
 
     def test_parse_without_frontmatter(self, parser, markdown_without_frontmatter):
         """Test parsing markdown without frontmatter."""
@@ -127,6 +124,22 @@ class TestMarkdownParser:
         # But main content should remain
         assert "# Main Title" in result.content
 
+    def test_frontmatter_crlf_line_endings(self, parser):
+        """Test frontmatter delimited with Windows line endings."""
+        content = b"---\r\ntitle: CRLF Doc\r\n---\r\n\r\n# Heading\r\n"
+        result = parser.parse_content(content, "/test/crlf.md")
+
+        assert result.metadata["title"] == "CRLF Doc"
+        assert result.content == "# Heading\r\n"
+
+    def test_unterminated_frontmatter(self, parser):
+        """Test that an unclosed frontmatter block is kept as content."""
+        content = b"---\ntitle: Never closed\n\n# Heading\n"
+        result = parser.parse_content(content, "/test/open.md")
+
+        assert "title" not in result.metadata
+        assert result.content == content.decode("utf-8")
+
     def test_empty_content(self, parser):
         """Test parsing empty content."""
         result = parser.parse_content(b"", "/test/empty.md")
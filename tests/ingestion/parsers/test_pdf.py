@@ -2,23 +2,63 @@
 
 from pathlib import Path
 import sys
-from unittest.mock import MagicMock, patch
+import types
 
 import pytest
 
 from thoth.ingestion.parsers.pdf import PDFParser
 
 
-@pytest.fixture
+class FakePage:
+    """Stand-in for a PyMuPDF page."""
+
+    __slots__ = ("text",)
+
+    def __init__(self, text):
+        self.text = text
+
+    def get_text(self):
+        return self.text
+
+
+class FakeDoc(list):
+    """Stand-in for a PyMuPDF document: a list of pages with metadata."""
+
+    __slots__ = ("close_calls", "metadata")
+
+    def __init__(self, pages, metadata=None):
+        super().__init__(FakePage(text) for text in pages)
+        self.metadata = metadata
+        self.close_calls = 0
+
+    def close(self):
+        self.close_calls += 1
+
+
+@pytest.fixture(scope="module")
 def parser():
-    """Create a PDFParser instance."""
+    """Create a shared PDFParser instance."""
     return PDFParser()
 
 
+@pytest.fixture(autouse=True, scope="module")
+def fake_fitz():
+    """Install a fake fitz module once for every test in this module."""
+    module = types.ModuleType("fitz")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "fitz", module)
+        yield module
+
+
 @pytest.fixture
-def mock_fitz():
-    """Create a mock fitz module."""
-    return MagicMock()
+def open_pdf(fake_fitz):
+    """Make fake_fitz.open() return the given document."""
+
+    def install(doc):
+        fake_fitz.open = lambda *_args, **_kwargs: doc
+        return doc
+
+    return install
 
 
 class TestPDFParser:
@@ -31,122 +71,55 @@ class TestPDFParser:
         assert ".pdf" in extensions
         assert len(extensions) == 1
 
+    @pytest.mark.io
+    @pytest.mark.xdist_group("io")
     def test_parse_file_not_found(self, parser):
         """Test parsing a non-existent file."""
         with pytest.raises(FileNotFoundError):
             parser.parse(Path("/nonexistent/file.pdf"))
 
-    def test_parse_content_basic(self, parser, mock_fitz):
-        """Test parsing PDF content."""
-        # Mock the fitz module
-        mock_doc = MagicMock()
-        mock_doc.__len__ = MagicMock(return_value=2)
-        mock_doc.metadata = {"title": "Test PDF", "author": "Test Author"}
-
-        mock_page1 = MagicMock()
-        mock_page1.get_text.return_value = "Page 1 content"
-
-        mock_page2 = MagicMock()
-        mock_page2.get_text.return_value = "Page 2 content"
-
-        mock_doc.__getitem__ = MagicMock(side_effect=lambda i: [mock_page1, mock_page2][i])
-        mock_fitz.open.return_value = mock_doc
-
-        with patch.dict(sys.modules, {"fitz": mock_fitz}):
-            result = parser.parse_content(b"fake pdf content", "/test/file.pdf")
-
-        assert "[Page 1]" in result.content
-        assert "Page 1 content" in result.content
-        assert "[Page 2]" in result.content
-        assert "Page 2 content" in result.content
+    @pytest.mark.parametrize(
+        ("pages", "pdf_metadata", "expected"),
+        [
+            (
+                ["Page 1 content", "Page 2 content"],
+                {"title": "Test PDF", "author": "Test Author"},
+                (
+                    "[Page 1]\nPage 1 content\n\n[Page 2]\nPage 2 content",
+                    {"page_count": 2, "title": "Test PDF", "author": "Test Author"},
+                ),
+            ),
+            (
+                ["Content on page 1", "   ", "Content on page 3"],  # Page 2 is whitespace only
+                {},
+                ("[Page 1]\nContent on page 1\n\n[Page 3]\nContent on page 3", {"page_count": 3}),
+            ),
+            (
+                ["Content"],
+                {"title": "Valid Title", "author": "", "subject": None, "creator": "PDF Creator"},
+                ("[Page 1]\nContent", {"page_count": 1, "title": "Valid Title", "creator": "PDF Creator"}),
+            ),
+            (["Content"], None, ("[Page 1]\nContent", {"page_count": 1})),
+        ],
+        ids=["basic", "empty-pages", "metadata-cleanup", "no-metadata"],
+    )
+    def test_parse_content(self, parser, open_pdf, pages, pdf_metadata, expected):
+        """Test page markers, skipped empty pages and metadata cleanup."""
+        expected_content, expected_metadata = expected
+        open_pdf(FakeDoc(pages, metadata=pdf_metadata))
+
+        result = parser.parse_content(b"fake pdf content", "/test/file.pdf")
+
+        assert result.content == expected_content
         assert result.format == "pdf"
         assert result.source_path == "/test/file.pdf"
-        assert result.metadata["title"] == "Test PDF"
-        assert result.metadata["author"] == "Test Author"
-        assert result.metadata["page_count"] == 2
+        assert result.metadata == {"source_path": "/test/file.pdf", **expected_metadata}
 
-    def test_parse_content_empty_pages(self, parser, mock_fitz):
-        """Test parsing PDF with empty pages."""
-        mock_doc = MagicMock()
-        mock_doc.__len__ = MagicMock(return_value=3)
-        mock_doc.metadata = {}
-
-        mock_page1 = MagicMock()
-        mock_page1.get_text.return_value = "Content on page 1"
-
-        mock_page2 = MagicMock()
-        mock_page2.get_text.return_value = "   "  # Whitespace only
-
-        mock_page3 = MagicMock()
-        mock_page3.get_text.return_value = "Content on page 3"
-
-        mock_doc.__getitem__ = MagicMock(side_effect=lambda i: [mock_page1, mock_page2, mock_page3][i])
-        mock_fitz.open.return_value = mock_doc
-
-        with patch.dict(sys.modules, {"fitz": mock_fitz}):
-            result = parser.parse_content(b"fake pdf content", "/test/file.pdf")
-
-        # Empty page should be skipped
-        assert "[Page 1]" in result.content
-        assert "[Page 2]" not in result.content  # Empty page skipped
-        assert "[Page 3]" in result.content
-
-    def test_parse_content_metadata_cleanup(self, parser, mock_fitz):
-        """Test that empty metadata values are removed."""
-        mock_doc = MagicMock()
-        mock_doc.__len__ = MagicMock(return_value=1)
-        mock_doc.metadata = {
-            "title": "Valid Title",
-            "author": "",  # Empty, should be removed
-            "subject": None,  # None, should be removed
-            "creator": "PDF Creator",
-        }
-
-        mock_page = MagicMock()
-        mock_page.get_text.return_value = "Content"
-
-        mock_doc.__getitem__ = MagicMock(return_value=mock_page)
-        mock_fitz.open.return_value = mock_doc
-
-        with patch.dict(sys.modules, {"fitz": mock_fitz}):
-            result = parser.parse_content(b"fake pdf content", "/test/file.pdf")
-
-        assert result.metadata["title"] == "Valid Title"
-        assert result.metadata.get("creator") == "PDF Creator"
-        assert "author" not in result.metadata  # Empty value removed
-
-    def test_parse_content_no_metadata(self, parser, mock_fitz):
-        """Test parsing PDF with no metadata."""
-        mock_doc = MagicMock()
-        mock_doc.__len__ = MagicMock(return_value=1)
-        mock_doc.metadata = None
-
-        mock_page = MagicMock()
-        mock_page.get_text.return_value = "Content"
-
-        mock_doc.__getitem__ = MagicMock(return_value=mock_page)
-        mock_fitz.open.return_value = mock_doc
-
-        with patch.dict(sys.modules, {"fitz": mock_fitz}):
-            result = parser.parse_content(b"fake pdf content", "/test/file.pdf")
-
-        assert result.metadata["source_path"] == "/test/file.pdf"
-        assert result.metadata["page_count"] == 1
-
-    def test_document_close(self, parser, mock_fitz):
+    def test_document_close(self, parser, open_pdf):
         """Test that document is closed after parsing."""
-        mock_doc = MagicMock()
-        mock_doc.__len__ = MagicMock(return_value=1)
-        mock_doc.metadata = {}
-
-        mock_page = MagicMock()
-        mock_page.get_text.return_value = "Content"
-
-        mock_doc.__getitem__ = MagicMock(return_value=mock_page)
-        mock_fitz.open.return_value = mock_doc
+        doc = open_pdf(FakeDoc(["Content"], metadata={}))
 
-        with patch.dict(sys.modules, {"fitz": mock_fitz}):
-            parser.parse_content(b"fake pdf content", "/test/file.pdf")
+        parser.parse_content(b"fake pdf content", "/test/file.pdf")
 
-        # Verify close was called
-        mock_doc.close.assert_called_once()
+        # Verify close was called exactly once
+        assert doc.close_calls == 1
@@ -1,29 +1,37 @@
 """Tests for text parser."""
 
 from pathlib import Path
-import tempfile
 
 import pytest
 
 from thoth.ingestion.parsers.text import TextParser
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def parser():
-    """Create a TextParser instance."""
+    """Create a shared TextParser instance."""
     return TextParser()
 
 
-@pytest.fixture
-def sample_text():
-    """Sample text content."""
-    return """This is a sample text file.
+SAMPLE_TEXT = """This is a sample text file.
 
 It has multiple lines.
 And some content.
 
 Final paragraph here.
 """
+SAMPLE_CHAR_COUNT = len(SAMPLE_TEXT)
+SAMPLE_LINE_COUNT = SAMPLE_TEXT.count("\n") + 1
+
+# Valid latin-1 (é è à) but not valid UTF-8
+LATIN1_BYTES = b"\xe9\xe8\xe0"
+SPECIAL_BYTES = b"Special chars: @#$%^&*()_+{}|:<>?\n\t\r"
+
+
+@pytest.fixture
+def sample_text():
+    """Sample text content."""
+    return SAMPLE_TEXT
 
 
 class TestTextParser:
@@ -36,21 +44,21 @@ class TestTextParser:
         assert ".txt" in extensions
         assert ".text" in extensions
 
-    def test_parse_file(self, parser, sample_text):
+    @pytest.mark.io
+    @pytest.mark.xdist_group("io")
+    def test_parse_file(self, parser, sample_text, tmp_path):
         """Test parsing a text file."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as tmp:
-            tmp.write(sample_text)
-            tmp_path = Path(tmp.name)
+        text_file = tmp_path / "sample.txt"
+        text_file.write_bytes(sample_text.encode("utf-8"))
 
-        try:
-            result = parser.parse(tmp_path)
+        result = parser.parse(text_file)
 
-            assert result.content == sample_text
-            assert result.format == "text"
-            assert result.source_path == str(tmp_path)
-        finally:
-            tmp_path.unlink()
+        assert result.content == sample_text
+        assert result.format == "text"
+        assert result.source_path == str(text_file)
 
+    @pytest.mark.io
+    @pytest.mark.xdist_group("io")
     def test_parse_file_not_found(self, parser):
         """Test parsing a non-existent file."""
         with pytest.raises(FileNotFoundError):
@@ -73,8 +81,8 @@ class TestTextParser:
         assert "source_path" in result.metadata
         assert "char_count" in result.metadata
         assert "line_count" in result.metadata
-        assert result.metadata["char_count"] == len(sample_text)
-        assert result.metadata["line_count"] == sample_text.count("\n") + 1
+        assert result.metadata["char_count"] == SAMPLE_CHAR_COUNT
+        assert result.metadata["line_count"] == SAMPLE_LINE_COUNT
 
     def test_empty_content(self, parser):
         """Test parsing empty content."""
@@ -102,17 +110,14 @@ class TestTextParser:
 
     def test_latin1_fallback(self, parser):
         """Test latin-1 fallback for non-UTF-8 content."""
-        # Create content that's valid latin-1 but not valid UTF-8
-        content = bytes([0xE9, 0xE8, 0xE0])  # é è à in latin-1
-        result = parser.parse_content(content, "/test/latin1.txt")
+        result = parser.parse_content(LATIN1_BYTES, "/test/latin1.txt")
 
         # Should successfully decode
         assert len(result.content) == 3
 
     def test_special_characters(self, parser):
         """Test parsing special characters."""
-        content = "Special chars: @#$%^&*()_+{}|:<>?\n\t\r"
-        result = parser.parse_content(content.encode("utf-8"), "/test/special.txt")
+        result = parser.parse_content(SPECIAL_BYTES, "/test/special.txt")
 
         assert "@#$%^&*()" in result.content
         assert "\t" in result.content
@@ -0,0 +1,109 @@
+"""Tests for the persistent embedding cache."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from thoth.ingestion.embed_cache import CachedEmbedder, EmbeddingCache, content_hash
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create an empty cache for a test model."""
+    embedding_cache = EmbeddingCache(tmp_path / "cache.sqlite3", model_id="test-model")
+    yield embedding_cache
+    embedding_cache.close()
+
+
+@pytest.fixture
+def mock_embedder():
+    """Create an embedder stand-in returning one distinct vector per text."""
+    embedder = MagicMock()
+    embedder.model_name = "test-model"
+    embedder.embed.side_effect = lambda texts, **_kwargs: [[float(len(text)), 0.5] for text in texts]
+    return embedder
+
+
+class TestEmbeddingCache:
+    """Tests for EmbeddingCache."""
+
+    def test_round_trip(self, cache):
+        """Test stored vectors come back for their hashes only."""
+        cache.put_many({"a": [0.25, 0.5], "b": [1.0, -1.0]})
+
+        assert cache.get_many(["a", "b", "missing"]) == {"a": [0.25, 0.5], "b": [1.0, -1.0]}
+        assert len(cache) == 2
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test vectors survive closing and reopening the database."""
+        path = tmp_path / "cache.sqlite3"
+        first = EmbeddingCache(path, model_id="test-model")
+        first.put_many({"a": [0.5]})
+        first.close()
+
+        second = EmbeddingCache(path, model_id="test-model")
+
+        assert second.get_many(["a"]) == {"a": [0.5]}
+        second.close()
+
+    def test_keys_are_scoped_to_model(self, cache):
+        """Test a different model never sees another model's vectors."""
+        cache.put_many({"a": [0.5]})
+        other = EmbeddingCache(cache.path, model_id="other-model")
+
+        assert other.get_many(["a"]) == {}
+        other.close()
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test entries over max_entries are evicted oldest-use first."""
+        cache = EmbeddingCache(tmp_path / "cache.sqlite3", model_id="test-model", max_entries=2)
+        cache.put_many({"a": [1.0]})
+        cache.put_many({"b": [2.0]})
+        cache.get_many(["a"])  # Touch a so b is the least recently used
+
+        cache.put_many({"c": [3.0]})
+
+        assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+        cache.close()
+
+
+class TestCachedEmbedder:
+    """Tests for CachedEmbedder."""
+
+    def test_embeds_only_misses(self, cache, mock_embedder):
+        """Test a second call is served from the cache and counted as hits."""
+        embedder = CachedEmbedder(mock_embedder, cache)
+
+        first = embedder.embed(["one", "three"])
+        second = embedder.embed(["three", "one", "four"])
+
+        assert second == [first[1], first[0], [4.0, 0.5]]
+        assert mock_embedder.embed.call_count == 2
+        assert mock_embedder.embed.call_args.args[0] == ["four"]
+        assert (embedder.hits, embedder.misses) == (2, 3)
+
+    def test_duplicate_texts_embedded_once(self, cache, mock_embedder):
+        """Test repeated texts in one call reach the wrapped embedder once."""
+        embedder = CachedEmbedder(mock_embedder, cache)
+
+        result = embedder.embed(["same", "same"])
+
+        assert result == [[4.0, 0.5], [4.0, 0.5]]
+        mock_embedder.embed.assert_called_once_with(["same"], show_progress=False, normalize=True)
+        assert cache.get_many([content_hash("same")]) == {content_hash("same"): [4.0, 0.5]}
+
+    def test_unnormalized_bypasses_cache(self, cache, mock_embedder):
+        """Test unnormalized requests go straight to the wrapped embedder."""
+        embedder = CachedEmbedder(mock_embedder, cache)
+
+        embedder.embed(["text"], normalize=False)
+
+        assert len(cache) == 0
+        assert (embedder.hits, embedder.misses) == (0, 0)
+
+    def test_forwards_other_attributes(self, cache, mock_embedder):
+        """Test non-embed attributes come from the wrapped embedder."""
+        embedder = CachedEmbedder(mock_embedder, cache)
+
+        assert embedder.model_name == "test-model"
+        assert embedder.embed_single is mock_embedder.embed_single
@@ -1,26 +1,61 @@
 """Unit tests for thoth.ingestion.gcs_repo_sync module."""
 
 from pathlib import Path
-import tempfile
-from unittest.mock import MagicMock, patch
+from unittest.mock import DEFAULT, MagicMock, create_autospec, patch
 
 from git.exc import GitCommandError
+from google.cloud import storage
 import pytest
 
+# Keep this module on one xdist worker so the patched_storage autospecs (~17 ms each) are built once
+pytestmark = pytest.mark.xdist_group("gcs_repo_sync")
+
 # Import with mocked storage to avoid requiring GCS credentials
 with patch("thoth.ingestion.gcs_repo_sync.storage"):
     from thoth.ingestion.gcs_repo_sync import GCSRepoSync
 
 
+@pytest.fixture(scope="module")
+def patched_storage():
+    """Patch the GCS storage module once for every test in this module.
+
+    The client and bucket are autospecced once here; building a spec walks the
+    whole class, so it is too slow to repeat for every test.
+    """
+    with patch("thoth.ingestion.gcs_repo_sync.storage") as mock_storage:
+        client = create_autospec(storage.Client, instance=True, spec_set=True)
+        client.bucket.return_value = create_autospec(storage.Bucket, instance=True, spec_set=True)
+        mock_storage.Client.return_value = client
+        yield mock_storage
+
+
+@pytest.fixture
+def mock_bucket(patched_storage):
+    """Reset the shared autospecced bucket so each test starts clean."""
+    patched_storage.Client.side_effect = None
+    bucket = patched_storage.Client.return_value.bucket.return_value
+    bucket.reset_mock(return_value=True, side_effect=True)
+    return bucket
+
+
+DEFAULT_SYNC_ARGS = {
+    "bucket_name": "test-bucket",
+    "repo_url": "https://gitlab.com/test/repo.git",
+    "gcs_prefix": "handbook",
+    "local_path": Path("/tmp/test"),  # nosec B108
+}
+
+
+def make_sync(**overrides):
+    """Create a GCSRepoSync from the default test arguments."""
+    return GCSRepoSync(**{**DEFAULT_SYNC_ARGS, **overrides})
+
+
 class TestGCSRepoSync:
     """Test cases for GCSRepoSync functionality."""
 
-    @patch("thoth.ingestion.gcs_repo_sync.storage")
-    def test_init(self, mock_storage):
+    def test_init(self, mock_bucket):
         """Test GCSRepoSync initialization."""
-        mock_bucket = MagicMock()
-        mock_storage.Client.return_value.bucket.return_value = mock_bucket
-
         sync = GCSRepoSync(
             bucket_name="test-bucket",
             repo_url="https://gitlab.com/test/repo.git",
@@ -33,120 +68,63 @@ class TestGCSRepoSync:
         assert sync.gcs_prefix == "test-prefix"
         assert sync.local_path == Path("/tmp/test")  # nosec B108
 
-    @patch("thoth.ingestion.gcs_repo_sync.Repo")
-    @patch("thoth.ingestion.gcs_repo_sync.storage")
-    def test_clone_to_gcs(self, mock_storage, mock_repo):
+    def test_clone_to_gcs(self, mock_bucket):
         """Test cloning repository to GCS."""
-        mock_bucket = MagicMock()
         mock_bucket.list_blobs.return_value = []  # No existing files
-        mock_blob = MagicMock()
-        mock_bucket.blob.return_value = mock_blob
-        mock_storage.Client.return_value.bucket.return_value = mock_bucket
+        mock_file = MagicMock()
+        mock_file.is_file.return_value = True
+        mock_file.relative_to.return_value = Path("file.md")
+        mock_file.__str__ = lambda _: "/tmp/fake_tmpdir/repo/file.md"  # nosec B108
 
-        sync = GCSRepoSync(
-            "test-bucket",
-            "https://gitlab.com/test/repo.git",
-            "handbook",
-            Path("/tmp/test"),  # nosec B108
-        )
+        sync = make_sync()
 
-        # Mock the clone to create some files
-        with patch("tempfile.TemporaryDirectory") as mock_tmpdir:
-            mock_tmpdir.return_value.__enter__.return_value = "/tmp/fake_tmpdir"  # nosec B108
-            with patch("pathlib.Path.rglob") as mock_rglob:
-                mock_file = MagicMock()
-                mock_file.is_file.return_value = True
-                mock_file.relative_to.return_value = Path("file.md")
-                mock_file.__str__ = lambda _: "/tmp/fake_tmpdir/repo/file.md"  # nosec B108
-                mock_rglob.return_value = [mock_file]
-
-                result = sync.clone_to_gcs()
+        # Fake the clone into a temp dir containing a single file
+        with (
+            patch.multiple("thoth.ingestion.gcs_repo_sync", Repo=DEFAULT, tempfile=DEFAULT) as mocks,
+            patch.object(Path, "rglob", return_value=[mock_file]),
+        ):
+            mocks["tempfile"].TemporaryDirectory.return_value.__enter__.return_value = "/tmp/fake_tmpdir"  # nosec B108
+            result = sync.clone_to_gcs()
 
-        assert result["status"] in ["success", "exists"]
+        assert result["status"] == "success"
+        assert result["files_uploaded"] == 1
+        mock_bucket.blob.assert_called_once_with("handbook/file.md")
 
-    @patch("thoth.ingestion.gcs_repo_sync.storage")
-    def test_sync_to_local(self, mock_storage):
+    def test_sync_to_local(self, mock_bucket, tmp_path):
         """Test syncing from GCS to local."""
-        mock_bucket = MagicMock()
         mock_blob = MagicMock()
         mock_blob.name = "handbook/file.md"
         mock_bucket.list_blobs.return_value = [mock_blob]
-        mock_storage.Client.return_value.bucket.return_value = mock_bucket
-
-        # Use a real temp directory that gets cleaned up
-        with tempfile.TemporaryDirectory() as tmpdir:
-            sync = GCSRepoSync(
-                "test-bucket",
-                "https://gitlab.com/test/repo.git",
-                "handbook",
-                Path(tmpdir) / "test",
-            )
-
-            result = sync.sync_to_local()
-
-            assert result["status"] == "success"
-            assert "files_downloaded" in result
 
-    @patch("thoth.ingestion.gcs_repo_sync.storage")
-    def test_is_synced(self, mock_storage):
-        """Test checking if local repository is synced."""
-        mock_bucket = MagicMock()
-        mock_storage.Client.return_value.bucket.return_value = mock_bucket
+        sync = make_sync(local_path=tmp_path / "test")
 
-        sync = GCSRepoSync(
-            "test-bucket",
-            "https://gitlab.com/test/repo.git",
-            "handbook",
-            Path("/tmp/test"),  # nosec B108
-        )
-
-        # Test when directory exists and has completion marker
-        with (
-            patch.object(Path, "exists", return_value=True),
-        ):
-            # Mock the completion marker check
-            sync.local_path = MagicMock()
-            sync.local_path.exists.return_value = True
-            marker = MagicMock()
-            marker.exists.return_value = True
-            sync.local_path.__truediv__ = MagicMock(return_value=marker)
+        result = sync.sync_to_local()
 
-            assert sync.is_synced() is True
+        assert result["status"] == "success"
+        assert "files_downloaded" in result
 
-    @patch("thoth.ingestion.gcs_repo_sync.storage")
-    def test_is_synced_no_marker(self, mock_storage):
-        """Test is_synced returns False when completion marker missing."""
-        mock_bucket = MagicMock()
-        mock_storage.Client.return_value.bucket.return_value = mock_bucket
+    @pytest.mark.parametrize(
+        ("create_marker", "expected"),
+        [(True, True), (False, False)],
+        ids=["marker", "no-marker"],
+    )
+    def test_is_synced(self, mock_bucket, tmp_path, create_marker, expected):
+        """Test is_synced follows the completion marker in an existing directory."""
+        if create_marker:
+            (tmp_path / ".sync_complete").touch()
+        sync = make_sync(local_path=tmp_path)
 
-        sync = GCSRepoSync(
-            "test-bucket",
-            "https://gitlab.com/test/repo.git",
-            "handbook",
-            Path("/tmp/test"),  # nosec B108
-        )
+        assert sync.is_synced() is expected
 
-        # Mock directory exists but no completion marker
-        sync.local_path = MagicMock()
-        sync.local_path.exists.return_value = True
-        marker = MagicMock()
-        marker.exists.return_value = False
-        sync.local_path.__truediv__ = MagicMock(return_value=marker)
+    def test_is_synced_missing_directory(self, mock_bucket, tmp_path):
+        """Test is_synced returns False before anything has been synced."""
+        sync = make_sync(local_path=tmp_path / "missing")
 
         assert sync.is_synced() is False
 
-    @patch("thoth.ingestion.gcs_repo_sync.storage")
-    def test_get_local_path(self, mock_storage):
+    def test_get_local_path(self, mock_bucket):
         """Test getting local path."""
-        mock_bucket = MagicMock()
-        mock_storage.Client.return_value.bucket.return_value = mock_bucket
-
-        sync = GCSRepoSync(
-            "test-bucket",
-            "https://gitlab.com/test/repo.git",
-            "handbook",
-            Path("/tmp/test"),  # nosec B108
-        )
+        sync = make_sync()
 
         assert sync.get_local_path() == Path("/tmp/test")  # nosec B108
 
@@ -155,35 +133,21 @@ class TestGCSRepoSyncErrorHandling:
     """Test error handling in GCSRepoSync."""
 
     @patch("thoth.ingestion.gcs_repo_sync.Repo")
-    @patch("thoth.ingestion.gcs_repo_sync.storage")
-    def test_clone_to_gcs_git_failure(self, mock_storage, mock_repo):
+    def test_clone_to_gcs_git_failure(self, mock_repo, mock_bucket):
         """Test handling git clone failures."""
-        mock_bucket = MagicMock()
         mock_bucket.list_blobs.return_value = []  # No existing files
-        mock_storage.Client.return_value.bucket.return_value = mock_bucket
 
         # Make git clone fail
         mock_repo.clone_from.side_effect = GitCommandError("clone", "Git error")
 
-        sync = GCSRepoSync(
-            "test-bucket",
-            "https://gitlab.com/test/repo.git",
-            "handbook",
-            Path("/tmp/test"),  # nosec B108
-        )
+        sync = make_sync()
 
         with pytest.raises(GitCommandError):
             sync.clone_to_gcs()
 
-    @patch("thoth.ingestion.gcs_repo_sync.storage")
-    def test_sync_init_gcs_failure(self, mock_storage):
+    def test_sync_init_gcs_failure(self, patched_storage, mock_bucket):
         """Test handling GCS initialization failures."""
-        mock_storage.Client.side_effect = Exception("GCS error")
+        patched_storage.Client.side_effect = Exception("GCS error")
 
         with pytest.raises(Exception, match="GCS error"):
-            GCSRepoSync(
-                "test-bucket",
-                "https://gitlab.com/test/repo.git",
-                "handbook",
-                Path("/tmp/test"),  # nosec B108
-            )
+            make_sync()
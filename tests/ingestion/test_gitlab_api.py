@@ -1,11 +1,10 @@
 """Tests for GitLab API client."""
 
 from datetime import UTC, datetime, timedelta
-import os
-import time
-import unittest
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
+import pytest
 import requests
 
 from thoth.ingestion.gitlab_api import (
@@ -14,229 +13,250 @@ from thoth.ingestion.gitlab_api import (
     GitLabAPIError,
 )
 
-
-class TestCacheEntry(unittest.TestCase):
+# A rate-limit reset comfortably past the end of any test run
+FUTURE_RATE_LIMIT_RESET = str(int((datetime.now(tz=UTC) + timedelta(hours=24)).timestamp()))
+
+# Headers shared by every successful mock response
+RESPONSE_HEADERS = {
+    "RateLimit-Remaining": "100",
+    "RateLimit-Reset": FUTURE_RATE_LIMIT_RESET,
+}
+
+
+def make_response(json_data=None):
+    """Create a successful mock response returning json_data."""
+    if json_data is None:
+        json_data = {"data": "test"}
+    return Mock(
+        status_code=200,
+        headers=RESPONSE_HEADERS,
+        content=b'{"data": "test"}',  # Only checked for emptiness
+        **{"json.return_value": json_data},
+    )
+
+
+@pytest.fixture(scope="class")
+def clean_env():
+    """Keep CI's GITLAB_TOKEN and GITLAB_BASE_URL from leaking into the client."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.delenv("GITLAB_TOKEN", raising=False)
+        mp.delenv("GITLAB_BASE_URL", raising=False)
+        yield
+
+
+@pytest.fixture(scope="class")
+def shared_client(clean_env):
+    """Create one GitLabAPIClient per test class."""
+    return GitLabAPIClient(
+        token="test-token",
+        base_url="https://gitlab.com/api/v4",
+        timeout=30,
+        max_retries=3,
+    )
+
+
+@pytest.fixture
+def client(shared_client):
+    """Hand each test the shared client with an empty cache and no rate-limit state."""
+    shared_client.clear_cache()
+    shared_client._rate_limit_remaining = None
+    shared_client._rate_limit_reset = None
+    return shared_client
+
+
+class TestCacheEntry:
     """Tests for CacheEntry class."""
 
     def test_cache_entry_not_expired(self):
         """Test cache entry is not expired within TTL."""
         entry = CacheEntry({"data": "test"}, ttl=60)
-        self.assertFalse(entry.is_expired())
+        assert not entry.is_expired()
 
     def test_cache_entry_expired(self):
         """Test cache entry expires after TTL."""
-        entry = CacheEntry({"data": "test"}, ttl=0)
-        time.sleep(0.1)
-        self.assertTrue(entry.is_expired())
+        entry = CacheEntry({"data": "test"}, ttl=60)
+        entry.expires_at -= timedelta(seconds=61)  # Age the entry past its TTL
+        assert entry.is_expired()
 
     def test_cache_entry_data(self):
         """Test cache entry stores data correctly."""
         test_data = {"key": "value", "list": [1, 2, 3]}
         entry = CacheEntry(test_data, ttl=60)
-        self.assertEqual(entry.data, test_data)
+        assert entry.data == test_data
 
 
-class TestGitLabAPIClient(unittest.TestCase):
+@pytest.mark.usefixtures("clean_env")
+class TestGitLabAPIClient:
     """Tests for GitLabAPIClient class."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        # Mock environment variables to prevent CI environment from interfering
-        self.env_patcher = patch.dict("os.environ", {}, clear=False)
-        self.env_mock = self.env_patcher.start()
-        # Ensure GITLAB_TOKEN and GITLAB_BASE_URL are not set
-        os.environ.pop("GITLAB_TOKEN", None)
-        os.environ.pop("GITLAB_BASE_URL", None)
-
-        self.client = GitLabAPIClient(
-            token="test-token",
-            base_url="https://gitlab.com/api/v4",
-            timeout=30,
-            max_retries=3,
-        )
-        self.mock_response = self._create_mock_response()
-
-    def tearDown(self):
-        """Clean up test fixtures."""
-        self.env_patcher.stop()
-
-    def _create_mock_response(self):
-        """Create mock response."""
-        response = Mock()
-        response.status_code = 200
-        response.headers = {
-            "RateLimit-Remaining": "100",
-            "RateLimit-Reset": str(int((datetime.now(tz=UTC) + timedelta(hours=1)).timestamp())),
-        }
-        response.json.return_value = {"data": "test"}
-        response.content = b'{"data": "test"}'
-        return response
-
-    def test_client_initialization(self):
+    def test_client_initialization(self, client):
         """Test client initializes correctly."""
-        self.assertEqual(self.client.token, "test-token")
-        self.assertEqual(self.client.base_url, "https://gitlab.com/api/v4")
-        self.assertEqual(self.client.timeout, 30)
-        self.assertEqual(self.client.session.headers["PRIVATE-TOKEN"], "test-token")
+        assert client.token == "test-token"
+        assert client.base_url == "https://gitlab.com/api/v4"
+        assert client.timeout == 30
+        assert client.session.headers["PRIVATE-TOKEN"] == "test-token"
 
     def test_client_without_token(self):
         """Test client can be created without token."""
-        client = GitLabAPIClient()
-        self.assertIsNone(client.token)
-        self.assertNotIn("PRIVATE-TOKEN", client.session.headers)
+        client = GitLabAPIClient(session=SimpleNamespace(headers={}))
+        assert client.token is None
+        assert "PRIVATE-TOKEN" not in client.session.headers
+
+    def test_client_uses_injected_session(self):
+        """Test an injected session is used as-is and still gets the token header."""
+        session = SimpleNamespace(headers={})
 
-    def test_cache_key_generation(self):
+        client = GitLabAPIClient(token="test-token", base_url="https://gitlab.com/api/v4", session=session)
+
+        assert client.session is session
+        assert session.headers == {"PRIVATE-TOKEN": "test-token"}
+
+    def test_cache_key_generation(self, client):
         """Test cache key generation."""
-        key1 = self.client._get_cache_key("/projects/123")
-        key2 = self.client._get_cache_key("/projects/123", {"page": 1, "per_page": 10})
-        key3 = self.client._get_cache_key("/projects/123", {"per_page": 10, "page": 1})
+        key1 = client._get_cache_key("/projects/123")
+        key2 = client._get_cache_key("/projects/123", {"page": 1, "per_page": 10})
+        key3 = client._get_cache_key("/projects/123", {"per_page": 10, "page": 1})
 
-        self.assertEqual(key1, "/projects/123")
-        self.assertEqual(key2, key3)
-        self.assertIn("page=1", key2)
-        self.assertIn("per_page=10", key2)
+        assert key1 == "/projects/123"
+        assert key2 == key3
+        assert "page=1" in key2
+        assert "per_page=10" in key2
 
-    def test_cache_operations(self):
+    def test_cache_operations(self, client):
         """Test cache add, get, and expiry."""
         cache_key = "test_key"
         test_data = {"test": "data"}
 
-        self.client._add_to_cache(cache_key, test_data, ttl=1)
-        cached = self.client._get_from_cache(cache_key)
-        self.assertEqual(cached, test_data)
+        client._add_to_cache(cache_key, test_data, ttl=1)
+        cached = client._get_from_cache(cache_key)
+        assert cached == test_data
+
+        client._cache[cache_key].expires_at -= timedelta(seconds=2)  # Age the entry past its TTL
+        expired = client._get_from_cache(cache_key)
+        assert expired is None
+
+    def test_add_many_to_cache(self, client):
+        """Test bulk insert shares one expiry time across entries."""
+        client._add_many_to_cache({"key1": {"data": 1}, "key2": {"data": 2}}, ttl=60)
 
-        time.sleep(2)
-        expired = self.client._get_from_cache(cache_key)
-        self.assertIsNone(expired)
+        assert client._get_from_cache("key1") == {"data": 1}
+        assert client._get_from_cache("key2") == {"data": 2}
+        assert client._cache["key1"].expires_at == client._cache["key2"].expires_at
 
-    def test_clear_cache(self):
+    def test_clear_cache(self, client):
         """Test cache clearing."""
-        self.client._add_to_cache("key1", {"data": 1})
-        self.client._add_to_cache("key2", {"data": 2})
-        self.assertEqual(len(self.client._cache), 2)
+        client._add_many_to_cache({"key1": {"data": 1}, "key2": {"data": 2}})
+        assert len(client._cache) == 2
 
-        self.client.clear_cache()
-        self.assertEqual(len(self.client._cache), 0)
+        client.clear_cache()
+        assert len(client._cache) == 0
 
     @patch("requests.Session.request")
-    def test_make_request_success(self, mock_request):
+    def test_make_request_success(self, mock_request, client):
         """Test successful API request."""
-        mock_request.return_value = self.mock_response
+        mock_request.return_value = make_response()
 
-        result = self.client.get("/projects/123")
+        result = client.get("/projects/123")
 
-        self.assertEqual(result, {"data": "test"})
+        assert result == {"data": "test"}
         mock_request.assert_called_once()
-        self.assertEqual(self.client._rate_limit_remaining, 100)
+        assert client._rate_limit_remaining == 100
 
     @patch("requests.Session.request")
-    def test_caching_get_request(self, mock_request):
+    def test_caching_get_request(self, mock_request, client):
         """Test GET request caching."""
-        mock_request.return_value = self.mock_response
+        mock_request.return_value = make_response()
 
-        result1 = self.client.get("/projects/123", use_cache=True)
-        self.assertEqual(mock_request.call_count, 1)
+        result1 = client.get("/projects/123", use_cache=True)
+        assert mock_request.call_count == 1
 
-        result2 = self.client.get("/projects/123", use_cache=True)
-        self.assertEqual(mock_request.call_count, 1)
-        self.assertEqual(result1, result2)
+        result2 = client.get("/projects/123", use_cache=True)
+        assert mock_request.call_count == 1
+        assert result1 == result2
 
+    @patch("thoth.ingestion.gitlab_api.time.sleep")
     @patch("requests.Session.request")
-    def test_rate_limit_handling(self, mock_request):
+    def test_rate_limit_handling(self, mock_request, mock_sleep, client):
         """Test rate limit handling."""
         rate_limit_response = Mock()
         rate_limit_response.status_code = 429
         rate_limit_response.headers = {"Retry-After": "1"}
 
-        success_response = Mock()
-        success_response.status_code = 200
-        success_response.headers = {
-            "RateLimit-Remaining": "100",
-            "RateLimit-Reset": str(int((datetime.now(tz=UTC) + timedelta(hours=1)).timestamp())),
-        }
-        success_response.json.return_value = {"data": "test"}
-        success_response.content = b'{"data": "test"}'
+        mock_request.side_effect = [rate_limit_response, make_response()]
 
-        mock_request.side_effect = [rate_limit_response, success_response]
+        result = client.get("/projects/123", use_cache=False)
 
-        result = self.client.get("/projects/123", use_cache=False)
-
-        self.assertEqual(result, {"data": "test"})
-        self.assertEqual(mock_request.call_count, 2)
+        assert result == {"data": "test"}
+        assert mock_request.call_count == 2
+        mock_sleep.assert_called_once_with(1)  # Honors Retry-After without waiting
 
     @patch("requests.Session.request")
-    def test_http_error_handling(self, mock_request):
+    def test_http_error_handling(self, mock_request, client):
         """Test HTTP error handling."""
         mock_request.side_effect = requests.exceptions.HTTPError("404 Not Found")
 
-        with self.assertRaises(GitLabAPIError):
-            self.client.get("/projects/999")
+        with pytest.raises(GitLabAPIError):
+            client.get("/projects/999")
 
     @patch("requests.Session.request")
-    def test_get_project(self, mock_request):
+    def test_get_project(self, mock_request, client):
         """Test get_project method."""
-        response = self._create_mock_response()
-        response.json.return_value = {
-            "id": 123,
-            "name": "test-project",
-            "path": "test-project",
-        }
-        mock_request.return_value = response
+        mock_request.return_value = make_response(
+            {
+                "id": 123,
+                "name": "test-project",
+                "path": "test-project",
+            }
+        )
 
-        result = self.client.get_project("123")
+        result = client.get_project("123")
 
-        self.assertEqual(result["id"], 123)
-        self.assertEqual(result["name"], "test-project")
+        assert result["id"] == 123
+        assert result["name"] == "test-project"
 
     @patch("requests.Session.request")
-    def test_get_commits(self, mock_request):
+    def test_get_commits(self, mock_request, client):
         """Test get_commits method."""
-        response = self._create_mock_response()
-        response.json.return_value = [
-            {"id": "abc123", "message": "commit 1"},
-            {"id": "def456", "message": "commit 2"},
-        ]
-        mock_request.return_value = response
+        mock_request.return_value = make_response(
+            [
+                {"id": "abc123", "message": "commit 1"},
+                {"id": "def456", "message": "commit 2"},
+            ]
+        )
 
-        result = self.client.get_commits("123", ref="main", since="2024-01-01")
+        result = client.get_commits("123", ref="main", since="2024-01-01")
 
-        self.assertEqual(len(result), 2)
+        assert len(result) == 2
         call_kwargs = mock_request.call_args[1]
-        self.assertEqual(call_kwargs["params"]["since"], "2024-01-01")
+        assert call_kwargs["params"]["since"] == "2024-01-01"
 
     @patch("requests.Session.request")
-    def test_get_current_user(self, mock_request):
+    def test_get_current_user(self, mock_request, client):
         """Test get_current_user method."""
-        response = self._create_mock_response()
-        response.json.return_value = {
-            "id": 1,
-            "username": "testuser",
-        }
-        mock_request.return_value = response
+        mock_request.return_value = make_response(
+            {
+                "id": 1,
+                "username": "testuser",
+            }
+        )
 
-        result = self.client.get_current_user()
+        result = client.get_current_user()
 
-        self.assertEqual(result["username"], "testuser")
+        assert result["username"] == "testuser"
 
     def test_get_current_user_without_token(self):
         """Test get_current_user fails without token."""
-        client = GitLabAPIClient()
+        client = GitLabAPIClient(session=SimpleNamespace(headers={}))
 
-        with self.assertRaises(GitLabAPIError) as exc_info:
+        with pytest.raises(GitLabAPIError, match="Authentication token required"):
             client.get_current_user()
 
-        self.assertIn("Authentication token required", str(exc_info.exception))
-
-    def test_get_rate_limit_info(self):
+    def test_get_rate_limit_info(self, client):
         """Test get_rate_limit_info method."""
-        self.client._rate_limit_remaining = 50
-        self.client._rate_limit_reset = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
-
-        info = self.client.get_rate_limit_info()
-
-        self.assertEqual(info["remaining"], 50)
-        self.assertIn("2024-01-01", info["reset_at"])
+        client._rate_limit_remaining = 50
+        client._rate_limit_reset = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
 
+        info = client.get_rate_limit_info()
 
-if __name__ == "__main__":
-    unittest.main()
+        assert info["remaining"] == 50
+        assert "2024-01-01" in info["reset_at"]
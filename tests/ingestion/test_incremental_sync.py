@@ -1,7 +1,6 @@
 """Tests for incremental sync functionality."""
 
-import contextlib
-import json
+from types import SimpleNamespace
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
@@ -10,17 +9,49 @@ from thoth.ingestion.pipeline import IngestionPipeline
 from thoth.ingestion.repo_manager import HandbookRepoManager
 from thoth.shared.vector_store import VectorStore
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; json.loads also accepts bytes
+    from json import loads as json_loads
+
+
+def make_chunk(content, chunk_id="chunk_1", **metadata):
+    """Build a plain stand-in for a Chunk; the pipeline only reads these attributes."""
+    return SimpleNamespace(
+        content=content,
+        metadata=SimpleNamespace(chunk_id=chunk_id, to_dict=lambda: dict(metadata)),
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_embedder():
+    """Create a stateless embedder stand-in returning fixed 384-d vectors."""
+    embedder = MagicMock()
+    embedder.model_name = "mock-model"
+    embedder.get_embedding_dimension.return_value = 384
+    embedder.embed.side_effect = lambda texts, **_kwargs: [[0.1] * 384] * len(texts)
+    embedder.embed_single.return_value = [0.1] * 384
+    return embedder
+
 
 class TestIncrementalSync:
     """Test suite for incremental sync functionality."""
 
     @pytest.fixture
-    def mock_repo_manager(self, tmp_path):
-        """Create a mock repository manager."""
-        manager = Mock(spec=HandbookRepoManager)
-        manager.clone_path = tmp_path / "handbook"
-        manager.clone_path.mkdir(parents=True)
-        return manager
+    def clone_path(self, tmp_path):
+        """Create an empty handbook clone directory."""
+        path = tmp_path / "handbook"
+        path.mkdir(parents=True)
+        return path
+
+    @pytest.fixture
+    def vector_store(self, tmp_path, mock_embedder):
+        """Create an empty VectorStore in a temporary directory."""
+        return VectorStore(
+            persist_directory=str(tmp_path),
+            collection_name="test_collection",
+            embedder=mock_embedder,
+        )
 
     @pytest.fixture
     def sample_file_changes(self):
@@ -31,56 +62,66 @@ class TestIncrementalSync:
             "deleted": ["deprecated/old.md"],
         }
 
-    def test_get_file_changes_categorizes_correctly(self, mock_repo_manager):
-        """Test that get_file_changes correctly categorizes changes."""
+    @pytest.mark.parametrize(
+        ("diff_output", "expected"),
+        [
+            (
+                "A\tdocs/new.md\nM\tdocs/modified.md\nD\tdocs/deleted.md\nR100\told_name.md\tnew_name.md",
+                {
+                    "added": ["docs/new.md", "new_name.md"],
+                    "modified": ["docs/modified.md"],
+                    # Renamed files should appear as delete old + add new
+                    "deleted": ["docs/deleted.md", "old_name.md"],
+                },
+            ),
+            # R100 indicates 100% similarity (renamed file)
+            ("R100\told/path.md\tnew/path.md", {"added": ["new/path.md"], "modified": [], "deleted": ["old/path.md"]}),
+            (
+                "C075\tsource.md\tcopy.md\nT\tlink.md\nR100\tlonely.md",
+                {"added": ["copy.md"], "modified": ["link.md", "lonely.md"], "deleted": []},
+            ),
+            (
+                "A\tdocs/new.md\nR100\told.md\tnew.md\textra.md",
+                {"added": ["docs/new.md"], "modified": ["old.md\tnew.md\textra.md"], "deleted": []},
+            ),
+            ("", {"added": [], "modified": [], "deleted": []}),
+        ],
+        ids=["categorized", "renamed", "copies-and-unknown-status", "extra-fields", "no-changes"],
+    )
+    def test_get_file_changes(self, clone_path, diff_output, expected):
+        """Test that get_file_changes categorizes each kind of diff line."""
         manager = HandbookRepoManager()
-        manager.clone_path = mock_repo_manager.clone_path
+        manager.clone_path = clone_path
 
-        # Create a mock repository
         with patch("thoth.ingestion.repo_manager.Repo") as mock_repo:
-            mock_git = Mock()
-            # fmt: off
-            mock_git.diff.return_value = (
-                "A\tdocs/new.md\n"
-                "M\tdocs/modified.md\n"
-                "D\tdocs/deleted.md\n"
-                "R100\told_name.md\tnew_name.md"
-            )
-            # fmt: on
-            mock_repo.return_value.git = mock_git
+            mock_repo.return_value.git.diff.return_value = diff_output
 
             result = manager.get_file_changes("abc123")
 
-            assert result is not None
-            assert "docs/new.md" in result["added"]
-            assert "docs/modified.md" in result["modified"]
-            assert "docs/deleted.md" in result["deleted"]
-            # Renamed files should appear as delete old + add new
-            assert "old_name.md" in result["deleted"]
-            assert "new_name.md" in result["added"]
+        assert result == expected
 
-    def test_get_file_changes_handles_no_changes(self, mock_repo_manager):
-        """Test that get_file_changes handles no changes correctly."""
+    def test_get_file_changes_warns_on_unrecognized_lines(self, clone_path):
+        """Test unparseable diff lines are logged and kept in order, and tab-less lines skipped."""
         manager = HandbookRepoManager()
-        manager.clone_path = mock_repo_manager.clone_path
+        manager.clone_path = clone_path
+        manager.logger = Mock()
 
         with patch("thoth.ingestion.repo_manager.Repo") as mock_repo:
-            mock_git = Mock()
-            mock_git.diff.return_value = ""
-            mock_repo.return_value.git = mock_git
+            mock_repo.return_value.git.diff.return_value = "M\ta.md\tb.md\tc.md\nM\tok.md\nM"
 
             result = manager.get_file_changes("abc123")
 
-            assert result == {"added": [], "modified": [], "deleted": []}
+        assert result["modified"] == ["a.md\tb.md\tc.md", "ok.md"]
+        manager.logger.warning.assert_called_once()
 
     def test_handle_deleted_files_removes_from_vector_store(self, tmp_path):
         """Test that deleted files are removed from vector store."""
         # Setup
         mock_vector_store = Mock()
-        mock_vector_store.delete_by_file_path.return_value = 5  # 5 chunks deleted
+        mock_vector_store.delete_by_file_paths.return_value = {"file1.md": 5, "file2.md": 5}  # 5 chunks each
 
-        pipeline = IngestionPipeline(vector_store=mock_vector_store)
-        pipeline.state.processed_files = ["file1.md", "file2.md", "file3.md"]
+        pipeline = IngestionPipeline(embedder=Mock(), vector_store=mock_vector_store)
+        pipeline.state.processed_files = {"file1.md", "file2.md", "file3.md"}
         pipeline.state.total_chunks = 100
         pipeline.state.total_documents = 100
 
@@ -96,7 +137,7 @@ class TestIncrementalSync:
         assert "file2.md" not in pipeline.state.processed_files
         assert "file3.md" in pipeline.state.processed_files
         assert pipeline.state.total_chunks == 90  # 100 - (5 * 2)
-        assert mock_vector_store.delete_by_file_path.call_count == 2
+        mock_vector_store.delete_by_file_paths.assert_called_once_with(deleted_files)
 
     def test_handle_modified_files_updates_vector_store(self, tmp_path):
         """Test that modified files are updated in vector store."""
@@ -112,12 +153,8 @@ class TestIncrementalSync:
         mock_vector_store.delete_by_file_path.return_value = 3  # 3 old chunks
 
         mock_chunker = Mock()
-        mock_chunk = Mock()
-        mock_chunk.content = "Modified content"
-        mock_chunk.metadata = Mock()
-        mock_chunk.metadata.chunk_id = "chunk_1"
-        mock_chunk.metadata.to_dict.return_value = {"file_path": "test.md"}
-        mock_chunker.chunk_file.return_value = [mock_chunk, mock_chunk]  # 2 new chunks
+        chunk = make_chunk("Modified content", file_path="test.md")
+        mock_chunker.chunk_file.return_value = [chunk, chunk]  # 2 new chunks
 
         mock_embedder = Mock()
         mock_embedder.embed.return_value = [[0.1] * 384, [0.2] * 384]
@@ -155,108 +192,61 @@ class TestIncrementalSync:
         (repo_path / "README.md").write_text("# README")
 
         mock_repo_manager = Mock()
-        mock_repo_manager.clone_path = repo_path
-        mock_repo_manager.get_current_commit.return_value = "def456"
         mock_repo_manager.get_file_changes.return_value = {
             "added": ["doc.md", "image.png", "script.py"],
             "modified": ["README.md", "data.json"],
             "deleted": ["old.md", "old.txt"],
         }
-        mock_repo_manager.update_repository.return_value = True
-
-        mock_vector_store = Mock()
-        mock_vector_store.delete_by_file_path.return_value = 0
 
-        mock_chunker = Mock()
-        mock_chunker.chunk_file.return_value = []
-
-        pipeline = IngestionPipeline(
-            repo_manager=mock_repo_manager,
-            chunker=mock_chunker,
-            vector_store=mock_vector_store,
-        )
+        pipeline = IngestionPipeline(repo_manager=mock_repo_manager, vector_store=Mock())
         pipeline.state.last_commit = "abc123"
 
-        with patch.object(pipeline, "_discover_markdown_files") as mock_discover:
-            mock_discover.return_value = [repo_path / "doc.md", repo_path / "README.md"]
+        with patch.object(pipeline, "_discover_markdown_files", return_value=[]):
+            added, modified, deleted = pipeline._resolve_files_to_process(repo_path, incremental=True)
 
-            # Execute (will fail at save_metadata, but that's OK for this test)
-            with contextlib.suppress(Exception):
-                pipeline.run(incremental=True)
-
-        # Verify only markdown files were considered
-        call_args = mock_repo_manager.get_file_changes.call_args
-        assert call_args[0][0] == "abc123"
-
-        # Check that only .md files would be processed
-        # (we can't easily verify the actual processing without more mocking)
+        mock_repo_manager.get_file_changes.assert_called_once_with("abc123")
+        assert added == [repo_path / "doc.md"]
+        assert modified == [repo_path / "README.md"]
+        assert deleted == ["old.md"]
 
     def test_full_mode_processes_all_files(self, tmp_path):
         """Test that full mode processes all files regardless of changes."""
         repo_path = tmp_path / "repo"
-        repo_path.mkdir()
-
-        (repo_path / "doc.md").write_text("# Doc")
+        all_files = [repo_path / "doc.md"]
 
         mock_repo_manager = Mock()
-        mock_repo_manager.clone_path = repo_path
-        mock_repo_manager.get_current_commit.return_value = "def456"
-        mock_repo_manager.update_repository.return_value = True
 
-        mock_chunker = Mock()
-        mock_chunker.chunk_file.return_value = []
-
-        mock_vector_store = Mock()
-
-        pipeline = IngestionPipeline(
-            repo_manager=mock_repo_manager,
-            chunker=mock_chunker,
-            vector_store=mock_vector_store,
-        )
-
-        with patch.object(pipeline, "_discover_markdown_files") as mock_discover:
-            mock_discover.return_value = [repo_path / "doc.md"]
+        pipeline = IngestionPipeline(repo_manager=mock_repo_manager, vector_store=Mock())
+        pipeline.state.last_commit = "abc123"
 
-            with contextlib.suppress(Exception):
-                pipeline.run(incremental=False)
+        with patch.object(pipeline, "_discover_markdown_files", return_value=all_files):
+            added, modified, deleted = pipeline._resolve_files_to_process(repo_path, incremental=False)
 
         # Verify get_file_changes was NOT called in full mode
         assert not mock_repo_manager.get_file_changes.called
+        assert (added, modified, deleted) == (all_files, [], [])
 
     def test_error_handling_in_deleted_files(self, tmp_path):
         """Test error handling when deleting files fails."""
         mock_vector_store = Mock()
-        mock_vector_store.delete_by_file_path.side_effect = [
-            5,
-            Exception("Delete failed"),
-        ]
+        mock_vector_store.delete_by_file_paths.side_effect = Exception("Delete failed")
 
-        pipeline = IngestionPipeline(vector_store=mock_vector_store)
-        pipeline.state.processed_files = ["file1.md", "file2.md"]
+        pipeline = IngestionPipeline(embedder=Mock(), vector_store=mock_vector_store)
+        pipeline.state.processed_files = {"file1.md", "file2.md"}
         pipeline.state.failed_files = {}
 
         deleted_files = ["file1.md", "file2.md"]
 
         successful, failed = pipeline._handle_deleted_files(deleted_files)
 
-        assert successful == 1
-        assert failed == 1
-        assert "file2.md" in pipeline.state.failed_files
+        assert successful == 0
+        assert failed == 2
+        assert pipeline.state.processed_files == {"file1.md", "file2.md"}
+        assert "Delete failed" in pipeline.state.failed_files["file1.md"]
         assert "Delete failed" in pipeline.state.failed_files["file2.md"]
 
-    def test_vector_store_delete_by_file_path(self, tmp_path):
+    def test_vector_store_delete_by_file_path(self, vector_store):
         """Test delete_by_file_path removes documents with the given file_path."""
-        mock_embedder = MagicMock()
-        mock_embedder.model_name = "mock-model"
-        mock_embedder.get_embedding_dimension.return_value = 384
-        mock_embedder.embed.side_effect = lambda texts, **kwargs: [[0.1] * 384] * len(texts)
-        mock_embedder.embed_single.return_value = [0.1] * 384
-
-        vector_store = VectorStore(
-            persist_directory=str(tmp_path),
-            collection_name="test_collection",
-            embedder=mock_embedder,
-        )
         vector_store.add_documents(
             documents=["doc 1", "doc 2", "doc 3"],
             ids=["id1", "id2", "id3"],
@@ -273,19 +263,8 @@ class TestIncrementalSync:
         assert count == 3
         assert vector_store.get_document_count() == 0
 
-    def test_vector_store_delete_by_file_path_no_documents(self, tmp_path):
+    def test_vector_store_delete_by_file_path_no_documents(self, vector_store):
         """Test delete_by_file_path when no documents match returns 0."""
-        mock_embedder = MagicMock()
-        mock_embedder.model_name = "mock-model"
-        mock_embedder.get_embedding_dimension.return_value = 384
-        mock_embedder.embed.side_effect = lambda texts, **kwargs: [[0.1] * 384] * len(texts)
-        mock_embedder.embed_single.return_value = [0.1] * 384
-
-        vector_store = VectorStore(
-            persist_directory=str(tmp_path),
-            collection_name="test_collection",
-            embedder=mock_embedder,
-        )
         vector_store.add_documents(
             documents=["doc 1"],
             metadatas=[{"file_path": "other/path.md"}],
@@ -296,25 +275,6 @@ class TestIncrementalSync:
         assert count == 0
         assert vector_store.get_document_count() == 1
 
-    def test_renamed_files_handled_correctly(self, tmp_path):
-        """Test that renamed files are handled as delete + add."""
-        manager = HandbookRepoManager()
-        manager.clone_path = tmp_path / "handbook"
-        manager.clone_path.mkdir(parents=True)
-
-        with patch("thoth.ingestion.repo_manager.Repo") as mock_repo:
-            mock_git = Mock()
-            # R100 indicates 100% similarity (renamed file)
-            mock_git.diff.return_value = "R100\told/path.md\tnew/path.md"
-            mock_repo.return_value.git = mock_git
-
-            result = manager.get_file_changes("abc123")
-
-            assert result is not None
-            assert "old/path.md" in result["deleted"]
-            assert "new/path.md" in result["added"]
-            assert len(result["modified"]) == 0
-
     def test_state_persistence_after_incremental_update(self, tmp_path):
         """Test that state is correctly saved after incremental updates."""
         repo_path = tmp_path / "repo"
@@ -346,12 +306,7 @@ class TestIncrementalSync:
         with patch.object(pipeline, "_discover_markdown_files") as mock_discover:
             mock_discover.return_value = [repo_path / "new.md"]
             with patch.object(pipeline, "_process_file") as mock_process:
-                mock_chunk = Mock()
-                mock_chunk.content = "content"
-                mock_chunk.metadata = Mock()
-                mock_chunk.metadata.chunk_id = "chunk_1"
-                mock_chunk.metadata.to_dict.return_value = {}
-                mock_process.return_value = [mock_chunk]
+                mock_process.return_value = [make_chunk("content")]
 
                 with patch.object(pipeline.embedder, "embed") as mock_embed:
                     mock_embed.return_value = [[0.1] * 384]
@@ -360,10 +315,9 @@ class TestIncrementalSync:
 
         # Verify state was saved
         assert state_file.exists()
-        with state_file.open() as f:
-            state_data = json.load(f)
-            assert state_data["last_commit"] == "new_commit"
-            assert state_data["completed"] is True
+        state_data = json_loads(state_file.read_bytes())
+        assert state_data["last_commit"] == "new_commit"
+        assert state_data["completed"] is True
 
 
 if __name__ == "__main__":
@@ -1,8 +1,13 @@
 """Tests for job manager module."""
 
+from dataclasses import replace
 from datetime import UTC, datetime
 import sys
-from unittest.mock import MagicMock, patch
+import types
+from unittest.mock import patch
+import uuid
+
+import pytest
 
 from thoth.ingestion.job_manager import (
     Job,
@@ -11,88 +16,100 @@ from thoth.ingestion.job_manager import (
     JobStatus,
 )
 
+# Keep this module on one xdist worker so the fake firestore modules are installed once
+pytestmark = pytest.mark.xdist_group("job_manager")
+
+# Every JobStatus member keyed by its stored string value
+JOB_STATUS_VALUES = {
+    "pending": JobStatus.PENDING,
+    "running": JobStatus.RUNNING,
+    "completed": JobStatus.COMPLETED,
+    "failed": JobStatus.FAILED,
+}
+
+# JobStats.to_dict() of a default-constructed JobStats
+EMPTY_STATS_DICT = {
+    "total_files": 0,
+    "processed_files": 0,
+    "failed_files": 0,
+    "total_chunks": 0,
+    "total_documents": 0,
+}
+
+# Fixed start time so the job fixtures below are deterministic
+STARTED_AT = datetime(2024, 1, 15, 10, 0, tzinfo=UTC)
+
+# Clock reading and job ID seen by JobManager while frozen_clock is active
+FROZEN_NOW = datetime(2024, 1, 15, 10, 30, tzinfo=UTC)
+FROZEN_JOB_ID = uuid.UUID(int=0)
+
+# Canonical job shared read-only by the tests; copy with replace() before changing it
+PENDING_JOB = Job(
+    job_id="test-123",
+    status=JobStatus.PENDING,
+    source="handbook",
+    collection_name="handbook_documents",
+    started_at=STARTED_AT,
+)
+
+# Stored form shared by the seeded jobs; make_job_dict copies it and fills in the identity fields
+JOB_DICT_TEMPLATE = {
+    "job_id": None,
+    "status": None,
+    "source": None,
+    "collection_name": None,
+    "started_at": STARTED_AT.isoformat(),  # String format for serialization
+    "stats": {},
+}
+
+# Stored form of a finished job as read back from Firestore
+COMPLETED_JOB_DICT = {
+    "job_id": "test-789",
+    "status": "completed",
+    "source": "personal",
+    "collection_name": "personal_documents",
+    "started_at": "2024-01-15T10:00:00+00:00",
+    "completed_at": "2024-01-15T10:30:00+00:00",
+    "stats": {"total_files": 100, "processed_files": 100},
+    "error": None,
+}
+
 
 class TestJobStatus:
     """Tests for JobStatus enum."""
 
     def test_status_values(self):
-        """Test JobStatus enum values."""
-        assert JobStatus.PENDING.value == "pending"
-        assert JobStatus.RUNNING.value == "running"
-        assert JobStatus.COMPLETED.value == "completed"
-        assert JobStatus.FAILED.value == "failed"
-
-    def test_status_from_string(self):
-        """Test creating status from string."""
-        assert JobStatus("pending") == JobStatus.PENDING
-        assert JobStatus("running") == JobStatus.RUNNING
-        assert JobStatus("completed") == JobStatus.COMPLETED
-        assert JobStatus("failed") == JobStatus.FAILED
+        """Test every JobStatus member round-trips through its string value."""
+        assert {member.value: member for member in JobStatus} == JOB_STATUS_VALUES
+        for value, member in JOB_STATUS_VALUES.items():
+            assert JobStatus(value) is member
 
 
 class TestJobStats:
     """Tests for JobStats dataclass."""
 
-    def test_default_values(self):
-        """Test default JobStats values."""
-        stats = JobStats()
-
-        assert stats.total_files == 0
-        assert stats.processed_files == 0
-        assert stats.failed_files == 0
-        assert stats.total_chunks == 0
-        assert stats.total_documents == 0
-
-    def test_custom_values(self):
-        """Test JobStats with custom values."""
-        stats = JobStats(
-            total_files=100,
-            processed_files=95,
-            failed_files=5,
-            total_chunks=500,
-            total_documents=1000,
-        )
-
-        assert stats.total_files == 100
-        assert stats.processed_files == 95
-        assert stats.failed_files == 5
-        assert stats.total_chunks == 500
-        assert stats.total_documents == 1000
-
-    def test_to_dict(self):
-        """Test converting stats to dictionary."""
-        stats = JobStats(
-            total_files=50,
-            processed_files=45,
-            failed_files=5,
-            total_chunks=200,
-            total_documents=400,
-        )
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {
+                "total_files": 100,
+                "processed_files": 95,
+                "failed_files": 5,
+                "total_chunks": 500,
+                "total_documents": 1000,
+            },
+        ],
+        ids=["defaults", "custom"],
+    )
+    def test_dict_round_trip(self, kwargs):
+        """Test to_dict output and that from_dict rebuilds an equal JobStats."""
+        stats = JobStats(**kwargs)
 
         result = stats.to_dict()
 
-        assert isinstance(result, dict)
-        assert result["total_files"] == 50
-        assert result["processed_files"] == 45
-        assert result["failed_files"] == 5
-        assert result["total_chunks"] == 200
-        assert result["total_documents"] == 400
-
-    def test_from_dict(self):
-        """Test creating stats from dictionary."""
-        data = {
-            "total_files": 100,
-            "processed_files": 90,
-            "failed_files": 10,
-            "total_chunks": 300,
-            "total_documents": 600,
-        }
-
-        stats = JobStats.from_dict(data)
-
-        assert stats.total_files == 100
-        assert stats.processed_files == 90
-        assert stats.failed_files == 10
+        assert result == {**EMPTY_STATS_DICT, **kwargs}
+        assert JobStats.from_dict(result) == stats
 
     def test_from_dict_missing_keys(self):
         """Test from_dict with missing keys uses defaults."""
@@ -109,32 +126,24 @@ class TestJob:
 
     def test_job_creation(self):
         """Test creating a Job."""
-        now = datetime.now(UTC)
-        job = Job(
-            job_id="test-123",
-            status=JobStatus.PENDING,
-            source="handbook",
-            collection_name="handbook_documents",
-            started_at=now,
-        )
+        job = PENDING_JOB
 
         assert job.job_id == "test-123"
         assert job.status == JobStatus.PENDING
         assert job.source == "handbook"
         assert job.collection_name == "handbook_documents"
-        assert job.started_at == now
+        assert job.started_at == STARTED_AT
         assert job.completed_at is None
         assert job.error is None
 
     def test_job_to_dict(self):
         """Test converting job to dictionary."""
-        now = datetime.now(UTC)
-        job = Job(
+        job = replace(
+            PENDING_JOB,
             job_id="test-456",
             status=JobStatus.RUNNING,
             source="dnd",
             collection_name="dnd_documents",
-            started_at=now,
             stats=JobStats(total_files=10, processed_files=5),
         )
 
@@ -145,24 +154,12 @@ class TestJob:
         assert result["status"] == "running"
         assert result["source"] == "dnd"
         assert result["collection_name"] == "dnd_documents"
-        assert "started_at" in result
-        assert "stats" in result
+        assert result["started_at"] == STARTED_AT.isoformat()
         assert result["stats"]["total_files"] == 10
 
     def test_job_from_dict(self):
         """Test creating job from dictionary."""
-        data = {
-            "job_id": "test-789",
-            "status": "completed",
-            "source": "personal",
-            "collection_name": "personal_documents",
-            "started_at": "2024-01-15T10:00:00+00:00",
-            "completed_at": "2024-01-15T10:30:00+00:00",
-            "stats": {"total_files": 100, "processed_files": 100},
-            "error": None,
-        }
-
-        job = Job.from_dict(data)
+        job = Job.from_dict(COMPLETED_JOB_DICT)
 
         assert job.job_id == "test-789"
         assert job.status == JobStatus.COMPLETED
@@ -171,47 +168,177 @@ class TestJob:
 
     def test_job_with_error(self):
         """Test job with error."""
-        job = Job(
-            job_id="error-job",
-            status=JobStatus.FAILED,
-            source="handbook",
-            collection_name="handbook_documents",
-            started_at=datetime.now(UTC),
-            error="Something went wrong",
-        )
+        job = replace(PENDING_JOB, status=JobStatus.FAILED, error="Something went wrong")
 
         assert job.status == JobStatus.FAILED
         assert job.error == "Something went wrong"
 
 
+class FakeDoc:
+    """Firestore document snapshot holding a plain dict."""
+
+    def __init__(self, data=None):
+        self._data = data
+        self.exists = data is not None
+
+    def to_dict(self):
+        return self._data
+
+
+class FakeDocRef:
+    """Reference to one document ID in a FakeCollection."""
+
+    def __init__(self, docs, doc_id):
+        self._docs = docs
+        self._doc_id = doc_id
+
+    def get(self):
+        return FakeDoc(self._docs.get(self._doc_id))
+
+    def set(self, data):
+        self._docs[self._doc_id] = data
+
+    def delete(self):
+        self._docs.pop(self._doc_id, None)
+
+
+class FakeQuery:
+    """Query over a snapshot of documents; only equality filters are applied."""
+
+    def __init__(self, docs):
+        self._docs = docs
+
+    def where(self, field, op, value):
+        if op == "==":
+            return FakeQuery([doc for doc in self._docs if doc.get(field) == value])
+        return self
+
+    def order_by(self, *args, **kwargs):
+        return self
+
+    def limit(self, n):
+        return FakeQuery(self._docs[:n])
+
+    def stream(self):
+        return iter(FakeDoc(doc) for doc in self._docs)
+
+
+class FakeCollection:
+    """In-memory Firestore collection; tests read and seed ``docs`` directly."""
+
+    def __init__(self):
+        self.docs = {}
+
+    def document(self, doc_id):
+        return FakeDocRef(self.docs, doc_id)
+
+    def where(self, *args, **kwargs):
+        return FakeQuery(list(self.docs.values())).where(*args, **kwargs)
+
+    def order_by(self, *args, **kwargs):
+        return FakeQuery(list(self.docs.values()))
+
+
+class FakeFirestore:
+    """Stand-in for the google.cloud.firestore module and its Client.
+
+    Plain methods avoid building MagicMock attribute chains on every call.
+    """
+
+    def __init__(self):
+        self.project = None
+        self.collections = {}
+
+    def Client(self, project=None):  # noqa: N802 - mirrors firestore.Client
+        self.project = project
+        return self
+
+    def collection(self, name):
+        return self.collections.setdefault(name, FakeCollection())
+
+
+@pytest.fixture(scope="module")
+def firestore_module():
+    """Install a fake google.cloud.firestore once for every test in this module."""
+    fake_firestore = FakeFirestore()
+    fake_google_cloud = types.ModuleType("google.cloud")
+    fake_google_cloud.firestore = fake_firestore
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "google.cloud", fake_google_cloud)
+        mp.setitem(sys.modules, "google.cloud.firestore", fake_firestore)
+        yield fake_firestore
+
+
+class FrozenDatetime(datetime):
+    """datetime whose now() always returns FROZEN_NOW."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return FROZEN_NOW
+
+
+@pytest.fixture(scope="module")
+def frozen_clock():
+    """Freeze the job manager's clock and job IDs for the whole module."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("thoth.ingestion.job_manager.datetime", FrozenDatetime)
+        mp.setattr("thoth.ingestion.job_manager.uuid", types.SimpleNamespace(uuid4=lambda: FROZEN_JOB_ID))
+        yield
+
+
+@pytest.fixture(scope="class")
+def manager(firestore_module):
+    """Create one initialized JobManager per test class."""
+    job_manager = JobManager(project_id="test-project")
+    _ = job_manager.collection  # Trigger lazy initialization once
+    return job_manager
+
+
+@pytest.fixture
+def collection(manager):
+    """Hand each test the shared manager's collection with no stored jobs."""
+    manager.collection.docs.clear()
+    return manager.collection
+
+
+@pytest.fixture
+def update_job():
+    """Stub out JobManager.update_job so state-transition tests skip Firestore writes."""
+    with patch.object(JobManager, "update_job", autospec=True) as mock_update_job:
+        yield mock_update_job
+
+
+def make_job(status):
+    """Copy the canonical pending job into the given status."""
+    return replace(PENDING_JOB, status=status)
+
+
+def make_job_dict(job_id, status, source, collection_name):
+    """Build the stored Firestore form of a job from JOB_DICT_TEMPLATE."""
+    job_dict = JOB_DICT_TEMPLATE.copy()
+    job_dict["job_id"] = job_id
+    job_dict["status"] = status
+    job_dict["source"] = source
+    job_dict["collection_name"] = collection_name
+    return job_dict
+
+
+@pytest.mark.usefixtures("frozen_clock")
 class TestJobManager:
-    """Tests for JobManager class."""
+    """Tests for JobManager class.
 
-    def _create_mock_firestore(self):
-        """Create a mock firestore module and client."""
-        mock_firestore = MagicMock()
-        mock_db = MagicMock()
-        mock_firestore.Client.return_value = mock_db
-        return mock_firestore, mock_db
+    test_create_job and test_update_job cover the Firestore writes; the
+    mark_* tests stub update_job and only check the job's state transitions.
+    """
 
-    def test_init_with_project_id(self):
+    def test_init_with_project_id(self, firestore_module):
         """Test initialization with project ID."""
-        mock_firestore, _mock_db = self._create_mock_firestore()
-        mock_google_cloud = MagicMock()
-        mock_google_cloud.firestore = mock_firestore
-
-        with patch.dict(
-            sys.modules,
-            {
-                "google.cloud": mock_google_cloud,
-                "google.cloud.firestore": mock_firestore,
-            },
-        ):
-            manager = JobManager(project_id="test-project")
-            # Access collection to trigger initialization
-            _ = manager.collection
+        manager = JobManager(project_id="test-project")
+        # Access collection to trigger initialization
+        _ = manager.collection
 
-        mock_firestore.Client.assert_called_once_with(project="test-project")
+        assert firestore_module.project == "test-project"
+        assert manager.collection is firestore_module.collection(JobManager.COLLECTION_NAME)
 
     def test_init_lazy(self):
         """Test that initialization is lazy."""
@@ -219,232 +346,77 @@ class TestJobManager:
         # DB should be None until first access
         assert manager._db is None
 
-    def test_create_job(self):
+    def test_create_job(self, manager, collection):
         """Test creating a new job."""
-        mock_firestore, _mock_db = self._create_mock_firestore()
-        mock_google_cloud = MagicMock()
-        mock_google_cloud.firestore = mock_firestore
-
-        with patch.dict(
-            sys.modules,
-            {
-                "google.cloud": mock_google_cloud,
-                "google.cloud.firestore": mock_firestore,
-            },
-        ):
-            manager = JobManager(project_id="test-project")
-            job = manager.create_job("handbook", "handbook_documents")
+        job = manager.create_job("handbook", "handbook_documents")
 
         assert job.source == "handbook"
         assert job.collection_name == "handbook_documents"
         assert job.status == JobStatus.PENDING
-        assert job.job_id  # Should have a UUID
-
-    def test_get_job(self):
-        """Test getting a job by ID."""
-        mock_firestore, mock_db = self._create_mock_firestore()
-        mock_doc = MagicMock()
-        mock_doc.exists = True
-        started_at = datetime.now(UTC)
-        mock_doc.to_dict.return_value = {
-            "job_id": "test-job",
-            "status": "running",
-            "source": "handbook",
-            "collection_name": "handbook_documents",
-            "started_at": started_at.isoformat(),  # String format for serialization
-            "stats": {},
-        }
-        mock_db.collection.return_value.document.return_value.get.return_value = mock_doc
-
-        mock_google_cloud = MagicMock()
-        mock_google_cloud.firestore = mock_firestore
-
-        with patch.dict(
-            sys.modules,
-            {
-                "google.cloud": mock_google_cloud,
-                "google.cloud.firestore": mock_firestore,
-            },
-        ):
-            manager = JobManager(project_id="test-project")
-            job = manager.get_job("test-job")
-
-        assert job is not None
-        assert job.job_id == "test-job"
-        assert job.status == JobStatus.RUNNING
-
-    def test_get_job_not_found(self):
-        """Test getting a non-existent job."""
-        mock_firestore, mock_db = self._create_mock_firestore()
-        mock_doc = MagicMock()
-        mock_doc.exists = False
-        mock_db.collection.return_value.document.return_value.get.return_value = mock_doc
-
-        mock_google_cloud = MagicMock()
-        mock_google_cloud.firestore = mock_firestore
-
-        with patch.dict(
-            sys.modules,
-            {
-                "google.cloud": mock_google_cloud,
-                "google.cloud.firestore": mock_firestore,
-            },
-        ):
-            manager = JobManager(project_id="test-project")
-            job = manager.get_job("nonexistent")
-
-        assert job is None
-
-    def test_mark_running(self):
-        """Test marking a job as running."""
-        mock_firestore, _mock_db = self._create_mock_firestore()
-        mock_google_cloud = MagicMock()
-        mock_google_cloud.firestore = mock_firestore
-
-        with patch.dict(
-            sys.modules,
-            {
-                "google.cloud": mock_google_cloud,
-                "google.cloud.firestore": mock_firestore,
-            },
-        ):
-            manager = JobManager(project_id="test-project")
-            job = Job(
-                job_id="test-job",
-                status=JobStatus.PENDING,
-                source="handbook",
-                collection_name="handbook_documents",
-                started_at=datetime.now(UTC),
-            )
-
-            manager.mark_running(job)
-
-        assert job.status == JobStatus.RUNNING
-
-    def test_mark_completed(self):
-        """Test marking a job as completed."""
-        mock_firestore, _mock_db = self._create_mock_firestore()
-        mock_google_cloud = MagicMock()
-        mock_google_cloud.firestore = mock_firestore
-
-        with patch.dict(
-            sys.modules,
-            {
-                "google.cloud": mock_google_cloud,
-                "google.cloud.firestore": mock_firestore,
-            },
-        ):
-            manager = JobManager(project_id="test-project")
-            job = Job(
-                job_id="test-job",
-                status=JobStatus.RUNNING,
-                source="handbook",
-                collection_name="handbook_documents",
-                started_at=datetime.now(UTC),
-            )
-            stats = JobStats(total_files=100, processed_files=100)
-
-            manager.mark_completed(job, stats)
-
-        assert job.status == JobStatus.COMPLETED
-        assert job.stats == stats
-        assert job.completed_at is not None
-
-    def test_mark_failed(self):
-        """Test marking a job as failed."""
-        mock_firestore, _mock_db = self._create_mock_firestore()
-        mock_google_cloud = MagicMock()
-        mock_google_cloud.firestore = mock_firestore
-
-        with patch.dict(
-            sys.modules,
-            {
-                "google.cloud": mock_google_cloud,
-                "google.cloud.firestore": mock_firestore,
-            },
-        ):
-            manager = JobManager(project_id="test-project")
-            job = Job(
-                job_id="test-job",
-                status=JobStatus.RUNNING,
-                source="handbook",
-                collection_name="handbook_documents",
-                started_at=datetime.now(UTC),
-            )
-
-            manager.mark_failed(job, "Processing error")
-
-        assert job.status == JobStatus.FAILED
-        assert job.error == "Processing error"
-        assert job.completed_at is not None
-
-    def test_list_jobs(self):
+        assert job.job_id == str(FROZEN_JOB_ID)
+        assert job.started_at == FROZEN_NOW
+        assert collection.docs == {job.job_id: job.to_dict()}
+
+    @pytest.mark.parametrize("exists", [True, False], ids=["found", "not-found"])
+    def test_get_job(self, manager, collection, exists):
+        """Test getting a job by ID, or None when it does not exist."""
+        if exists:
+            collection.docs["test-job"] = make_job_dict("test-job", "running", "handbook", "handbook_documents")
+
+        job = manager.get_job("test-job")
+
+        if exists:
+            assert job.job_id == "test-job"
+            assert job.status == JobStatus.RUNNING
+        else:
+            assert job is None
+
+    @pytest.mark.parametrize(
+        ("action", "args", "expected"),
+        [
+            ("mark_running", (), {"status": JobStatus.RUNNING}),
+            (
+                "mark_completed",
+                (JobStats(total_files=100, processed_files=100),),
+                {"status": JobStatus.COMPLETED, "stats": JobStats(total_files=100, processed_files=100)},
+            ),
+            ("mark_failed", ("Processing error",), {"status": JobStatus.FAILED, "error": "Processing error"}),
+        ],
+        ids=["running", "completed", "failed"],
+    )
+    def test_mark_status(self, manager, update_job, action, args, expected):
+        """Test each mark_* method sets the status, its extra fields and the completion time."""
+        job = make_job(JobStatus.PENDING)
+
+        getattr(manager, action)(job, *args)
+
+        assert {name: getattr(job, name) for name in expected} == expected
+        assert job.completed_at == (None if action == "mark_running" else FROZEN_NOW)
+        update_job.assert_called_once_with(manager, job)
+
+    def test_update_job(self, manager, collection):
+        """Test update_job writes the serialized job under its ID."""
+        job = make_job(JobStatus.RUNNING)
+
+        manager.update_job(job)
+
+        assert collection.docs == {job.job_id: job.to_dict()}
+
+    def test_list_jobs(self, manager, collection):
         """Test listing jobs."""
-        mock_firestore, mock_db = self._create_mock_firestore()
-
-        # Create mock documents with proper to_dict methods
-        def make_doc(job_id, status, source, collection_name):
-            doc = MagicMock()
-            started_at = datetime.now(UTC)
-            doc.to_dict.return_value = {
-                "job_id": job_id,
-                "status": status,
-                "source": source,
-                "collection_name": collection_name,
-                "started_at": started_at.isoformat(),
-                "stats": {},
-            }
-            return doc
-
-        mock_docs = [
-            make_doc("job-1", "completed", "handbook", "handbook_documents"),
-            make_doc("job-2", "running", "dnd", "dnd_documents"),
-        ]
-
-        # Set up mock collection to return a chainable query
-        mock_collection = MagicMock()
-        mock_collection.order_by.return_value.limit.return_value.stream.return_value = mock_docs
-        mock_db.collection.return_value = mock_collection
-
-        mock_google_cloud = MagicMock()
-        mock_google_cloud.firestore = mock_firestore
-
-        with patch.dict(
-            sys.modules,
-            {
-                "google.cloud": mock_google_cloud,
-                "google.cloud.firestore": mock_firestore,
-            },
-        ):
-            manager = JobManager(project_id="test-project")
-            jobs = manager.list_jobs()
-
-        assert len(jobs) == 2
+        collection.docs["job-1"] = make_job_dict("job-1", "completed", "handbook", "handbook_documents")
+        collection.docs["job-2"] = make_job_dict("job-2", "running", "dnd", "dnd_documents")
 
-    def test_list_jobs_with_filter(self):
-        """Test listing jobs with source filter."""
-        mock_firestore, mock_db = self._create_mock_firestore()
+        jobs = manager.list_jobs()
 
-        # Set up mock collection to return a chainable query
-        mock_collection = MagicMock()
-        mock_query = mock_collection.where.return_value
-        mock_query.where.return_value = mock_query  # Handle multiple where clauses
-        mock_query.order_by.return_value.limit.return_value.stream.return_value = []
-        mock_db.collection.return_value = mock_collection
+        assert [job.job_id for job in jobs] == ["job-1", "job-2"]
 
-        mock_google_cloud = MagicMock()
-        mock_google_cloud.firestore = mock_firestore
+    def test_list_jobs_with_filter(self, manager, collection):
+        """Test listing jobs with source and status filters."""
+        collection.docs["job-1"] = make_job_dict("job-1", "completed", "handbook", "handbook_documents")
+        collection.docs["job-2"] = make_job_dict("job-2", "running", "handbook", "handbook_documents")
+        collection.docs["job-3"] = make_job_dict("job-3", "completed", "dnd", "dnd_documents")
 
-        with patch.dict(
-            sys.modules,
-            {
-                "google.cloud": mock_google_cloud,
-                "google.cloud.firestore": mock_firestore,
-            },
-        ):
-            manager = JobManager(project_id="test-project")
-            jobs = manager.list_jobs(source="handbook", status=JobStatus.COMPLETED)
+        jobs = manager.list_jobs(source="handbook", status=JobStatus.COMPLETED)
 
-        # Verify collection was queried
-        assert mock_collection.where.called
-        assert len(jobs) == 0
+        assert [job.job_id for job in jobs] == ["job-1"]
@@ -7,7 +7,9 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from thoth.ingestion.chunker import Chunk, ChunkMetadata
+from thoth.ingestion.parsers import ParserFactory
 from thoth.ingestion.pipeline import IngestionPipeline, PipelineState, PipelineStats
+from thoth.shared.sources.config import SourceConfig
 
 
 @pytest.fixture
@@ -90,7 +92,7 @@ class TestPipelineState:
         """Test converting state to dictionary."""
         state = PipelineState(
             last_commit="abc123",
-            processed_files=["file1.md", "file2.md"],
+            processed_files={"file2.md", "file1.md"},
             failed_files={"file3.md": "Error message"},
             total_chunks=10,
             total_documents=10,
@@ -99,7 +101,7 @@ class TestPipelineState:
 
         state_dict = state.to_dict()
         assert state_dict["last_commit"] == "abc123"
-        assert state_dict["processed_files"] == ["file1.md", "file2.md"]
+        assert state_dict["processed_files"] == ["file1.md", "file2.md"]  # Sorted for stable JSON
         assert state_dict["failed_files"] == {"file3.md": "Error message"}
         assert state_dict["total_chunks"] == 10
         assert state_dict["completed"] is True
@@ -117,7 +119,7 @@ class TestPipelineState:
 
         state = PipelineState.from_dict(data)
         assert state.last_commit == "abc123"
-        assert state.processed_files == ["file1.md"]
+        assert state.processed_files == {"file1.md"}
         assert state.total_chunks == 5
         assert state.completed is False
 
@@ -141,15 +143,9 @@ class TestIngestionPipeline:
         assert state.last_commit is None
         assert len(state.processed_files) == 0
 
-    def test_load_state_existing_file(
-        self,
-        temp_state_file,
-        mock_vector_store,
-        mock_repo_manager,
-        mock_chunker,
-        mock_embedder,
-    ):
-        """Test loading state from existing file."""
+    @pytest.mark.parametrize("orjson_available", [True, False], ids=["orjson", "json"])
+    def test_load_state_existing_file(self, pipeline, orjson_available):
+        """Test loading state from existing file with and without orjson."""
         # Create state file
         state_data = {
             "last_commit": "abc123",
@@ -159,26 +155,32 @@ class TestIngestionPipeline:
             "total_documents": 5,
             "completed": False,
         }
-        with temp_state_file.open("w", encoding="utf-8") as f:
+        with pipeline.state_file.open("w", encoding="utf-8") as f:
             json.dump(state_data, f)
 
-        # Create pipeline (which loads state) with mocked components
-        pipeline = IngestionPipeline(
-            state_file=temp_state_file,
-            repo_manager=mock_repo_manager,
-            chunker=mock_chunker,
-            embedder=mock_embedder,
-            vector_store=mock_vector_store,
-        )
-        assert pipeline.state.last_commit == "abc123"
-        assert pipeline.state.processed_files == ["file1.md"]
-        assert pipeline.state.total_chunks == 5
+        with patch("thoth.ingestion.pipeline.ORJSON_AVAILABLE", orjson_available):
+            state = pipeline._load_state()
+
+        assert state.last_commit == "abc123"
+        assert state.processed_files == {"file1.md"}
+        assert state.total_chunks == 5
 
-    def test_save_state(self, pipeline):
-        """Test saving state to file."""
+    def test_load_state_corrupt_file(self, pipeline):
+        """Test an unreadable state file falls back to a fresh state."""
+        pipeline.state_file.write_text("{not json", encoding="utf-8")
+
+        state = pipeline._load_state()
+
+        assert state.last_commit is None
+        assert state.processed_files == set()
+
+    @pytest.mark.parametrize("orjson_available", [True, False], ids=["orjson", "json"])
+    def test_save_state(self, pipeline, orjson_available):
+        """Test saving state to file with and without orjson."""
         pipeline.state.last_commit = "abc123"
-        pipeline.state.processed_files = ["file1.md"]
-        pipeline._save_state()
+        pipeline.state.processed_files = {"file1.md"}
+        with patch("thoth.ingestion.pipeline.ORJSON_AVAILABLE", orjson_available):
+            pipeline._save_state()
 
         # Verify file was created
         assert pipeline.state_file.exists()
@@ -206,6 +208,26 @@ class TestIngestionPipeline:
         assert len(files) == 3
         assert all(f.suffix == ".md" for f in files)
 
+    def test_discover_source_files(self, pipeline, tmp_path):
+        """Test every supported format is found in one walk and .git is skipped."""
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "guide.md").touch()
+        (tmp_path / "docs" / "manual.pdf").touch()
+        (tmp_path / "notes.txt").touch()
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".git" / "README.md").touch()
+        pipeline.source_config = SourceConfig(
+            name="test",
+            collection_name="test_documents",
+            gcs_prefix="test",
+            supported_formats=[".md", "pdf"],
+        )
+
+        files = pipeline._discover_source_files(tmp_path)
+
+        assert sorted(f.relative_to(tmp_path).as_posix() for f in files) == ["docs/guide.md", "docs/manual.pdf"]
+        assert pipeline._discover_source_files(tmp_path / "missing") == []
+
     def test_process_file(self, pipeline, tmp_path):
         """Test processing a single file."""
         test_file = tmp_path / "test.md"
@@ -278,6 +300,65 @@ class TestIngestionPipeline:
         assert len(callback_calls) > 0
         assert callback_calls[0][1] == 1  # Total should be 1
 
+    def test_process_batch_groups_files_into_one_write(self, pipeline, tmp_path):
+        """Test chunks from several files are embedded and stored together, in file order."""
+        files = [tmp_path / f"file{i}.md" for i in range(3)]
+        for file_path in files:
+            file_path.write_text("# File")
+        pipeline.repo_manager.clone_path = tmp_path
+
+        successful, failed = pipeline._process_batch(files)
+
+        assert (successful, failed) == (3, 0)
+        assert pipeline.state.processed_files == {"file0.md", "file1.md", "file2.md"}
+        pipeline.embedder.embed.assert_called_once()
+        pipeline.vector_store.add_documents.assert_called_once()
+        assert pipeline.vector_store.add_documents.call_args.kwargs["ids"] == [
+            "chunk_file0_0",
+            "chunk_file1_0",
+            "chunk_file2_0",
+        ]
+
+    def test_process_batch_retries_failed_group_per_file(self, pipeline, tmp_path):
+        """Test a failed grouped write is retried file by file so only the bad file fails."""
+        file1 = tmp_path / "file1.md"
+        file2 = tmp_path / "file2.md"
+        file1.write_text("# File 1")
+        file2.write_text("# File 2")
+        pipeline.repo_manager.clone_path = tmp_path
+
+        def add_documents(ids, **_kwargs):
+            if "chunk_file2_0" in ids:
+                msg = "Write failed"
+                raise RuntimeError(msg)
+
+        pipeline.vector_store.add_documents.side_effect = add_documents
+
+        successful, failed = pipeline._process_batch([file1, file2])
+
+        assert (successful, failed) == (1, 1)
+        assert pipeline.state.processed_files == {"file1.md"}
+        assert pipeline.state.failed_files == {"file2.md": "Write failed"}
+        assert pipeline.vector_store.add_documents.call_count == 3  # Grouped write, then one per file
+
+    def test_process_batch_loads_parsers_before_workers_start(self, pipeline, tmp_path):
+        """Test the parser map is built before files are chunked on the thread pool."""
+        file1 = tmp_path / "file1.md"
+        file1.write_text("# File 1")
+        pipeline.repo_manager.clone_path = tmp_path
+        ParserFactory._parser_instances.clear()
+        maps_seen = []
+
+        def process_file(_file_path):
+            maps_seen.append(dict(ParserFactory._parser_instances))
+            return []
+
+        pipeline._process_file = process_file
+
+        pipeline._process_batch([file1])
+
+        assert set(maps_seen[0]) == set(ParserFactory.supported_extensions())
+
     @patch("thoth.ingestion.pipeline.IngestionPipeline._discover_markdown_files")
     def test_run_full_pipeline(self, mock_discover, pipeline, tmp_path):
         """Test running the full pipeline."""
@@ -322,7 +403,7 @@ class TestIngestionPipeline:
 
     def test_reset_keep_repo(self, pipeline):
         """Test resetting pipeline while keeping repository."""
-        pipeline.state.processed_files = ["file1.md"]
+        pipeline.state.processed_files = {"file1.md"}
         pipeline.state.total_chunks = 10
 
         pipeline.reset(keep_repo=True)
@@ -344,7 +425,7 @@ class TestIngestionPipeline:
 
     def test_get_status(self, pipeline):
         """Test getting pipeline status."""
-        pipeline.state.processed_files = ["file1.md", "file2.md"]
+        pipeline.state.processed_files = {"file1.md", "file2.md"}
         pipeline.state.total_chunks = 10
         pipeline.vector_store.get_document_count.return_value = 10
 
@@ -355,6 +436,32 @@ class TestIngestionPipeline:
         assert "vector_store_count" in status
         assert status["vector_store_count"] == 10
         assert status["state"]["total_chunks"] == 10
+        assert (status["embed_cache_hits"], status["embed_cache_misses"]) == (0, 0)
+
+    def test_embed_cache_skips_unchanged_chunks(self, pipeline, tmp_path):
+        """Test a pipeline with an embedding cache re-embeds nothing on a second pass."""
+        mock_embedder = pipeline.embedder
+        mock_embedder.model_name = "test-model"
+        mock_embedder.embed.side_effect = lambda texts, **_kwargs: [[0.1, 0.2, 0.3]] * len(texts)
+        pipeline = IngestionPipeline(
+            repo_manager=pipeline.repo_manager,
+            chunker=pipeline.chunker,
+            embedder=mock_embedder,
+            vector_store=pipeline.vector_store,
+            state_file=pipeline.state_file,
+            embed_cache_path=tmp_path / "embedding_cache.sqlite3",
+        )
+        file1 = tmp_path / "file1.md"
+        file1.write_text("# File 1")
+        pipeline.repo_manager.clone_path = tmp_path
+
+        pipeline._process_batch([file1])
+        pipeline.state.processed_files.clear()
+        pipeline._process_batch([file1])
+
+        mock_embedder.embed.assert_called_once()
+        status = pipeline.get_status()
+        assert (status["embed_cache_hits"], status["embed_cache_misses"]) == (1, 1)
 
 
 class TestPipelineStats:
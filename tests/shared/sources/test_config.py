@@ -1,8 +1,5 @@
 """Tests for source configuration module."""
 
-import os
-from unittest.mock import patch
-
 import pytest
 
 from thoth.shared.sources.config import (
@@ -11,6 +8,25 @@ from thoth.shared.sources.config import (
     SourceRegistry,
 )
 
+# (name, collection_name, gcs_prefix, supported formats)
+EXPECTED_DEFAULT_SOURCES = [
+    ("handbook", "handbook_documents", "handbook", {".md"}),
+    ("dnd", "dnd_documents", "dnd", {".md", ".pdf", ".txt"}),
+    ("personal", "personal_documents", "personal", {".md", ".pdf", ".txt", ".docx"}),
+]
+
+
+@pytest.fixture(scope="module")
+def shared_registry():
+    """Create one registry for tests that only read from it."""
+    return SourceRegistry()
+
+
+@pytest.fixture
+def registry():
+    """Create a fresh registry for tests that modify it."""
+    return SourceRegistry()
+
 
 class TestSourceConfig:
     """Tests for SourceConfig dataclass."""
@@ -78,76 +94,47 @@ class TestDefaultSources:
     """Tests for default source configurations."""
 
     def test_default_sources_exist(self):
-        """Test that default sources are defined."""
-        assert "handbook" in DEFAULT_SOURCES
-        assert "dnd" in DEFAULT_SOURCES
-        assert "personal" in DEFAULT_SOURCES
-
-    def test_handbook_config(self):
-        """Test handbook source configuration."""
-        config = DEFAULT_SOURCES["handbook"]
-
-        assert config.name == "handbook"
-        assert config.collection_name == "handbook_documents"
-        assert config.gcs_prefix == "handbook"
-        assert ".md" in config.supported_formats
+        """Test that exactly the expected default sources are defined."""
+        assert set(DEFAULT_SOURCES) == {name for name, *_ in EXPECTED_DEFAULT_SOURCES}
+
+    @pytest.mark.parametrize(("name", "collection_name", "gcs_prefix", "formats"), EXPECTED_DEFAULT_SOURCES)
+    def test_default_config(self, name, collection_name, gcs_prefix, formats):
+        """Test each default source's collection, prefix and formats."""
+        config = DEFAULT_SOURCES[name]
+
+        assert config.name == name
+        assert config.collection_name == collection_name
+        assert config.gcs_prefix == gcs_prefix
+        assert set(config.supported_formats) == formats
         assert config.description
 
-    def test_dnd_config(self):
-        """Test D&D source configuration."""
-        config = DEFAULT_SOURCES["dnd"]
-
-        assert config.name == "dnd"
-        assert config.collection_name == "dnd_documents"
-        assert config.gcs_prefix == "dnd"
-        assert ".md" in config.supported_formats
-        assert ".pdf" in config.supported_formats
-        assert ".txt" in config.supported_formats
-
-    def test_personal_config(self):
-        """Test personal source configuration."""
-        config = DEFAULT_SOURCES["personal"]
-
-        assert config.name == "personal"
-        assert config.collection_name == "personal_documents"
-        assert config.gcs_prefix == "personal"
-        assert ".md" in config.supported_formats
-        assert ".pdf" in config.supported_formats
-        assert ".txt" in config.supported_formats
-        assert ".docx" in config.supported_formats
-
 
 class TestSourceRegistry:
     """Tests for SourceRegistry class."""
 
-    def test_registry_initialization(self):
+    def test_registry_initialization(self, shared_registry):
         """Test registry initializes with default sources."""
-        registry = SourceRegistry()
-
-        assert registry.get("handbook") is not None
-        assert registry.get("dnd") is not None
-        assert registry.get("personal") is not None
+        assert shared_registry.get("handbook") is not None
+        assert shared_registry.get("dnd") is not None
+        assert shared_registry.get("personal") is not None
 
-    def test_get_source(self):
+    def test_get_source(self, shared_registry):
         """Test getting a source by name."""
-        registry = SourceRegistry()
-        config = registry.get("handbook")
+        config = shared_registry.get("handbook")
 
         assert config is not None
         assert config.name == "handbook"
         assert config.collection_name == "handbook_documents"
 
-    def test_get_nonexistent_source(self):
+    def test_get_nonexistent_source(self, shared_registry):
         """Test getting a non-existent source."""
-        registry = SourceRegistry()
-        config = registry.get("nonexistent")
+        config = shared_registry.get("nonexistent")
 
         assert config is None
 
-    def test_list_sources(self):
+    def test_list_sources(self, shared_registry):
         """Test listing source names."""
-        registry = SourceRegistry()
-        sources = registry.list_sources()
+        sources = shared_registry.list_sources()
 
         assert isinstance(sources, list)
         assert "handbook" in sources
@@ -155,18 +142,16 @@ class TestSourceRegistry:
         assert "personal" in sources
         assert len(sources) >= 3
 
-    def test_list_configs(self):
+    def test_list_configs(self, shared_registry):
         """Test listing source configurations."""
-        registry = SourceRegistry()
-        configs = registry.list_configs()
+        configs = shared_registry.list_configs()
 
         assert isinstance(configs, list)
         assert all(isinstance(c, SourceConfig) for c in configs)
         assert len(configs) >= 3
 
-    def test_register_new_source(self):
+    def test_register_new_source(self, registry):
         """Test registering a new source."""
-        registry = SourceRegistry()
         new_config = SourceConfig(
             name="custom",
             collection_name="custom_collection",
@@ -181,9 +166,8 @@ class TestSourceRegistry:
         assert registry.get("custom").collection_name == "custom_collection"
         assert "custom" in registry.list_sources()
 
-    def test_register_duplicate_source(self):
+    def test_register_duplicate_source(self, registry):
         """Test registering a duplicate source raises error."""
-        registry = SourceRegistry()
         duplicate_config = SourceConfig(
             name="handbook",  # Already exists
             collection_name="different_collection",
@@ -193,9 +177,8 @@ class TestSourceRegistry:
         with pytest.raises(ValueError, match="already registered"):
             registry.register(duplicate_config)
 
-    def test_update_source(self):
+    def test_update_source(self, registry):
         """Test updating an existing source."""
-        registry = SourceRegistry()
         updated_config = SourceConfig(
             name="handbook",
             collection_name="updated_handbook_collection",
@@ -210,37 +193,32 @@ class TestSourceRegistry:
         assert config.gcs_prefix == "updated_handbook_prefix"
         assert ".rst" in config.supported_formats
 
-    def test_get_all_collections(self):
+    def test_get_all_collections(self, shared_registry):
         """Test getting all collection names."""
-        registry = SourceRegistry()
-        collections = registry.get_all_collections()
+        collections = shared_registry.get_all_collections()
 
         assert isinstance(collections, list)
         assert "handbook_documents" in collections
         assert "dnd_documents" in collections
         assert "personal_documents" in collections
 
-    def test_env_override_gcs_prefix(self):
+    def test_env_override_gcs_prefix(self, monkeypatch):
         """Test environment variable override for GCS prefix."""
-        with patch.dict(os.environ, {"THOTH_SOURCE_HANDBOOK_GCS_PREFIX": "custom_handbook_prefix"}):
-            registry = SourceRegistry()
-            config = registry.get("handbook")
+        monkeypatch.setenv("THOTH_SOURCE_HANDBOOK_GCS_PREFIX", "custom_handbook_prefix")
+        config = SourceRegistry().get("handbook")
 
-            assert config.gcs_prefix == "custom_handbook_prefix"
+        assert config.gcs_prefix == "custom_handbook_prefix"
 
-    def test_env_override_collection(self):
+    def test_env_override_collection(self, monkeypatch):
         """Test environment variable override for collection name."""
-        with patch.dict(os.environ, {"THOTH_SOURCE_DND_COLLECTION": "my_dnd_collection"}):
-            registry = SourceRegistry()
-            config = registry.get("dnd")
+        monkeypatch.setenv("THOTH_SOURCE_DND_COLLECTION", "my_dnd_collection")
+        config = SourceRegistry().get("dnd")
 
-            assert config.collection_name == "my_dnd_collection"
+        assert config.collection_name == "my_dnd_collection"
 
-    def test_registry_does_not_modify_defaults(self):
+    def test_registry_does_not_modify_defaults(self, registry):
         """Test that registry doesn't modify DEFAULT_SOURCES."""
         original_gcs_prefix = DEFAULT_SOURCES["handbook"].gcs_prefix
-
-        registry = SourceRegistry()
         registry.get("handbook").gcs_prefix = "modified_prefix"
 
         # DEFAULT_SOURCES should remain unchanged
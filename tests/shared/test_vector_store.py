@@ -164,6 +164,16 @@ class TestVectorStore(unittest.TestCase):
         results = self.vector_store.get_documents()
         self.assertEqual(results["metadatas"][0].get("section"), "java")
 
+    def test_delete_by_file_paths(self):
+        """Test deleting documents for several file paths at once."""
+        metadatas = [{"file_path": "a.md"}, {"file_path": "a.md"}, {"file_path": "b's.md"}, {"file_path": "c.md"}]
+        self.vector_store.add_documents(["A1", "A2", "B", "C"], metadatas=metadatas)
+
+        counts = self.vector_store.delete_by_file_paths(["a.md", "b's.md", "missing.md"])
+
+        self.assertEqual(counts, {"a.md": 2, "b's.md": 1, "missing.md": 0})
+        self.assertEqual(self.vector_store.get_documents()["documents"], ["C"])
+
     def test_delete_documents_validation(self):
         """Test validation for delete_documents."""
         with self.assertRaises(ValueError):
@@ -1,9 +1,30 @@
-"""Ingestion module for managing handbook repository."""
+"""Ingestion module for managing handbook repository.
 
-from thoth.ingestion.chunker import Chunk, ChunkMetadata, MarkdownChunker
-from thoth.ingestion.gitlab_api import GitLabAPIClient, GitLabAPIError, RateLimitError
-from thoth.ingestion.repo_manager import HandbookRepoManager
-from thoth.shared.vector_store import VectorStore
+The package exports are resolved on first access, so importing a light
+submodule such as thoth.ingestion.job_manager does not load the embedding
+stack behind VectorStore.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from thoth.ingestion.chunker import Chunk, ChunkMetadata, MarkdownChunker
+    from thoth.ingestion.gitlab_api import GitLabAPIClient, GitLabAPIError, RateLimitError
+    from thoth.ingestion.repo_manager import HandbookRepoManager
+    from thoth.shared.vector_store import VectorStore
+
+# Exported name -> module that defines it
+_EXPORTS = {
+    "Chunk": "thoth.ingestion.chunker",
+    "ChunkMetadata": "thoth.ingestion.chunker",
+    "GitLabAPIClient": "thoth.ingestion.gitlab_api",
+    "GitLabAPIError": "thoth.ingestion.gitlab_api",
+    "HandbookRepoManager": "thoth.ingestion.repo_manager",
+    "MarkdownChunker": "thoth.ingestion.chunker",
+    "RateLimitError": "thoth.ingestion.gitlab_api",
+    "VectorStore": "thoth.shared.vector_store",
+}
 
 __all__ = [
     "Chunk",
@@ -15,3 +36,19 @@ __all__ = [
     "RateLimitError",
     "VectorStore",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name from its defining module on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazy exports alongside the names already loaded."""
+    return sorted({*globals(), *__all__})
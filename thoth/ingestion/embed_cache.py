@@ -0,0 +1,209 @@
+"""Persistent embedding cache for the ingestion pipeline.
+
+This module provides EmbeddingCache, an SQLite-backed LRU store of embedding
+vectors keyed by model and content hash, and CachedEmbedder, which wraps an
+Embedder so unchanged chunks are not re-embedded on later runs.
+"""
+
+from array import array
+from collections.abc import Iterator
+import hashlib
+import logging
+from pathlib import Path
+import sqlite3
+import time
+from typing import TYPE_CHECKING, Any
+
+from thoth.shared.utils.logger import setup_logger
+
+if TYPE_CHECKING:
+    from thoth.shared.embedder import Embedder
+
+logger = setup_logger(__name__)
+
+# Constants
+DEFAULT_EMBED_CACHE_FILE = "embedding_cache.sqlite3"
+DEFAULT_MAX_ENTRIES = 500_000  # ~800 MB of 384-d float32 vectors
+SQLITE_MAX_PARAMS = 900  # Stay below SQLite's default host parameter limit of 999
+
+
+def content_hash(text: str) -> str:
+    """Hash chunk text into the cache key used by EmbeddingCache.
+
+    Args:
+        text: Chunk text
+
+    Returns:
+        32-character hex digest
+    """
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+
+def _batched(items: list[str], size: int) -> Iterator[list[str]]:
+    """Split a list into consecutive slices of at most size items."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+class EmbeddingCache:
+    """SQLite-backed LRU cache of embedding vectors.
+
+    Entries are keyed by (model_id, content hash) so switching models never
+    returns stale vectors. Vectors are stored as float32 blobs, which is the
+    precision sentence-transformers produces. The database runs in WAL mode,
+    so several ingestion processes can share one cache file.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        model_id: str,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        logger_instance: logging.Logger | logging.LoggerAdapter | None = None,
+    ):
+        """Open (or create) the cache database.
+
+        Args:
+            path: Path to the SQLite database file
+            model_id: Identifier of the embedding model whose vectors are cached
+            max_entries: Maximum vectors kept across all models; least recently used are evicted
+            logger_instance: Logger instance for logging
+        """
+        self.path = path
+        self.model_id = model_id
+        self.max_entries = max_entries
+        self.logger = logger_instance or logger
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "model_id TEXT NOT NULL, content_hash TEXT NOT NULL, vector BLOB NOT NULL, last_used INTEGER NOT NULL, "
+            "PRIMARY KEY (model_id, content_hash)) WITHOUT ROWID"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+        self._conn.commit()
+
+    def get_many(self, hashes: list[str]) -> dict[str, list[float]]:
+        """Look up cached vectors and mark the hits as recently used.
+
+        Args:
+            hashes: Content hashes to look up
+
+        Returns:
+            Mapping of content hash to vector for every hash found
+        """
+        found: dict[str, list[float]] = {}
+        for batch in _batched(hashes, SQLITE_MAX_PARAMS):
+            placeholders = ",".join("?" * len(batch))
+            rows = self._conn.execute(
+                f"SELECT content_hash, vector FROM embeddings WHERE model_id = ? AND content_hash IN ({placeholders})",
+                [self.model_id, *batch],
+            )
+            for key, blob in rows:
+                found[key] = array("f", blob).tolist()
+
+        if found:
+            now = time.time_ns()
+            self._conn.executemany(
+                "UPDATE embeddings SET last_used = ? WHERE model_id = ? AND content_hash = ?",
+                [(now, self.model_id, key) for key in found],
+            )
+            self._conn.commit()
+        return found
+
+    def put_many(self, vectors: dict[str, list[float]]) -> None:
+        """Store vectors, then evict the least recently used entries over max_entries.
+
+        Args:
+            vectors: Mapping of content hash to vector
+        """
+        if not vectors:
+            return
+        now = time.time_ns()
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO embeddings (model_id, content_hash, vector, last_used) VALUES (?, ?, ?, ?)",
+            [(self.model_id, key, array("f", vector).tobytes(), now) for key, vector in vectors.items()],
+        )
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        if count > self.max_entries:
+            self._conn.execute(
+                "DELETE FROM embeddings WHERE (model_id, content_hash) IN "
+                "(SELECT model_id, content_hash FROM embeddings ORDER BY last_used LIMIT ?)",
+                (count - self.max_entries,),
+            )
+            self.logger.debug("Evicted %d cached embeddings", count - self.max_entries)
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        """Return the number of cached vectors across all models."""
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()
+        return int(count)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+class CachedEmbedder:
+    """Embedder wrapper that serves previously embedded texts from an EmbeddingCache.
+
+    Only embed() goes through the cache; every other attribute (model_name,
+    embed_single, get_embedding_dimension, ...) is forwarded to the wrapped
+    embedder.
+    """
+
+    def __init__(self, embedder: "Embedder", cache: EmbeddingCache):
+        """Wrap an embedder with a cache.
+
+        Args:
+            embedder: Embedder whose embed() results are cached
+            cache: Cache holding vectors for the embedder's model
+        """
+        self.embedder: Embedder = embedder
+        self.cache = cache
+        self.hits = 0
+        self.misses = 0
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward everything except embed() to the wrapped embedder."""
+        return getattr(self.embedder, name)
+
+    def embed(
+        self,
+        texts: list[str],
+        show_progress: bool = False,
+        normalize: bool = True,
+    ) -> list[list[float]]:
+        """Generate embeddings, reusing cached vectors for texts seen before.
+
+        Duplicate texts within one call are embedded once and counted as hits
+        after the first. Unnormalized requests bypass the cache, which only
+        holds normalized vectors.
+
+        Args:
+            texts: List of text strings to embed.
+            show_progress: Whether to show a progress bar while embedding misses.
+            normalize: Whether to normalize embeddings to unit length.
+
+        Returns:
+            List of embedding vectors in the same order as texts.
+        """
+        if not texts or not normalize:
+            return self.embedder.embed(texts, show_progress=show_progress, normalize=normalize)
+
+        keys = [content_hash(text) for text in texts]
+        vectors = self.cache.get_many(list(dict.fromkeys(keys)))
+        missing = {key: text for key, text in zip(keys, texts, strict=True) if key not in vectors}
+
+        if missing:
+            embedded = self.embedder.embed(list(missing.values()), show_progress=show_progress, normalize=normalize)
+            new_vectors = dict(zip(missing, embedded, strict=True))
+            self.cache.put_many(new_vectors)
+            vectors.update(new_vectors)
+
+        self.misses += len(missing)
+        self.hits += len(texts) - len(missing)
+        logger.debug("Embedding cache: %d hits, %d misses", len(texts) - len(missing), len(missing))
+        return [vectors[key] for key in keys]
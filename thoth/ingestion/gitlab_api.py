@@ -40,15 +40,16 @@ class GitLabAPIError(Exception):
 class CacheEntry:
     """Represents a cached API response."""
 
-    def __init__(self, data: Any, ttl: int = CACHE_DEFAULT_TTL):
+    def __init__(self, data: Any, ttl: int = CACHE_DEFAULT_TTL, now: datetime | None = None):
         """Initialize cache entry.
 
         Args:
             data: Data to cache
             ttl: Time to live in seconds
+            now: Creation time; taken from the clock when not given
         """
         self.data = data
-        self.expires_at = datetime.now(tz=UTC) + timedelta(seconds=ttl)
+        self.expires_at = (now or datetime.now(tz=UTC)) + timedelta(seconds=ttl)
 
     def is_expired(self) -> bool:
         """Check if cache entry is expired."""
@@ -66,6 +67,7 @@ class GitLabAPIClient:
         max_retries: int = DEFAULT_MAX_RETRIES,
         backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
         logger: logging.Logger | None = None,
+        session: requests.Session | None = None,
     ):
         """Initialize GitLab API client.
 
@@ -78,6 +80,8 @@ class GitLabAPIClient:
             max_retries: Maximum number of retries for failed requests
             backoff_factor: Backoff factor for exponential backoff
             logger: Logger instance
+            session: Pre-configured HTTP session. If not provided, a new one is
+                     created with the retry strategy mounted.
         """
         # Try to get token and base_url from Secret Manager or environment
         if token is None:
@@ -122,16 +126,18 @@ class GitLabAPIClient:
         self.logger = logger or setup_logger(__name__)
 
         # Initialize session with retry strategy
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=backoff_factor,
-            status_forcelist=[500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PUT", "DELETE"],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("https://", adapter)
-        self.session.mount("http://", adapter)
+        if session is None:
+            session = requests.Session()
+            retry_strategy = Retry(
+                total=max_retries,
+                backoff_factor=backoff_factor,
+                status_forcelist=[500, 502, 503, 504],
+                allowed_methods=["GET", "POST", "PUT", "DELETE"],
+            )
+            adapter = HTTPAdapter(max_retries=retry_strategy)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
 
         # Set headers
         if self.token:
@@ -190,6 +196,17 @@ class GitLabAPIClient:
         self._cache[cache_key] = CacheEntry(data, ttl)
         self.logger.debug(f"Cached: {cache_key} (TTL: {ttl}s)")
 
+    def _add_many_to_cache(self, items: dict[str, Any], ttl: int = CACHE_DEFAULT_TTL) -> None:
+        """Add several entries to the cache with one shared creation time.
+
+        Args:
+            items: Mapping of cache key to data
+            ttl: Time to live in seconds
+        """
+        now = datetime.now(tz=UTC)
+        self._cache.update((cache_key, CacheEntry(data, ttl, now)) for cache_key, data in items.items())
+        self.logger.debug(f"Cached {len(items)} entries (TTL: {ttl}s)")
+
     def clear_cache(self) -> None:
         """Clear all cached data."""
         self._cache.clear()
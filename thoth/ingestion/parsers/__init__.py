@@ -63,9 +63,13 @@ class ParserFactory:
         DocxParser,
     ]
 
-    # Cache of parser instances
+    # Parser instances keyed by lowercase extension, built on first lookup and
+    # only ever replaced whole, so concurrent readers never see a partial map
     _parser_instances: ClassVar[dict[str, DocumentParser]] = {}
 
+    # Cache of supported extensions, rebuilt when a parser is registered
+    _supported_extensions: ClassVar[tuple[str, ...]] = ()
+
     @classmethod
     def get_parser(cls, file_path: Path) -> DocumentParser | None:
         """Get appropriate parser for a file.
@@ -76,22 +80,30 @@ class ParserFactory:
         Returns:
             DocumentParser instance if a suitable parser exists, None otherwise
         """
-        extension = file_path.suffix.lower()
+        instances = cls._parser_instances
+        if not instances:
+            instances = cls._load_parsers()
+        return instances.get(file_path.suffix.lower())
+
+    @classmethod
+    def _load_parsers(cls) -> dict[str, DocumentParser]:
+        """Build the extension -> parser instance map from the registry.
 
-        # Check cache first
-        if extension in cls._parser_instances:
-            return cls._parser_instances[extension]
+        Each parser class is instantiated once and shared by all of its
+        extensions. Earlier registrations win when extensions overlap. The map
+        is built locally and published in one assignment, so a thread looking
+        up a parser while another is building sees either no map or a full one.
 
-        # Find and cache parser
+        Returns:
+            The newly published extension -> parser instance map
+        """
+        instances: dict[str, DocumentParser] = {}
         for parser_class in cls._parser_classes:
             parser = parser_class()
-            if parser.can_parse(file_path):
-                # Cache for all supported extensions
-                for ext in parser.supported_extensions:
-                    cls._parser_instances[ext.lower()] = parser
-                return parser
-
-        return None
+            for ext in parser.supported_extensions:
+                instances.setdefault(ext.lower(), parser)
+        cls._parser_instances = instances
+        return instances
 
     @classmethod
     def parse(cls, file_path: Path) -> ParsedDocument:
@@ -151,11 +163,10 @@ class ParserFactory:
         Returns:
             List of supported extensions including the dot (e.g., ['.md', '.pdf'])
         """
-        extensions = []
-        for parser_class in cls._parser_classes:
-            parser = parser_class()
-            extensions.extend(parser.supported_extensions)
-        return sorted(set(extensions))
+        if not cls._supported_extensions:
+            extensions = {ext for parser_class in cls._parser_classes for ext in parser_class().supported_extensions}
+            cls._supported_extensions = tuple(sorted(extensions))
+        return list(cls._supported_extensions)
 
     @classmethod
     def can_parse(cls, file_path: Path) -> bool:
@@ -178,6 +189,7 @@ class ParserFactory:
         """
         if parser_class not in cls._parser_classes:
             cls._parser_classes.append(parser_class)
-            # Clear cache to include new parser
-            cls._parser_instances.clear()
+            # Clear caches to include new parser
+            cls._parser_instances = {}
+            cls._supported_extensions = ()
             logger.info("Registered parser: %s", parser_class.__name__)
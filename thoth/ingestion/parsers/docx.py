@@ -87,21 +87,13 @@ class DocxParser(DocumentParser):
         Returns:
             ParsedDocument with extracted content
         """
-        # Extract paragraphs
-        paragraphs = []
-        for para in doc.paragraphs:
-            text = para.text.strip()
-            if text:
-                paragraphs.append(text)
+        # Extract non-empty paragraphs, stripping each one once
+        paragraphs = [text for para in doc.paragraphs if (text := para.text.strip())]
 
         # Extract text from tables
         for table in doc.tables:
             for row in table.rows:
-                row_text = []
-                for cell in row.cells:
-                    cell_text = cell.text.strip()
-                    if cell_text:
-                        row_text.append(cell_text)
+                row_text = [text for cell in row.cells if (text := cell.text.strip())]
                 if row_text:
                     paragraphs.append(" | ".join(row_text))
 
@@ -5,7 +5,7 @@ YAML frontmatter extraction.
 """
 
 from pathlib import Path
-import re
+from typing import Any
 
 from thoth.ingestion.parsers.base import DocumentParser, ParsedDocument
 from thoth.shared.utils.logger import setup_logger
@@ -64,13 +64,10 @@ class MarkdownParser(DocumentParser):
             text = content.decode("latin-1")
             logger.warning("File %s not valid UTF-8, used latin-1 fallback", source_path)
 
-        # Extract YAML frontmatter if present
-        metadata = self._extract_frontmatter(text)
+        # Split off YAML frontmatter if present
+        metadata, clean_content = self._split_frontmatter(text)
         metadata["source_path"] = source_path
 
-        # Remove frontmatter from content
-        clean_content = self._remove_frontmatter(text)
-
         return ParsedDocument(
             content=clean_content,
             metadata=metadata,
@@ -78,8 +75,8 @@ class MarkdownParser(DocumentParser):
             format="markdown",
         )
 
-    def _extract_frontmatter(self, text: str) -> dict:
-        """Extract YAML frontmatter if present.
+    def _split_frontmatter(self, text: str) -> tuple[dict[str, Any], str]:
+        """Split YAML frontmatter from the rest of the document.
 
         YAML frontmatter is delimited by --- at the start of the file:
         ---
@@ -87,24 +84,32 @@ class MarkdownParser(DocumentParser):
         author: John Doe
         ---
 
+        Lines are scanned one at a time and scanning stops at the closing
+        delimiter, so the document body is never searched.
+
         Args:
             text: Full document text
 
         Returns:
-            Dictionary of frontmatter key-value pairs
+            Tuple of (frontmatter key-value pairs, text with frontmatter removed)
         """
-        # Match YAML frontmatter at the beginning of the file
-        pattern = r"^---\s*\n(.*?)\n---\s*\n"
-        match = re.match(pattern, text, re.DOTALL)
-
-        if not match:
-            return {}
-
-        frontmatter_text = match.group(1)
-        metadata = {}
-
-        # Parse simple key: value pairs (not full YAML parsing to avoid dependency)
-        for raw_line in frontmatter_text.split("\n"):
+        line_end = text.find("\n")
+        if line_end < 0 or not text.startswith("---") or text[3:line_end].strip():
+            return {}, text
+
+        metadata: dict[str, Any] = {}
+        body_start = start = line_end + 1
+        while (line_end := text.find("\n", start)) >= 0:
+            raw_line = text[start:line_end]
+            is_first_line = start == body_start
+            start = line_end + 1
+            if raw_line.rstrip() == "---" and not is_first_line:
+                # Drop blank lines between the frontmatter and the body
+                while (line_end := text.find("\n", start)) >= 0 and not text[start:line_end].strip():
+                    start = line_end + 1
+                return metadata, text[start:]
+
+            # Parse simple key: value pairs (not full YAML parsing to avoid dependency)
             line = raw_line.strip()
             if ":" in line and not line.startswith("#"):
                 key, _, value = line.partition(":")
@@ -113,16 +118,5 @@ class MarkdownParser(DocumentParser):
                 if key and value:
                     metadata[key] = value
 
-        return metadata
-
-    def _remove_frontmatter(self, text: str) -> str:
-        """Remove YAML frontmatter from text.
-
-        Args:
-            text: Full document text
-
-        Returns:
-            Text with frontmatter removed
-        """
-        pattern = r"^---\s*\n.*?\n---\s*\n"
-        return re.sub(pattern, "", text, count=1, flags=re.DOTALL)
+        # No closing delimiter: not frontmatter
+        return {}, text
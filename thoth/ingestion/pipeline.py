@@ -5,7 +5,9 @@ components (repo manager, chunker, embedder, vector store) into a complete
 end-to-end ingestion workflow with progress tracking, error handling, and resume logic.
 """
 
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 import json
@@ -16,6 +18,7 @@ import shutil
 from typing import Any
 
 from thoth.ingestion.chunker import Chunk, DocumentChunker, MarkdownChunker
+from thoth.ingestion.embed_cache import CachedEmbedder, EmbeddingCache
 from thoth.ingestion.gcs_repo_sync import GCSRepoSync
 from thoth.ingestion.parsers import ParserFactory
 from thoth.ingestion.repo_manager import HandbookRepoManager
@@ -26,9 +29,69 @@ from thoth.shared.vector_store import VectorStore
 
 logger = setup_logger(__name__)
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Constants
 DEFAULT_STATE_FILE = "pipeline_state.json"
 DEFAULT_BATCH_SIZE = 50  # Process files in batches
+DEFAULT_CHUNK_WORKERS = 4  # Threads parsing and chunking files ahead of embedding
+DEFAULT_CHUNK_PREFETCH = 16  # Max files chunked but not yet embedded
+DEFAULT_EMBED_BATCH_SIZE = 256  # Chunks grouped into one embed call and one vector store write
+
+
+def _walk_files(root: Path, suffixes: tuple[str, ...]) -> list[Path]:
+    """Find files under root whose names end with one of the suffixes.
+
+    Walks with os.scandir so directory entries are classified from the dirent
+    type without an extra stat per entry, and only matched files become Path
+    objects. Like Path.rglob, symlinked directories are not followed. .git
+    directories are skipped since they never hold source documents.
+
+    Args:
+        root: Directory to search
+        suffixes: File name suffixes to match, e.g. (".md",)
+
+    Returns:
+        Matching file paths
+    """
+    found: list[Path] = []
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue  # Missing or unreadable directories are skipped, as with rglob
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != ".git":
+                        stack.append(entry.path)
+                elif entry.name.endswith(suffixes):
+                    found.append(Path(entry.path))
+    return found
+
+
+def _sanitize_metadata(meta: dict[str, Any]) -> dict[str, Any]:
+    """Ensure all metadata values are LanceDB-compatible (str, int, float, bool).
+
+    Lists become comma-separated strings and None becomes an empty string.
+    """
+    sanitized: dict[str, Any] = {}
+    for key, value in meta.items():
+        if isinstance(value, list):
+            sanitized[key] = ", ".join(str(v) for v in value)
+        elif isinstance(value, (str, int, float, bool)):
+            sanitized[key] = value
+        elif value is None:
+            sanitized[key] = ""
+        else:
+            sanitized[key] = str(value)
+    return sanitized
 
 
 @dataclass
@@ -40,7 +103,7 @@ class PipelineState:
 
     Attributes:
         last_commit: Last Git commit processed (for incremental sync).
-        processed_files: List of file paths successfully processed.
+        processed_files: Set of file paths successfully processed (persisted as a sorted list).
         failed_files: Dict of file_path -> error_message for failed files.
         total_chunks: Total chunks created this run.
         total_documents: Total documents (chunks) added to the vector store.
@@ -50,7 +113,7 @@ class PipelineState:
     """
 
     last_commit: str | None = None
-    processed_files: list[str] = field(default_factory=list)
+    processed_files: set[str] = field(default_factory=set)
     failed_files: dict[str, str] = field(default_factory=dict)  # file_path -> error_message
     total_chunks: int = 0
     total_documents: int = 0
@@ -67,7 +130,7 @@ class PipelineState:
         """
         return {
             "last_commit": self.last_commit,
-            "processed_files": self.processed_files,
+            "processed_files": sorted(self.processed_files),
             "failed_files": self.failed_files,
             "total_chunks": self.total_chunks,
             "total_documents": self.total_documents,
@@ -88,7 +151,7 @@ class PipelineState:
         """
         return cls(
             last_commit=data.get("last_commit"),
-            processed_files=data.get("processed_files", []),
+            processed_files=set(data.get("processed_files", [])),
             failed_files=data.get("failed_files", {}),
             total_chunks=data.get("total_chunks", 0),
             total_documents=data.get("total_documents", 0),
@@ -154,6 +217,7 @@ class IngestionPipeline:
         logger_instance: logging.Logger | logging.LoggerAdapter | None = None,
         collection_name: str = "thoth_documents",
         source_config: SourceConfig | None = None,
+        embed_cache_path: Path | None = None,
     ):
         """Initialize the ingestion pipeline.
 
@@ -167,13 +231,18 @@ class IngestionPipeline:
             logger_instance: Logger instance for logging
             collection_name: Name of the vector store table (collection) to use
             source_config: Source configuration for multi-source support
+            embed_cache_path: SQLite file for a persistent embedding cache (disabled if None)
         """
         self.logger = logger_instance or logger
         self.source_config = source_config
         self.repo_manager = repo_manager or HandbookRepoManager(logger=self.logger)
         self.chunker = chunker or MarkdownChunker(logger=self.logger)
         self.document_chunker = DocumentChunker(logger=self.logger)  # Generalized chunker for all formats
-        self.embedder = embedder or Embedder(logger_instance=self.logger)
+        self.embedder: Embedder | CachedEmbedder = embedder or Embedder(logger_instance=self.logger)
+        if embed_cache_path is not None:
+            # Reuse vectors for chunks whose text was already embedded by this model
+            cache = EmbeddingCache(embed_cache_path, model_id=self.embedder.model_name, logger_instance=self.logger)
+            self.embedder = CachedEmbedder(self.embedder, cache)
         # Use collection name from source config if provided
         self.collection_name = source_config.collection_name if source_config else collection_name
         self.source_name = source_config.name if source_config else ""
@@ -241,8 +310,11 @@ class IngestionPipeline:
             return PipelineState()
 
         try:
-            with self.state_file.open(encoding="utf-8") as f:
-                data = json.load(f)
+            if ORJSON_AVAILABLE:
+                data = orjson.loads(self.state_file.read_bytes())
+            else:
+                with self.state_file.open(encoding="utf-8") as f:
+                    data = json.load(f)
             state = PipelineState.from_dict(data)
             self.logger.info(
                 "Loaded previous state: %d processed files, %d failed files",
@@ -250,7 +322,7 @@ class IngestionPipeline:
                 len(state.failed_files),
             )
             return state
-        except (OSError, json.JSONDecodeError) as e:
+        except (OSError, json.JSONDecodeError) as e:  # orjson.JSONDecodeError subclasses json's
             self.logger.warning("Failed to load state file: %s. Starting fresh.", e)
             return PipelineState()
 
@@ -260,8 +332,11 @@ class IngestionPipeline:
 
         try:
             self.state_file.parent.mkdir(parents=True, exist_ok=True)
-            with self.state_file.open("w", encoding="utf-8") as f:
-                json.dump(self.state.to_dict(), f, indent=2)
+            if ORJSON_AVAILABLE:
+                self.state_file.write_bytes(orjson.dumps(self.state.to_dict(), option=orjson.OPT_INDENT_2))
+            else:
+                with self.state_file.open("w", encoding="utf-8") as f:
+                    json.dump(self.state.to_dict(), f, indent=2)
             self.logger.debug("Saved pipeline state to %s", self.state_file)
         except OSError:
             self.logger.exception("Failed to save state file")
@@ -276,7 +351,7 @@ class IngestionPipeline:
             List of markdown file paths
         """
         self.logger.info("Discovering markdown files in %s", repo_path)
-        markdown_files = list(repo_path.rglob("*.md"))
+        markdown_files = _walk_files(repo_path, (".md",))
         self.logger.info("Found %d markdown files", len(markdown_files))
         return markdown_files
 
@@ -303,13 +378,9 @@ class IngestionPipeline:
             self.source_config.supported_formats,
         )
 
-        all_files: list[Path] = []
-        for ext in self.source_config.supported_formats:
-            # Remove leading dot if present for glob pattern
-            pattern = f"*{ext}" if ext.startswith(".") else f"*.{ext}"
-            files = list(source_path.rglob(pattern))
-            all_files.extend(files)
-            self.logger.debug("Found %d %s files", len(files), ext)
+        # Normalize to leading-dot suffixes and match all formats in a single walk
+        suffixes = tuple(ext if ext.startswith(".") else f".{ext}" for ext in self.source_config.supported_formats)
+        all_files = _walk_files(source_path, suffixes)
 
         self.logger.info(
             "Found %d total files for source '%s'",
@@ -482,7 +553,13 @@ class IngestionPipeline:
         files: list[Path],
         progress_callback: Callable[[int, int, str], None] | None = None,
     ) -> tuple[int, int]:
-        """Process a batch of markdown files.
+        """Process a batch of files.
+
+        Files are parsed and chunked on a thread pool, up to
+        DEFAULT_CHUNK_PREFETCH files ahead, while this thread embeds and stores
+        the finished files in their original order. Chunks from consecutive
+        files are grouped until DEFAULT_EMBED_BATCH_SIZE are pending, then
+        embedded and written to the vector store in one call each.
 
         Args:
             files: List of file paths to process
@@ -495,128 +572,220 @@ class IngestionPipeline:
         failed = 0
         total_batch_chunks = 0
 
+        to_chunk: list[tuple[int, Path, str]] = []
         for i, file_path in enumerate(files):
             # Skip if already processed
             file_str = str(file_path.relative_to(self.effective_repo_path))
             if file_str in self.state.processed_files:
                 self.logger.debug("Skipping already processed file: %s", file_str)
                 successful += 1
-                continue
+            else:
+                to_chunk.append((i, file_path, file_str))
+
+        pending: list[tuple[int, str, list[Chunk] | Exception]] = []
+        pending_chunks = 0
+        for i, file_str, result in self._iter_chunked_files(to_chunk):
+            pending.append((i, file_str, result))
+            if isinstance(result, list):
+                pending_chunks += len(result)
+            if pending_chunks >= DEFAULT_EMBED_BATCH_SIZE or i == to_chunk[-1][0]:
+                group_successful, group_failed, group_chunks = self._store_pending_files(
+                    pending, len(files), progress_callback
+                )
+                successful += group_successful
+                failed += group_failed
+                total_batch_chunks += group_chunks
+                pending = []
+                pending_chunks = 0
 
-            try:
-                # Process file into chunks
-                chunks = self._process_file(file_path)
+        self.logger.info(
+            "Batch complete: %d successful, %d failed, %d chunks added",
+            successful,
+            failed,
+            total_batch_chunks,
+        )
+        return successful, failed
 
-                if not chunks:
-                    self.logger.warning("No chunks generated from %s", file_str)
-                    self.state.processed_files.append(file_str)
-                    successful += 1
-                    continue
+    def _iter_chunked_files(
+        self, files: list[tuple[int, Path, str]]
+    ) -> Iterator[tuple[int, str, list[Chunk] | Exception]]:
+        """Chunk files on a thread pool and yield the results in input order.
 
-                # Extract content and metadata for vector store
-                documents = [chunk.content for chunk in chunks]
-                metadatas = [chunk.metadata.to_dict() for chunk in chunks]
-                ids = [chunk.metadata.chunk_id for chunk in chunks]
+        At most DEFAULT_CHUNK_PREFETCH files are in flight, which bounds the
+        chunks held in memory ahead of the embedding step.
 
-                # Sanitize metadatas to ensure LanceDB compatibility
-                # Convert any list values to comma-separated strings
-                def sanitize_metadata(meta: dict[str, Any]) -> dict[str, Any]:
-                    """Ensure all metadata values are LanceDB-compatible (str, int, float, bool)."""
-                    sanitized: dict[str, Any] = {}
-                    for key, value in meta.items():
-                        if isinstance(value, list):
-                            sanitized[key] = ", ".join(str(v) for v in value)
-                        elif isinstance(value, (str, int, float, bool)):
-                            sanitized[key] = value
-                        elif value is None:
-                            sanitized[key] = ""
-                        else:
-                            sanitized[key] = str(value)
-                    return sanitized
-
-                metadatas = [sanitize_metadata(m) for m in metadatas]
-
-                # Generate embeddings and store
-                embeddings = self.embedder.embed(documents, show_progress=False)
-                self.vector_store.add_documents(
-                    documents=documents,
-                    metadatas=metadatas,
-                    ids=ids,
-                    embeddings=embeddings,
-                )
+        Args:
+            files: (batch index, path, repo-relative path) for each file to chunk
+
+        Yields:
+            (batch index, repo-relative path, chunks or the exception raised)
+        """
+        # Build the shared parser map here rather than lazily on a worker thread
+        ParserFactory.get_parser(Path())
+        in_flight: deque[tuple[int, str, Future[list[Chunk]]]] = deque()
+        with ThreadPoolExecutor(max_workers=DEFAULT_CHUNK_WORKERS) as executor:
+            for i, file_path, file_str in files:
+                in_flight.append((i, file_str, executor.submit(self._process_file, file_path)))
+                if len(in_flight) >= DEFAULT_CHUNK_PREFETCH:
+                    yield self._chunk_result(*in_flight.popleft())
+            while in_flight:
+                yield self._chunk_result(*in_flight.popleft())
+
+    @staticmethod
+    def _chunk_result(
+        index: int, file_str: str, future: Future[list[Chunk]]
+    ) -> tuple[int, str, list[Chunk] | Exception]:
+        """Unwrap a chunking future into its chunks or the exception it raised."""
+        error = future.exception()
+        if error is None:
+            return index, file_str, future.result()
+        if isinstance(error, Exception):
+            return index, file_str, error
+        raise error
+
+    def _store_pending_files(
+        self,
+        pending: list[tuple[int, str, list[Chunk] | Exception]],
+        total: int,
+        progress_callback: Callable[[int, int, str], None] | None = None,
+    ) -> tuple[int, int, int]:
+        """Embed and store a group of chunked files, then record each file's outcome.
 
+        The group is written with one embed call and one vector store call. If
+        that fails, each file is retried on its own (see _store_files) so only
+        the files that still fail are recorded as failed.
+
+        Args:
+            pending: (batch index, repo-relative path, chunks or chunking error) in batch order
+            total: Number of files in the whole batch, for progress reporting
+            progress_callback: Optional callback(current, total, status_msg) for progress updates
+
+        Returns:
+            Tuple of (successful_count, failed_count, chunks_added)
+        """
+        errors = {file_str: result for _, file_str, result in pending if isinstance(result, Exception)}
+        errors.update(
+            self._store_files(
+                [(file_str, result) for _, file_str, result in pending if isinstance(result, list) and result]
+            )
+        )
+
+        successful = 0
+        failed = 0
+        chunks_added = 0
+        for i, file_str, result in pending:
+            error = errors.get(file_str)
+            if error is not None:
+                self.logger.error("Failed to process file %s", file_str, exc_info=error)
+                self.state.failed_files[file_str] = str(error)
+                failed += 1
+                status_msg = f"Failed to process {file_str}"
+            else:
+                chunks = result if isinstance(result, list) else []
+                if not chunks:
+                    self.logger.warning("No chunks generated from %s", file_str)
                 # Update state
-                self.state.processed_files.append(file_str)
+                self.state.processed_files.add(file_str)
                 self.state.total_chunks += len(chunks)
                 self.state.total_documents += len(chunks)
-                total_batch_chunks += len(chunks)
+                chunks_added += len(chunks)
                 successful += 1
+                status_msg = f"Processed {file_str} ({len(chunks)} chunks)"
 
-                if progress_callback:
-                    progress_callback(
-                        i + 1,
-                        len(files),
-                        f"Processed {file_str} ({len(chunks)} chunks)",
-                    )
+            if progress_callback:
+                progress_callback(i + 1, total, status_msg)
 
-            except Exception as e:
-                self.logger.exception("Failed to process file %s", file_str)
-                self.state.failed_files[file_str] = str(e)
-                failed += 1
+        return successful, failed, chunks_added
 
-                if progress_callback:
-                    progress_callback(
-                        i + 1,
-                        len(files),
-                        f"Failed to process {file_str}",
-                    )
+    def _store_files(self, files: list[tuple[str, list[Chunk]]]) -> dict[str, Exception]:
+        """Store the chunks of several files, falling back to one file at a time.
 
-        self.logger.info(
-            "Batch complete: %d successful, %d failed, %d chunks added",
-            successful,
-            failed,
-            total_batch_chunks,
+        Args:
+            files: (repo-relative path, chunks) for each file to store
+
+        Returns:
+            Exception raised for each file that could not be stored
+        """
+        if not files:
+            return {}
+        try:
+            self._store_chunks([chunk for _, chunks in files for chunk in chunks])
+        except Exception as e:  # noqa: BLE001
+            if len(files) == 1:
+                return {files[0][0]: e}
+            self.logger.warning("Storing %d files together failed, retrying one at a time", len(files))
+        else:
+            return {}
+
+        errors: dict[str, Exception] = {}
+        for file_str, chunks in files:
+            try:
+                self._store_chunks(chunks)
+            except Exception as e:  # noqa: BLE001
+                errors[file_str] = e
+        return errors
+
+    def _store_chunks(self, chunks: list[Chunk]) -> None:
+        """Embed chunks and add them to the vector store in one write.
+
+        Args:
+            chunks: Chunks to store
+
+        Raises:
+            Exception: If embedding or the vector store write fails
+        """
+        # Extract content and metadata for vector store
+        documents = [chunk.content for chunk in chunks]
+        metadatas = [_sanitize_metadata(chunk.metadata.to_dict()) for chunk in chunks]
+        ids = [chunk.metadata.chunk_id for chunk in chunks]
+
+        # Generate embeddings and store
+        embeddings = self.embedder.embed(documents, show_progress=False)
+        self.vector_store.add_documents(
+            documents=documents,
+            metadatas=metadatas,
+            ids=ids,
+            embeddings=embeddings,
         )
-        return successful, failed
 
     def _handle_deleted_files(self, deleted_files: list[str]) -> tuple[int, int]:
         """Handle deleted files by removing their documents from vector store.
 
+        All files are removed in one vector store call, so if it fails every
+        file in the list is recorded as failed.
+
         Args:
             deleted_files: List of deleted file paths (relative to repo)
 
         Returns:
             Tuple of (successful_count, failed_count)
         """
-        successful = 0
-        failed = 0
+        try:
+            # Delete the documents of every removed file in one call
+            deleted_counts = self.vector_store.delete_by_file_paths(deleted_files)
+        except Exception as e:
+            self.logger.exception("Failed to handle %d deleted files", len(deleted_files))
+            for file_path in deleted_files:
+                self.state.failed_files[file_path] = f"Delete failed: {e}"
+            return 0, len(deleted_files)
 
         for file_path in deleted_files:
-            try:
-                # Delete all documents associated with this file
-                deleted_count = self.vector_store.delete_by_file_path(file_path)
+            deleted_count = deleted_counts.get(file_path, 0)
 
-                # Remove from processed files list
-                if file_path in self.state.processed_files:
-                    self.state.processed_files.remove(file_path)
+            # Remove from processed files
+            self.state.processed_files.discard(file_path)
 
-                # Update statistics, ensuring counters do not go negative
-                self.state.total_chunks = max(0, self.state.total_chunks - deleted_count)
-                self.state.total_documents = max(0, self.state.total_documents - deleted_count)
+            # Update statistics, ensuring counters do not go negative
+            self.state.total_chunks = max(0, self.state.total_chunks - deleted_count)
+            self.state.total_documents = max(0, self.state.total_documents - deleted_count)
 
-                self.logger.info(
-                    "Deleted %d documents for removed file: %s",
-                    deleted_count,
-                    file_path,
-                )
-                successful += 1
-
-            except Exception as e:
-                self.logger.exception("Failed to handle deleted file %s", file_path)
-                self.state.failed_files[file_path] = f"Delete failed: {e}"
-                failed += 1
+            self.logger.info(
+                "Deleted %d documents for removed file: %s",
+                deleted_count,
+                file_path,
+            )
 
-        return successful, failed
+        return len(deleted_files), 0
 
     def _handle_modified_files(
         self,
@@ -654,8 +823,7 @@ class IngestionPipeline:
                 if not chunks:
                     self.logger.warning("No chunks generated from modified file %s", file_str)
                     # Still mark as successful since we deleted old content
-                    if file_str not in self.state.processed_files:
-                        self.state.processed_files.append(file_str)
+                    self.state.processed_files.add(file_str)
                     successful += 1
                     # Update statistics to account for deleted chunks when no new chunks are added
                     self.state.total_chunks -= deleted_count
@@ -676,8 +844,7 @@ class IngestionPipeline:
                 )
 
                 # Update state
-                if file_str not in self.state.processed_files:
-                    self.state.processed_files.append(file_str)
+                self.state.processed_files.add(file_str)
 
                 # Update chunk counts (net change)
                 self.state.total_chunks += len(chunks) - deleted_count
@@ -713,6 +880,63 @@ class IngestionPipeline:
         )
         return successful, failed
 
+    def _resolve_files_to_process(self, repo_path: Path, incremental: bool) -> tuple[list[Path], list[Path], list[str]]:
+        """Work out which files a run should add, update and delete.
+
+        Args:
+            repo_path: Root of the synced repository
+            incremental: If True, only pick up files changed since the last run
+
+        Returns:
+            Tuple of (added files, modified files, deleted relative paths)
+        """
+        all_files = self._discover_markdown_files(repo_path)
+
+        # For GCS mode: use file-based incremental (skip already processed files)
+        # For git mode: use commit-based incremental (diff against last commit)
+        use_git_incremental = (
+            incremental and self.state.last_commit and self.state.last_commit != "gcs-sync" and not self.gcs_repo_sync
+        )
+
+        if use_git_incremental and self.state.last_commit:
+            # Git-based incremental: use commit diff
+            file_changes = self.repo_manager.get_file_changes(self.state.last_commit)
+            if file_changes is None:
+                self.logger.warning("Failed to get file changes, processing all files")
+                return all_files, [], []
+
+            # Filter for markdown files only
+            added_md = [f for f in file_changes["added"] if f.endswith(".md")]
+            modified_md = [f for f in file_changes["modified"] if f.endswith(".md")]
+            deleted_files = [f for f in file_changes["deleted"] if f.endswith(".md")]
+
+            # Convert to Path objects for added and modified
+            added_files = [repo_path / f for f in added_md if (repo_path / f).exists()]
+            modified_files = [repo_path / f for f in modified_md if (repo_path / f).exists()]
+
+            self.logger.info(
+                "Git incremental mode: %d added, %d modified, %d deleted",
+                len(added_files),
+                len(modified_files),
+                len(deleted_files),
+            )
+            return added_files, modified_files, deleted_files
+
+        if incremental and self.state.processed_files:
+            # File-based incremental: skip already processed files
+            # This works for both GCS mode and when git diff fails
+            processed = self.state.processed_files
+            added_files = [f for f in all_files if str(f.relative_to(repo_path)) not in processed]
+            self.logger.info(
+                "File-based incremental: %d new files to process (%d already done)",
+                len(added_files),
+                len(processed),
+            )
+            return added_files, [], []
+
+        self.logger.info("Full mode: processing all %d files", len(all_files))
+        return all_files, [], []
+
     def run(  # noqa: PLR0912, PLR0915
         self,
         force_reclone: bool = False,
@@ -773,68 +997,10 @@ class IngestionPipeline:
             if progress_callback:
                 progress_callback(10, 100, "Discovering markdown files...")
 
-            all_files = self._discover_markdown_files(repo_path)
-
-            # Initialize file lists
-            files_to_process: list[Path] = []
-            deleted_files: list[str] = []
-            added_files_list: list[Path] = []
-            modified_files_list: list[Path] = []
-
-            # Filter files for incremental processing
-            # For GCS mode: use file-based incremental (skip already processed files)
-            # For git mode: use commit-based incremental (diff against last commit)
-            use_git_incremental = (
-                incremental
-                and self.state.last_commit
-                and self.state.last_commit != "gcs-sync"
-                and not self.gcs_repo_sync
+            added_files_list, modified_files_list, deleted_files = self._resolve_files_to_process(
+                repo_path, incremental
             )
-
-            if use_git_incremental and self.state.last_commit:
-                # Git-based incremental: use commit diff
-                file_changes = self.repo_manager.get_file_changes(self.state.last_commit)
-                if file_changes is not None:
-                    # Filter for markdown files only
-                    added_md = [f for f in file_changes["added"] if f.endswith(".md")]
-                    modified_md = [f for f in file_changes["modified"] if f.endswith(".md")]
-                    deleted_md = [f for f in file_changes["deleted"] if f.endswith(".md")]
-
-                    # Convert to Path objects for added and modified
-                    added_files_list = [repo_path / f for f in added_md if (repo_path / f).exists()]
-                    modified_files_list = [repo_path / f for f in modified_md if (repo_path / f).exists()]
-
-                    files_to_process = added_files_list + modified_files_list
-                    deleted_files = deleted_md
-
-                    self.logger.info(
-                        "Git incremental mode: %d added, %d modified, %d deleted",
-                        len(added_files_list),
-                        len(modified_files_list),
-                        len(deleted_files),
-                    )
-                else:
-                    self.logger.warning("Failed to get file changes, processing all files")
-                    files_to_process = all_files
-                    added_files_list = all_files
-                    modified_files_list = []
-            elif incremental and self.state.processed_files:
-                # File-based incremental: skip already processed files
-                # This works for both GCS mode and when git diff fails
-                processed_set = set(self.state.processed_files)
-                added_files_list = [f for f in all_files if str(f.relative_to(repo_path)) not in processed_set]
-                files_to_process = added_files_list
-                modified_files_list = []
-                self.logger.info(
-                    "File-based incremental: %d new files to process (%d already done)",
-                    len(added_files_list),
-                    len(processed_set),
-                )
-            else:
-                files_to_process = all_files
-                added_files_list = all_files
-                modified_files_list = []
-                self.logger.info("Full mode: processing all %d files", len(all_files))
+            files_to_process = added_files_list + modified_files_list
 
             # Step 3: Handle file changes incrementally
             if progress_callback:
@@ -1024,4 +1190,6 @@ class IngestionPipeline:
             "repo_exists": self.repo_manager.clone_path.exists(),
             "vector_store_count": self.vector_store.get_document_count(),
             "vector_store_collection": self.vector_store.collection_name,
+            "embed_cache_hits": self.embedder.hits if isinstance(self.embedder, CachedEmbedder) else 0,
+            "embed_cache_misses": self.embedder.misses if isinstance(self.embedder, CachedEmbedder) else 0,
         }
@@ -3,6 +3,7 @@
 import json
 import logging
 from pathlib import Path
+import re
 import shutil
 import time
 from typing import Any, ClassVar
@@ -90,6 +91,15 @@ DEFAULT_REPO_URL = "https://gitlab.com/gitlab-com/content-sites/handbook.git"
 DEFAULT_CLONE_PATH = Path.home() / ".thoth" / "handbook"
 METADATA_FILE = "repo_metadata.json"
 
+# One line of `git diff --name-status`: status letter, optional score, then one
+# path (two for renames and copies). Any other line with a tab falls through to
+# the last group, which holds everything after its first tab; lines without a
+# tab do not match at all.
+DIFF_LINE_PATTERN = re.compile(
+    r"^(?:([A-Z])\d*\t([^\t\n]+)(?:\t([^\t\n]+))?|[^\t\n]*\t([^\n]*))$",
+    re.MULTILINE,
+)
+
 # Error messages as constants
 MSG_REPO_EXISTS = "Repository already exists at {path}. Use force=True to re-clone."
 MSG_CLONE_FAILED = "Failed to clone repository after {attempts} attempts"
@@ -414,29 +424,29 @@ class HandbookRepoManager:
             modified_files: list[str] = []
             deleted_files: list[str] = []
 
-            for line in diff_output.strip().split("\n"):
-                if not line:
-                    continue
-
-                parts = line.split("\t", 1)
-                if len(parts) != 2:
-                    continue
-
-                status = parts[0]
-                file_path = parts[1]
-
-                # Handle different status codes
-                if status.startswith("A"):
+            for status, file_path, new_path, unrecognized in DIFF_LINE_PATTERN.findall(diff_output):
+                if not status:
+                    # Tab-separated but not a recognized status line (e.g. extra
+                    # fields); record it as modified so it is still re-ingested
+                    if unrecognized:
+                        self.logger.warning("Unrecognized git diff line, treating as modified: %r", unrecognized)
+                        modified_files.append(unrecognized)
+                elif status == "A":
                     added_files.append(file_path)
-                elif status.startswith("M"):
+                elif status == "M":
                     modified_files.append(file_path)
-                elif status.startswith("D"):
+                elif status == "D":
                     deleted_files.append(file_path)
-                elif status.startswith(("R", "C")):  # Renamed or Copied
-                    self._handle_rename_or_copy(status, file_path, deleted_files, added_files, modified_files)
+                elif status == "R" and new_path:
+                    # Renamed: treat as delete old + add new
+                    deleted_files.append(file_path)
+                    added_files.append(new_path)
+                elif status == "C" and new_path:
+                    # Copied: treat as add new, keep source intact
+                    added_files.append(new_path)
                 else:
-                    # Unknown status, treat as modified
-                    modified_files.append(file_path)
+                    # Unknown status or malformed rename/copy, treat as modified
+                    modified_files.append(f"{file_path}\t{new_path}" if new_path else file_path)
 
             self.logger.info(
                 "Found %d added, %d modified, %d deleted files since commit %s",
@@ -463,40 +473,3 @@ class HandbookRepoManager:
         except InvalidGitRepositoryError:
             self.logger.exception(MSG_DIFF_FAILED)
             return None
-
-    def _handle_rename_or_copy(
-        self,
-        status: str,
-        file_path: str,
-        deleted_files: list[str],
-        added_files: list[str],
-        modified_files: list[str],
-    ) -> None:
-        """Handle renamed or copied files.
-
-        Args:
-            status: Git status code (R or C)
-            file_path: File path(s) from git diff
-            deleted_files: List to append deleted file paths
-            added_files: List to append added file paths
-            modified_files: List to append modified file paths (fallback)
-        """
-        if status.startswith("R"):  # Renamed
-            # Renamed files have format: R<score>\toldpath\tnewpath
-            # Treat as delete old + add new
-            if "\t" in file_path:
-                old_path, new_path = file_path.split("\t", 1)
-                deleted_files.append(old_path)
-                added_files.append(new_path)
-            else:
-                # Fallback: treat as modified
-                modified_files.append(file_path)
-        elif status.startswith("C"):  # Copied
-            # Copied files have format: C<score>\tsourcepath\tnewpath
-            # Treat as add new, keep source intact
-            if "\t" in file_path:
-                _source_path, new_path = file_path.split("\t", 1)
-                added_files.append(new_path)
-            else:
-                # Fallback: treat as modified to avoid malformed added paths
-                modified_files.append(file_path)
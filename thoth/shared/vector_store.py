@@ -344,6 +344,33 @@ class VectorStore:
         self.logger.info("Deleted %d documents for file path: %s", count, file_path)
         return int(count)
 
+    def delete_by_file_paths(self, file_paths: list[str]) -> dict[str, int]:
+        """Delete all documents for several file paths with a single table delete.
+
+        Args:
+            file_paths: File paths to match.
+
+        Returns:
+            Mapping of each file path to the number of documents deleted.
+        """
+        counts = dict.fromkeys(file_paths, 0)
+        if not counts:
+            return counts
+        tbl = self.table.to_arrow()
+        if "file_path" not in tbl.column_names:
+            return counts
+        for path in tbl.column("file_path").to_pylist():
+            if path in counts:
+                counts[path] += 1
+        matched = [path for path, count in counts.items() if count]
+        if not matched:
+            self.logger.info("No documents found for %d file paths", len(counts))
+            return counts
+        path_list = ", ".join("'{}'".format(path.replace("'", "''")) for path in matched)
+        self.table.delete(f"file_path IN ({path_list})")
+        self.logger.info("Deleted %d documents for %d file paths", sum(counts.values()), len(matched))
+        return counts
+
     def get_document_count(self) -> int:
         """Return the number of documents (rows) in the table.
 